@@ -1,11 +1,21 @@
+import asyncio
+import types
+
 import discord
+from aiohttp import web
 from discord import DiscordException, Embed
 from discord.ext import commands
 from pydis_core import BotBase
 from pydis_core.utils import scheduling
+from pydis_core.utils._extensions import walk_extensions
 from pydis_core.utils.logging import get_logger
 
 from bot import constants, exts
+from bot.utils import resources
+from bot.utils.command_metrics import CommandMetrics, InstrumentedContext, start_metrics_server
+from bot.utils.extension_loader import ExtensionLoader
+from bot.utils.message_router import MessageRouter
+from bot.utils.seasonal_extensions import SeasonalExtensions
 
 log = get_logger(__name__)
 
@@ -23,6 +33,18 @@ class Bot(BotBase):
 
     name = constants.Client.name
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.message_router = MessageRouter(self)
+        self.add_listener(self.message_router.on_message)
+        self.seasonal_extensions = SeasonalExtensions(self)
+
+        self.command_metrics = CommandMetrics()
+        self.add_listener(self.command_metrics.on_command_completion)
+        self.add_listener(self.command_metrics.on_command_error)
+        self._metrics_runner: web.AppRunner | None = None
+
     @property
     def member(self) -> discord.Member | None:
         """Retrieves the guild member object for the bot."""
@@ -31,6 +53,22 @@ class Bot(BotBase):
             return None
         return guild.me
 
+    async def get_context(
+        self,
+        origin: discord.Message | discord.Interaction,
+        /,
+        *,
+        cls: type[commands.Context] = InstrumentedContext,
+    ) -> commands.Context:
+        """Get the context for `origin`, which records when its command first responds by default."""
+        return await super().get_context(origin, cls=cls)
+
+    async def invoke(self, ctx: commands.Context) -> None:
+        """Invoke the command of `ctx`, recording when it started for the command metrics."""
+        # Started here rather than in a listener, which would only run after the checks and argument conversion
+        self.command_metrics.start(ctx)
+        await super().invoke(ctx)
+
     async def on_command_error(self, context: commands.Context, exception: DiscordException) -> None:
         """Check command errors for UserInputError and reset the cooldown if thrown."""
         if isinstance(exception, commands.UserInputError):
@@ -38,6 +76,23 @@ class Bot(BotBase):
         else:
             await super().on_command_error(context, exception)
 
+    async def add_cog(self, cog: commands.Cog) -> None:
+        """Add the given `cog` to the bot, and route messages to its message handlers."""
+        await super().add_cog(cog)
+        self.message_router.register_cog(cog)
+
+    async def remove_cog(self, name: str, **kwargs) -> commands.Cog | None:
+        """Remove the cog named `name` from the bot, along with its message handlers and any deferred `cog_load`."""
+        # Stop a deferred cog_load from carrying on with a removed cog, unless it's the one removing it
+        task: asyncio.Task | None = getattr(self.get_cog(name), "cog_load_task", None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+        cog = await super().remove_cog(name, **kwargs)
+        if cog is not None:
+            self.message_router.unregister_cog(cog)
+        return cog
+
     async def log_to_dev_log(self, title: str, details: str | None = None, *, icon: str | None = None) -> None:
         """Send an embed message to the dev-log channel."""
         devlog = self.get_channel(constants.Channels.devlog)
@@ -54,10 +109,32 @@ class Bot(BotBase):
         """Default async initialisation method for discord.py."""
         await super().setup_hook()
 
+        if constants.Metrics.port is not None:
+            self._metrics_runner = await start_metrics_server(
+                self.command_metrics, constants.Metrics.host, constants.Metrics.port
+            )
+
         # This is not awaited to avoid a deadlock with any cogs that have
         # wait_until_guild_available in their cog_load method.
         scheduling.create_task(self.load_extensions(exts))
 
+    async def _load_extensions(self, module: types.ModuleType) -> None:
+        """Load all the extensions within the given module concurrently, and save them to `self.all_extensions`."""
+        log.info(f"Waiting for guild {self.guild_id} to be available before loading extensions.")
+        await self.wait_until_guild_available()
+
+        log.info("Loading extensions...")
+        self.all_extensions = walk_extensions(module)
+        await ExtensionLoader(self).load(self.all_extensions)
+        resources.log_report()
+        scheduling.create_task(self.seasonal_extensions.run())
+
+    async def close(self) -> None:
+        """Stop serving the command metrics, then close the bot."""
+        if self._metrics_runner is not None:
+            await self._metrics_runner.cleanup()
+        await super().close()
+
     async def invoke_help_command(self, ctx: commands.Context) -> None:
         """Invoke the help command or default help command if help extensions is not loaded."""
         if "bot.exts.core.help" in ctx.bot.extensions:
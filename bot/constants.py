@@ -21,6 +21,7 @@ __all__ = (
     "Emojis",
     "Icons",
     "Logging",
+    "Metrics",
     "Month",
     "Reddit",
     "Redis",
@@ -100,6 +101,15 @@ class _Logging(EnvConfig, env_prefix="logging_"):
 Logging = _Logging()
 
 
+class _Metrics(EnvConfig, env_prefix="metrics_"):
+    # Serve the command metrics in the Prometheus text format on this port, if it's set
+    port: int | None = None
+    host: str = "127.0.0.1"
+
+
+Metrics = _Metrics()
+
+
 class Colours:
     """Lookups for commonly used colours."""
 
@@ -1,11 +1,9 @@
 import asyncio
-import json
 import math
 import string
 import unicodedata
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
-from pathlib import Path
 from typing import TypeVar
 
 import discord
@@ -16,6 +14,7 @@ from bot.bot import Bot
 from bot.constants import Colours, Emojis
 from bot.exts.avatar_modification._effects import PfpEffects
 from bot.utils.halloween import spookifications
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
@@ -27,7 +26,7 @@ MAX_SQUARES = 10_000
 
 T = TypeVar("T")
 
-GENDER_OPTIONS = json.loads(Path("bot/resources/holidays/pride/gender_options.json").read_text("utf8"))
+GENDER_OPTIONS = Resource("bot/resources/holidays/pride/gender_options.json")
 
 
 async def in_executor(func: Callable[..., T], *args) -> T:
@@ -259,7 +258,7 @@ class AvatarModify(commands.Cog):
         """
         option = option.lower()
         pixels = max(0, min(512, pixels))
-        flag = GENDER_OPTIONS.get(option)
+        flag = GENDER_OPTIONS().get(option)
         if flag is None:
             await ctx.send("I don't have that flag!")
             return
@@ -275,7 +274,7 @@ class AvatarModify(commands.Cog):
     @prideavatar.command()
     async def flags(self, ctx: commands.Context) -> None:
         """Lists the flags that can be used with the prideavatar command."""
-        choices = sorted(set(GENDER_OPTIONS.values()))
+        choices = sorted(set(GENDER_OPTIONS().values()))
         options = "• " + "\n• ".join(choices)
         embed = discord.Embed(
             title="I have the following flags:",
@@ -9,6 +9,7 @@ from sentry_sdk import push_scope
 
 from bot.bot import Bot
 from bot.constants import Channels, Colours, ERROR_REPLIES, NEGATIVE_REPLIES
+from bot.utils import human_months
 from bot.utils.commands import get_command_suggestions
 from bot.utils.decorators import InChannelCheckFailure, InMonthCheckFailure
 from bot.utils.exceptions import APIError, MovedCommandError, UserNotPlayingError
@@ -66,8 +67,12 @@ class CommandErrorHandler(commands.Cog):
         )
 
         if isinstance(error, commands.CommandNotFound):
+            # Seasonal extensions are unloaded out of season, but their commands shouldn't look like typos
+            if months := self.bot.seasonal_extensions.dormant_command_months(ctx.invoked_with):
+                error = InMonthCheckFailure(f"Command can only be used in {human_months(months)}")
+                await ctx.send(embed=self.error_embed(str(error), NEGATIVE_REPLIES), delete_after=7.5)
             # Ignore messages that start with "..", as they were likely not meant to be commands
-            if not ctx.invoked_with.startswith("."):
+            elif not ctx.invoked_with.startswith("."):
                 await self.send_command_suggestion(ctx, ctx.invoked_with)
             return
 
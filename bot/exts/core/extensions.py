@@ -81,14 +81,18 @@ class Extensions(commands.Cog):
         r"""
         Load extensions given their fully qualified or unqualified names.
 
-        If '\*' or '\*\*' is given as the name, all unloaded extensions will be loaded.
+        If '\*' or '\*\*' is given as the name, all unloaded extensions will be loaded, except seasonal extensions
+        which are out of season.
         """
         if not extensions:
             await self.bot.invoke_help_command(ctx)
             return
 
         if "*" in extensions or "**" in extensions:
-            extensions = set(self.bot.all_extensions) - set(self.bot.extensions.keys())
+            extensions = {
+                extension for extension in self.bot.all_extensions
+                if extension not in self.bot.extensions and self.bot.seasonal_extensions.in_season(extension)
+            }
 
         msg = await self.batch_manage(Action.LOAD, *extensions)
         await ctx.send(msg)
@@ -124,14 +128,18 @@ class Extensions(commands.Cog):
         If an extension fails to be reloaded, it will be rolled-back to the prior working state.
 
         If '\*' is given as the name, all currently loaded extensions will be reloaded.
-        If '\*\*' is given as the name, all extensions, including unloaded ones, will be reloaded.
+        If '\*\*' is given as the name, all extensions, including unloaded ones, will be reloaded,
+        except seasonal extensions which are out of season.
         """
         if not extensions:
             await self.bot.invoke_help_command(ctx)
             return
 
         if "**" in extensions:
-            extensions = self.bot.all_extensions
+            extensions = [
+                extension for extension in self.bot.all_extensions
+                if extension in self.bot.extensions or self.bot.seasonal_extensions.in_season(extension)
+            ]
         elif "*" in extensions:
             extensions = set(self.bot.extensions.keys()) | set(extensions)
             extensions.remove("*")
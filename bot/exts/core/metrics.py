@@ -0,0 +1,97 @@
+from discord import Colour, Embed
+from discord.ext import commands
+from discord.ext.commands import Context
+
+from bot.bot import Bot
+from bot.constants import MODERATION_ROLES, Roles
+from bot.utils.checks import with_role_check
+from bot.utils.command_metrics import CommandStats, Histogram
+from bot.utils.pagination import LinePaginator
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.0f}ms"
+
+
+def _summary(histogram: Histogram) -> str:
+    """Summarise the quantiles of a histogram."""
+    if not histogram.count:
+        return "No data"
+    return (
+        f"p50 {_ms(histogram.quantile(0.5))}, p90 {_ms(histogram.quantile(0.9))}, "
+        f"p99 {_ms(histogram.quantile(0.99))}, max {_ms(histogram.max)}"
+    )
+
+
+class Metrics(commands.Cog):
+    """Latency, error and concurrency metrics of the commands invoked since the bot started."""
+
+    def __init__(self, bot: Bot):
+        self.bot = bot
+
+    @commands.group(name="metrics", aliases=("cmdstats",), invoke_without_command=True)
+    async def metrics(self, ctx: Context, *, command_name: str | None = None) -> None:
+        """
+        Show the metrics of every command that was invoked, or the details of a single command.
+
+        Latencies are estimated from histograms, so they're only as precise as the buckets they fall into.
+        The timings of the message handlers are shown by the `handlers` subcommand instead.
+        """
+        if command_name is not None:
+            await self.send_command_metrics(ctx, command_name)
+            return
+
+        metrics = sorted(
+            self.bot.command_metrics.commands.items(), key=lambda item: item[1].latency.count, reverse=True
+        )
+        lines = [
+            f"`{name}`: {stats.latency.count} calls, {stats.errors.total()} errors, "
+            f"p50 {_ms(stats.latency.quantile(0.5))}, p99 {_ms(stats.latency.quantile(0.99))}"
+            for name, stats in metrics
+        ]
+        embed = Embed(title="Command Metrics", colour=Colour.og_blurple())
+        await LinePaginator.paginate(lines, ctx, embed, max_lines=15, empty=False)
+
+    @metrics.command(name="handlers")
+    async def handler_metrics(self, ctx: Context) -> None:
+        """Show the number of calls and the timings of every message handler, slowest in total first."""
+        handlers = sorted(
+            self.bot.message_router.handlers, key=lambda handler: handler.stats.total_time, reverse=True
+        )
+        lines = [
+            f"`{handler.name}`: {handler.stats.calls} calls, {handler.stats.failures} failures, "
+            f"average {_ms(handler.stats.average_time)}, max {_ms(handler.stats.max_time)}"
+            for handler in handlers
+        ]
+        embed = Embed(title="Message Handler Metrics", colour=Colour.og_blurple())
+        await LinePaginator.paginate(lines, ctx, embed, max_lines=15, empty=False)
+
+    async def send_command_metrics(self, ctx: Context, command_name: str) -> None:
+        """Send the details of the metrics of the command named `command_name`."""
+        # Resolve aliases, but unloaded commands can still be looked up by their qualified name
+        if command := self.bot.get_command(command_name):
+            command_name = command.qualified_name
+
+        stats: CommandStats | None = self.bot.command_metrics.commands.get(command_name)
+        if stats is None:
+            await ctx.send(f"`{command_name}` wasn't invoked since the bot started.")
+            return
+
+        embed = Embed(title=f"Metrics of {command_name}", colour=Colour.og_blurple())
+        embed.add_field(name="Invocations", value=str(stats.latency.count))
+        embed.add_field(name="In progress", value=f"{stats.in_progress} (peak {stats.max_in_progress})")
+        embed.add_field(name="Latency", value=_summary(stats.latency), inline=False)
+        embed.add_field(name="First response", value=_summary(stats.first_response), inline=False)
+        errors = "\n".join(f"{error}: {count}" for error, count in stats.errors.most_common()) or "None"
+        embed.add_field(name="Errors", value=errors, inline=False)
+        await ctx.send(embed=embed)
+
+    # This cannot be static (must have a __func__ attribute).
+    def cog_check(self, ctx: Context) -> bool:
+        """Only allow moderators and core developers to invoke the commands in this cog."""
+        return with_role_check(ctx, *MODERATION_ROLES, Roles.core_developers)
+
+
+async def setup(bot: Bot) -> None:
+    """Load the Metrics cog."""
+    await bot.add_cog(Metrics(bot))
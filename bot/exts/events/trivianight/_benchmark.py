@@ -0,0 +1,94 @@
+"""
+Benchmark a game of trivia night against a synthetic load of participants.
+
+Run it with `python -m bot.exts.events.trivianight._benchmark [participants]`, it defaults to 5,000 participants.
+"""
+
+import asyncio
+import contextlib
+import random
+import sys
+import time
+from string import ascii_uppercase
+
+from pydis_core.utils.logging import get_logger
+
+from ._game import AlreadyUpdatedError, QuestionData, TriviaNightGame
+from ._questions import QuestionView
+from ._scoreboard import Scoreboard
+
+log = get_logger(__name__)
+
+QUESTIONS = 10
+DEFAULT_PARTICIPANTS = 5_000
+# The share of participants changing their guess once, and the share trying to change it a second time
+CHANGE_CHANCE = 0.2
+SECOND_CHANGE_CHANCE = 0.05
+
+
+def _make_questions(amount: int) -> list[QuestionData]:
+    return [
+        {
+            "number": number,
+            "description": f"Synthetic question {number}",
+            "answers": [f"Answer {letter}" for letter in ascii_uppercase[:4]],
+            "correct": f"Answer {random.choice(ascii_uppercase[:4])}",
+            "points": None,
+            "time": None,
+        }
+        for number in range(1, amount + 1)
+    ]
+
+
+def _report(name: str, elapsed: float, operations: int) -> None:
+    log.info(f"{name:<24} {elapsed * 1000:>10.2f} ms total {elapsed / operations * 1_000_000:>10.2f} µs each")
+
+
+async def run(participants: int) -> None:
+    """Play a full game with `participants` synthetic participants, reporting how long each stage takes."""
+    game = TriviaNightGame(_make_questions(QUESTIONS))
+    scoreboard = Scoreboard(bot=None)
+    labels = ascii_uppercase[:4]
+
+    guess_time = end_time = 0
+    guesses = 0
+    for _ in range(QUESTIONS):
+        question = game.next_question()
+        view = QuestionView(question)
+        question.start()
+
+        start = time.perf_counter()
+        for user_id in range(participants):
+            question.guess(user_id, random.choice(labels))
+            guesses += 1
+            if random.random() < CHANGE_CHANCE:
+                question.guess(user_id, random.choice(labels))
+                guesses += 1
+            if random.random() < SECOND_CHANGE_CHANCE:
+                guesses += 1
+                with contextlib.suppress(AlreadyUpdatedError):
+                    question.guess(user_id, random.choice(labels))
+        guess_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        view.end_question(scoreboard)
+        end_time += time.perf_counter() - start
+        game.end_question()
+
+    _report("Guesses", guess_time, guesses)
+    _report("Ending questions", end_time, QUESTIONS)
+
+    start = time.perf_counter()
+    for user_id in range(participants):
+        scoreboard.points.rank(user_id)
+        scoreboard.speed.rank(user_id)
+    _report("Rank lookups", time.perf_counter() - start, participants * 2)
+
+    start = time.perf_counter()
+    scoreboard.points.top(30)
+    scoreboard.speed.top(30)
+    _report("Top 30", time.perf_counter() - start, 2)
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PARTICIPANTS))
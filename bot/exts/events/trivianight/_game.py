@@ -1,4 +1,5 @@
 import time
+from collections import Counter
 from collections.abc import Iterable
 from random import randrange
 from string import ascii_uppercase
@@ -45,7 +46,12 @@ class Question:
     def __init__(self, data: QuestionData):
         self._data = data
         self._guesses: dict[int, UserGuess] = {}
+        # How many of the guesses are for each answer, kept up to date as guesses are made
+        self._answer_counts: Counter[str] = Counter()
         self._started = None
+        self.correct_label = next(
+            (letter for letter, answer in self.answers if answer == self.correct), None
+        )
 
     # These properties are mostly proxies to the underlying data:
 
@@ -93,10 +99,13 @@ class Question:
         if self._started is None:
             raise QuestionClosedError("Question is not open for answers.")
 
-        if self._guesses[user][1] is False:
+        previous = self._guesses[user]
+        if not previous.editable:
             raise AlreadyUpdatedError(f"User({user}) has already updated their guess once.")
 
-        self._guesses[user] = (answer, False, time.perf_counter() - self._started)
+        self._answer_counts[previous.answer] -= 1
+        self._answer_counts[answer] += 1
+        self._guesses[user] = UserGuess(answer, False, time.perf_counter() - self._started)
         return self._guesses[user]
 
     def guess(self, user: int, answer: str) -> UserGuess:
@@ -107,17 +116,19 @@ class Question:
         if self._started is None:
             raise QuestionClosedError("Question is not open for answers.")
 
-        self._guesses[user] = (answer, True, time.perf_counter() - self._started)
+        self._answer_counts[answer] += 1
+        self._guesses[user] = UserGuess(answer, True, time.perf_counter() - self._started)
         return self._guesses[user]
 
-    def stop(self) -> dict[int, UserGuess]:
-        """Stop the question and return the guesses that were made."""
-        guesses = self._guesses
+    def stop(self) -> tuple[dict[int, UserGuess], Counter[str]]:
+        """Stop the question and return the guesses that were made, along with how many were made for each answer."""
+        guesses, answer_counts = self._guesses, self._answer_counts
 
         self._started = None
         self._guesses = {}
+        self._answer_counts = Counter()
 
-        return guesses
+        return guesses, answer_counts
 
 
 class TriviaNightGame:
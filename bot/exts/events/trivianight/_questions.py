@@ -18,6 +18,16 @@ class AnswerButton(Button):
         super().__init__(label=label, style=discord.ButtonStyle.green)
 
         self.question = question
+        self.chose_embed = Embed(
+            title="Confirming that...",
+            description=f"You chose answer {label}.",
+            color=Colours.soft_green
+        )
+        self.changed_embed = Embed(
+            title="Confirming that...",
+            description=f"You changed your answer to answer {label}.",
+            color=Colours.soft_green
+        )
 
     async def callback(self, interaction: Interaction) -> None:
         """
@@ -27,49 +37,21 @@ class AnswerButton(Button):
             - interaction: an instance of discord.Interaction representing the interaction between the user and the
             button.
         """
+        # The replies are built along with the question, as hundreds of guesses can come in at once
         try:
             guess = self.question.guess(interaction.user.id, self.label)
         except AlreadyUpdatedError:
-            await interaction.response.send_message(
-                embed=Embed(
-                    title=choice(NEGATIVE_REPLIES),
-                    description="You've already changed your answer more than once!",
-                    color=Colours.soft_red
-                ),
-                ephemeral=True
-            )
+            await interaction.response.send_message(embed=self.view.already_updated_embed, ephemeral=True)
             return
         except QuestionClosedError:
-            await interaction.response.send_message(
-                embed=Embed(
-                    title=choice(NEGATIVE_REPLIES),
-                    description="The question is no longer accepting guesses!",
-                    color=Colours.soft_red
-                ),
-                ephemeral=True
-            )
+            await interaction.response.send_message(embed=self.view.closed_embed, ephemeral=True)
             return
 
-        if guess[1]:
-            await interaction.response.send_message(
-                embed=Embed(
-                    title="Confirming that...",
-                    description=f"You chose answer {self.label}.",
-                    color=Colours.soft_green
-                ),
-                ephemeral=True
-            )
+        if guess.editable:
+            await interaction.response.send_message(embed=self.chose_embed, ephemeral=True)
         else:
-            # guess[1] is False and they cannot change their answer again. Which
-            # indicates that they changed it this time around.
-            await interaction.response.send_message(
-                embed=Embed(
-                    title="Confirming that...",
-                    description=f"You changed your answer to answer {self.label}.",
-                    color=Colours.soft_green
-                ),
-                ephemeral=True
-            )
+            # The guess can't be changed again, which indicates that they changed it this time around.
+            await interaction.response.send_message(embed=self.changed_embed, ephemeral=True)
 
 
 class QuestionView(View):
@@ -79,6 +61,17 @@ class QuestionView(View):
         super().__init__()
         self.question = question
 
+        self.already_updated_embed = Embed(
+            title=choice(NEGATIVE_REPLIES),
+            description="You've already changed your answer more than once!",
+            color=Colours.soft_red
+        )
+        self.closed_embed = Embed(
+            title=choice(NEGATIVE_REPLIES),
+            description="The question is no longer accepting guesses!",
+            color=Colours.soft_red
+        )
+
         for letter, _ in self.question.answers:
             self.add_item(AnswerButton(letter, self.question))
 
@@ -115,7 +108,7 @@ class QuestionView(View):
         Returns:
             An embed displaying the correct answers and the % of people that chose each answer.
         """
-        guesses = self.question.stop()
+        guesses, answers_chosen = self.question.stop()
 
         labels = ascii_uppercase[:len(self.question.answers)]
 
@@ -125,19 +118,9 @@ class QuestionView(View):
         )
 
         if len(guesses) != 0:
-            answers_chosen = {
-                answer_choice: len(
-                    tuple(filter(lambda x: x[0] == answer_choice, guesses.values()))
-                )
-                for answer_choice in labels
-            }
-
-            answers_chosen = dict(
-                sorted(answers_chosen.items(), key=lambda item: item[1], reverse=True)
-            )
-
-            for answer, people_answered in answers_chosen.items():
-                is_correct_answer = dict(self.question.answers)[answer[0]] == self.question.correct
+            for answer in sorted(labels, key=lambda label: answers_chosen[label], reverse=True):
+                people_answered = answers_chosen[answer]
+                is_correct_answer = answer == self.question.correct_label
 
                 # Setting the color of answer_embed to the % of people that got it correct via the mapping
                 if is_correct_answer:
@@ -158,17 +141,17 @@ class QuestionView(View):
                 )
 
             # Assign points to users
-            for user_id, answer in guesses.items():
-                if dict(self.question.answers)[answer[0]] == self.question.correct:
+            for user_id, guess in guesses.items():
+                if guess.answer == self.question.correct_label:
                     scoreboard.assign_points(
                         int(user_id),
-                        points=(1 - (answer[-1] / self.question.time) / 2) * self.question.max_points,
-                        speed=answer[-1]
+                        points=(1 - (guess.elapsed / self.question.time) / 2) * self.question.max_points,
+                        speed=guess.elapsed
                     )
-                elif answer[-1] <= 2:
+                elif guess.elapsed <= 2:
                     scoreboard.assign_points(
                         int(user_id),
-                        points=-(1 - (answer[-1] / self.question.time) / 2) * self.question.max_points
+                        points=-(1 - (guess.elapsed / self.question.time) / 2) * self.question.max_points
                     )
                 else:
                     scoreboard.assign_points(
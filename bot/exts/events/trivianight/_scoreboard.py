@@ -1,3 +1,4 @@
+from bisect import bisect_left, insort
 from random import choice
 
 import discord.ui
@@ -8,12 +9,55 @@ from bot.bot import Bot
 from bot.constants import Colours, NEGATIVE_REPLIES
 
 
+class Ranking:
+    """
+    Members ordered by their score, kept sorted as scores change.
+
+    A member's rank and the top members are found by binary search, rather than by sorting all the scores.
+    Ties are broken by member ID.
+    """
+
+    def __init__(self, *, highest_first: bool = False):
+        self._sign = -1 if highest_first else 1
+        self._scores: dict[int, float] = {}
+        # (signed score, member ID) pairs in ascending order
+        self._order: list[tuple[float, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, member_id: int) -> bool:
+        return member_id in self._scores
+
+    def __getitem__(self, member_id: int) -> float:
+        return self._scores[member_id]
+
+    def update(self, member_id: int, score: float) -> None:
+        """Set the score of `member_id`, moving them to their new place in the ranking."""
+        if member_id in self._scores:
+            del self._order[bisect_left(self._order, (self._sign * self._scores[member_id], member_id))]
+
+        self._scores[member_id] = score
+        insort(self._order, (self._sign * score, member_id))
+
+    def rank(self, member_id: int) -> int | None:
+        """Get the rank of `member_id`, starting at 1, or None if they aren't ranked."""
+        if member_id not in self._scores:
+            return None
+        return bisect_left(self._order, (self._sign * self._scores[member_id], member_id)) + 1
+
+    def top(self, amount: int) -> list[tuple[int, float]]:
+        """Get the IDs and scores of the `amount` best ranked members, in order."""
+        return [(member_id, self._sign * score) for score, member_id in self._order[:amount]]
+
+
 class ScoreboardView(View):
     """View for the scoreboard."""
 
-    def __init__(self, bot: Bot):
+    def __init__(self, bot: Bot, scoreboard: "Scoreboard"):
         super().__init__()
         self.bot = bot
+        self.scoreboard = scoreboard
 
     @staticmethod
     def _int_to_ordinal(number: int) -> str:
@@ -31,7 +75,7 @@ class ScoreboardView(View):
 
     async def create_main_leaderboard(self) -> Embed:
         """
-        Helper function that iterates through `self.points` to generate the main leaderboard embed.
+        Helper function that iterates through the points ranking to generate the main leaderboard embed.
 
         The main leaderboard would be formatted like the following:
         **1**. @mention of the user (# of points)
@@ -39,10 +83,7 @@ class ScoreboardView(View):
         """
         formatted_string = ""
 
-        for current_placement, (user, points) in enumerate(self.points.items()):
-            if current_placement + 1 > 30:
-                break
-
+        for current_placement, (user, points) in enumerate(self.scoreboard.points.top(30)):
             user = await self.bot.fetch_user(int(user))
             formatted_string += f"**{current_placement + 1}.** {user.mention} "
             formatted_string += f"({points:.1f} pts)\n"
@@ -59,7 +100,7 @@ class ScoreboardView(View):
 
     async def _create_speed_embed(self) -> Embed:
         """
-        Helper function that iterates through `self.speed` to generate a leaderboard embed.
+        Helper function that iterates through the speed ranking to generate a leaderboard embed.
 
         The speed leaderboard would be formatted like the following:
         **1**. @mention of the user ([average speed as a float with the precision of one decimal point]s)
@@ -67,13 +108,10 @@ class ScoreboardView(View):
         """
         formatted_string = ""
 
-        for current_placement, (user, time_taken) in enumerate(self.speed.items()):
-            if current_placement + 1 > 30:
-                break
-
+        for current_placement, (user, average_speed) in enumerate(self.scoreboard.speed.top(30)):
             user = await self.bot.fetch_user(int(user))
             formatted_string += f"**{current_placement + 1}.** {user.mention} "
-            formatted_string += f"({(time_taken[-1] / time_taken[0]):.1f}s)\n"
+            formatted_string += f"({average_speed:.1f}s)\n"
             if (current_placement + 1) % 10 == 0:
                 formatted_string += "⎯⎯⎯⎯⎯⎯⎯⎯\n"
 
@@ -92,11 +130,9 @@ class ScoreboardView(View):
             - member: An instance of discord.Member representing the person who is trying to get their rank.
         """
         rank_embed = Embed(title=f"Ranks for {member.display_name}", color=Colours.python_blue)
-        # These are stored as strings so that the last digit can be determined to choose the suffix
-        try:
-            points_rank = str(list(self.points).index(member.id) + 1)
-            speed_rank = str(list(self.speed).index(member.id) + 1)
-        except ValueError:
+        points_rank = self.scoreboard.points.rank(member.id)
+        speed_rank = self.scoreboard.speed.rank(member.id)
+        if points_rank is None or speed_rank is None:
             return Embed(
                 title=choice(NEGATIVE_REPLIES),
                 description="It looks like you didn't participate in the Trivia Night event!",
@@ -106,8 +142,8 @@ class ScoreboardView(View):
         rank_embed.add_field(
             name="Total Points",
             value=(
-                f"You got {self._int_to_ordinal(int(points_rank))} place"
-                f" with {self.points[member.id]:.1f} points."
+                f"You got {self._int_to_ordinal(points_rank)} place"
+                f" with {self.scoreboard.points[member.id]:.1f} points."
             ),
             inline=False
         )
@@ -115,8 +151,8 @@ class ScoreboardView(View):
         rank_embed.add_field(
             name="Average Speed",
             value=(
-                f"You got {self._int_to_ordinal(int(speed_rank))} place"
-                f" with a time of {(self.speed[member.id][1] / self.speed[member.id][0]):.1f} seconds."
+                f"You got {self._int_to_ordinal(speed_rank)} place"
+                f" with a time of {self.scoreboard.speed[member.id]:.1f} seconds."
             ),
             inline=False
         )
@@ -154,6 +190,9 @@ class Scoreboard:
         self._bot = bot
         self._points = {}
         self._speed = {}
+        # The rankings are updated as points are assigned, so displaying them doesn't need to sort every score
+        self.points = Ranking(highest_first=True)
+        self.speed = Ranking()
 
     def assign_points(self, user_id: int, *, points: int | None = None, speed: float | None = None) -> None:
         """
@@ -173,12 +212,15 @@ class Scoreboard:
                 self._speed[user_id][0] + 1, self._speed[user_id][1] + speed
             ]
 
+        if points is not None:
+            self.points.update(user_id, self._points[user_id])
+        if speed is not None:
+            answered, total_time = self._speed[user_id]
+            self.speed.update(user_id, total_time / answered)
+
     async def display(self, speed_leaderboard: bool = False) -> tuple[Embed, View]:
         """Returns the embed of the main leaderboard along with the ScoreboardView."""
-        view = ScoreboardView(self._bot)
-
-        view.points = dict(sorted(self._points.items(), key=lambda item: item[-1], reverse=True))
-        view.speed = dict(sorted(self._speed.items(), key=lambda item: item[-1][1] / item[-1][0]))
+        view = ScoreboardView(self._bot, self)
 
         return (
             await view.create_main_leaderboard(),
@@ -1,22 +1,22 @@
 import asyncio
-import json
 import random
-from pathlib import Path
 
 import discord
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
-from bot.constants import Colours
+from bot.constants import Colours, NEGATIVE_REPLIES
+from bot.utils.anagrams import AnagramIndex, normalize_word
+from bot.utils.message_router import message_handler
+from bot.utils.resources import Resource, warm_up
 
 log = get_logger(__name__)
 
 TIME_LIMIT = 60
 
 # anagram.json file contains all the anagrams
-with open(Path("bot/resources/fun/anagram.json")) as f:
-    ANAGRAMS_ALL = json.load(f)
+ANAGRAMS = Resource("bot/resources/fun/anagram.json", parse=AnagramIndex.from_puzzles)
 
 
 class AnagramGame:
@@ -27,17 +27,20 @@ class AnagramGame:
     can be used for keeping track of each anagram game.
     """
 
-    def __init__(self, scrambled: str, correct: list[str]) -> None:
+    def __init__(self, scrambled: str, index: AnagramIndex) -> None:
         self.scrambled = scrambled
-        self.correct = set(correct)
+        self.index = index
+        self.answers = index.answers(scrambled)
+        self.found = set()
 
         self.winners = set()
 
     async def message_creation(self, message: discord.Message) -> None:
-        """Check if the message is a correct answer and remove it from the list of answers."""
-        if message.content.lower() in self.correct:
+        """Check if the message is a correct answer which hasn't been found yet."""
+        guess = normalize_word(message.content)
+        if guess not in self.found and self.index.is_answer(self.scrambled, guess):
             self.winners.add(message.author.mention)
-            self.correct.remove(message.content.lower())
+            self.found.add(guess)
 
 
 class Anagram(commands.Cog):
@@ -48,22 +51,36 @@ class Anagram(commands.Cog):
 
         self.games: dict[int, AnagramGame] = {}
 
+    async def cog_load(self) -> None:
+        """Index the anagrams ahead of the first game."""
+        await warm_up((ANAGRAMS,))
+
     @commands.command(name="anagram", aliases=("anag", "gram", "ag"))
-    async def anagram_command(self, ctx: commands.Context) -> None:
+    async def anagram_command(self, ctx: commands.Context, letters: int | None = None) -> None:
         """
         Given shuffled letters, rearrange them into anagrams.
 
         Show an embed with scrambled letters which if rearranged can form words.
         After a specific amount of time, list the correct answers and whether someone provided a
         correct answer.
+
+        Optionally, the number of letters can be given to adjust the difficulty.
         """
         if self.games.get(ctx.channel.id):
             await ctx.send("An anagram is already being solved in this channel!")
             return
 
-        scrambled_letters, correct = random.choice(list(ANAGRAMS_ALL.items()))
+        index = ANAGRAMS()
+        scrambled_letters = index.draw(min_letters=letters or 0, max_letters=letters)
+        if scrambled_letters is None:
+            await ctx.send(embed=discord.Embed(
+                title=random.choice(NEGATIVE_REPLIES),
+                description=f"There are no anagrams with {letters} letters.",
+                colour=Colours.soft_red,
+            ))
+            return
 
-        game = AnagramGame(scrambled_letters, correct)
+        game = AnagramGame(scrambled_letters, index)
         self.games[ctx.channel.id] = game
 
         anagram_embed = discord.Embed(
@@ -82,7 +99,7 @@ class Anagram(commands.Cog):
             content = "Nobody got it right."
 
         answer_embed = discord.Embed(
-            title=f"The words were:  `{'`, `'.join(ANAGRAMS_ALL[game.scrambled])}`!",
+            title=f"The words were:  `{'`, `'.join(game.answers)}`!",
             colour=Colours.pink,
         )
 
@@ -91,17 +108,12 @@ class Anagram(commands.Cog):
         # Game is finished, let's remove it from the dict
         self.games.pop(ctx.channel.id)
 
-    @commands.Cog.listener()
+    @message_handler(channels=lambda cog: cog.games)
     async def on_message(self, message: discord.Message) -> None:
         """Check a message for an anagram attempt and pass to an ongoing game."""
-        if message.author.bot or not message.guild:
-            return
-
-        game = self.games.get(message.channel.id)
-        if not game:
-            return
-
-        await game.message_creation(message)
+        # The game may have ended since the message was routed here
+        if game := self.games.get(message.channel.id):
+            await game.message_creation(message)
 
 
 async def setup(bot: Bot) -> None:
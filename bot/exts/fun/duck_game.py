@@ -13,6 +13,9 @@ from discord.ext import commands
 from bot.bot import Bot
 from bot.constants import MODERATION_ROLES
 from bot.utils.decorators import with_role
+from bot.utils.edit_coalescer import MessageEditCoalescer
+from bot.utils.message_router import message_handler
+from bot.utils.resources import Resource, read_image, warm_up
 
 DECK = list(product(*[(0, 1, 2)]*4))
 
@@ -35,8 +38,8 @@ IMAGE_PATH = Path("bot", "resources", "fun", "all_cards.png")
 FONT_PATH = Path("bot", "resources", "fun", "LuckiestGuy-Regular.ttf")
 HELP_IMAGE_PATH = Path("bot", "resources", "fun", "ducks_help_ex.png")
 
-ALL_CARDS = Image.open(IMAGE_PATH)
-LABEL_FONT = ImageFont.truetype(str(FONT_PATH), size=16)
+ALL_CARDS = Resource(IMAGE_PATH, read_image)
+LABEL_FONT = Resource(FONT_PATH, lambda path: ImageFont.truetype(str(path), size=16))
 CARD_WIDTH = 155
 CARD_HEIGHT = 97
 
@@ -78,7 +81,7 @@ def assemble_board_image(board: list[tuple[int]], rows: int, columns: int) -> Im
             xy=(left+5, top+5),  # magic numbers are buffers for the card labels
             text=str(idx),
             fill=(0, 0, 0),
-            font=LABEL_FONT,
+            font=LABEL_FONT(),
         )
     return new_im
 
@@ -92,7 +95,7 @@ def get_card_image(card: tuple[int]) -> Image:
     x2 = x1 + CARD_WIDTH
     y1 = row * CARD_HEIGHT
     y2 = y1 + CARD_HEIGHT
-    return ALL_CARDS.crop((x1, y1, x2, y2))
+    return ALL_CARDS().crop((x1, y1, x2, y2))
 
 
 def as_trinary(card: tuple[int]) -> int:
@@ -124,7 +127,8 @@ class DuckGame:
         self._solutions = None
         self.claimed_answers = {}
         self.scores = defaultdict(int)
-        self.editing_embed = asyncio.Lock()
+        # The lines of the "Flights Found" embed, which is edited through `found_editor`
+        self.found_lines = []
 
         self.board = random.sample(DECK, size)
         while len(self.solutions) < minimum_solutions:
@@ -132,6 +136,7 @@ class DuckGame:
 
         self.board_msg = None
         self.found_msg = None
+        self.found_editor = None
 
     @property
     def board(self) -> list[tuple[int]]:
@@ -177,6 +182,10 @@ class DuckGamesDirector(commands.Cog):
         self.bot = bot
         self.current_games = {}
 
+    async def cog_load(self) -> None:
+        """Decode the card images ahead of the first game."""
+        await warm_up((ALL_CARDS, LABEL_FONT))
+
     @commands.group(
         name="duckduckduckgoose",
         aliases=["dddg", "ddg", "duckduckgoose", "duckgoose"],
@@ -196,6 +205,7 @@ class DuckGamesDirector(commands.Cog):
 
         game.board_msg = await self.send_board_embed(ctx, game)
         game.found_msg = await self.send_found_embed(ctx)
+        game.found_editor = MessageEditCoalescer(game.found_msg)
         await asyncio.sleep(GAME_DURATION)
 
         # Checking for the channel ID in the currently running games is not sufficient.
@@ -207,13 +217,11 @@ class DuckGamesDirector(commands.Cog):
             except KeyError:
                 pass
 
-    @commands.Cog.listener()
+    @message_handler(channels=lambda cog: cog.current_games, allow_dms=True)
     async def on_message(self, msg: discord.Message) -> None:
         """Listen for messages and process them as answers if appropriate."""
-        if msg.author.bot:
-            return
-
         channel = msg.channel
+        # The game may have ended since the message was routed here
         if channel.id not in self.current_games:
             return
 
@@ -248,7 +256,7 @@ class DuckGamesDirector(commands.Cog):
         if answer in game.solutions:
             game.claimed_answers[answer] = msg.author
             game.scores[msg.author] += CORRECT_SOLN
-            await self.append_to_found_embed(game, f"{answer!s:12s}  -  {msg.author.display_name}")
+            self.append_to_found_embed(game, f"{answer!s:12s}  -  {msg.author.display_name}")
         else:
             await msg.add_reaction(EMOJI_WRONG)
             game.scores[msg.author] += INCORRECT_SOLN
@@ -276,13 +284,20 @@ class DuckGamesDirector(commands.Cog):
         )
         return await ctx.send(embed=embed)
 
-    async def append_to_found_embed(self, game: DuckGame, text: str) -> None:
-        """Append text to the claimed answers embed."""
-        async with game.editing_embed:
-            found_embed, = game.found_msg.embeds
-            old_desc = found_embed.description or ""
-            found_embed.description = f"{old_desc.rstrip()}\n{text}"
-            await game.found_msg.edit(embed=found_embed)
+    @staticmethod
+    def append_to_found_embed(game: DuckGame, text: str) -> None:
+        """
+        Append text to the claimed answers embed.
+
+        The embed is edited at a bounded rate, so a burst of answers doesn't make it fall behind.
+        """
+        game.found_lines.append(text)
+        found_embed = discord.Embed(
+            title="Flights Found",
+            description="\n".join(game.found_lines),
+            color=discord.Color.dark_purple(),
+        )
+        game.found_editor.update(embed=found_embed)
 
     async def end_game(self, channel: discord.TextChannel, game: DuckGame, end_message: str) -> None:
         """Edit the game embed to reflect the end of the game and mark the game as not running."""
@@ -307,7 +322,8 @@ class DuckGamesDirector(commands.Cog):
             missed_text = "Flights everyone missed:\n" + "\n".join(f"{ans}" for ans in missed)
         else:
             missed_text = "All the flights were found!"
-        await self.append_to_found_embed(game, f"\n{missed_text}")
+        self.append_to_found_embed(game, f"\n{missed_text}")
+        await game.found_editor.flush()
 
     @start_game.command(name="help")
     async def show_rules(self, ctx: commands.Context) -> None:
@@ -1,4 +1,3 @@
-import json
 import random
 from collections.abc import Iterable
 from pathlib import Path
@@ -16,6 +15,7 @@ from bot.bot import Bot
 from bot.constants import Client, Colours, Emojis
 from bot.utils import helpers, messages
 from bot.utils.quote import daily_quote, random_quote
+from bot.utils.resources import read_json
 
 log = get_logger(__name__)
 
@@ -45,7 +45,7 @@ class Fun(Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
-        self._caesar_cipher_embed = json.loads(Path("bot/resources/fun/caesar_info.json").read_text("UTF-8"))
+        self._caesar_cipher_embed = read_json(Path("bot/resources/fun/caesar_info.json"))
 
     @staticmethod
     def _get_random_die() -> str:
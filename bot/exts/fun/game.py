@@ -15,6 +15,7 @@ from pydis_core.utils.logging import get_logger
 from bot.bot import Bot
 from bot.constants import STAFF_ROLES, Tokens
 from bot.utils.decorators import with_role
+from bot.utils.extension_loader import defer_cog_load
 from bot.utils.pagination import ImagePaginator, LinePaginator
 
 # Base URL of IGDB API
@@ -26,6 +27,16 @@ CLIENT_SECRET = Tokens.igdb_client_secret.get_secret_value()
 # The number of seconds before expiry that we attempt to re-fetch a new access token
 ACCESS_TOKEN_RENEWAL_WINDOW = 60*60*24*2
 
+# IGDB accepts at most this many queries in a single multiquery request
+MAX_MULTIQUERY_SIZE = 10
+
+# How many games of each genre, and how many companies, are kept locally to pick random ones from
+GENRE_WINDOW_SIZE = 200
+COMPANIES_WINDOW_SIZE = 200
+
+# The highest amount of games or companies a single command may request
+MAX_AMOUNT = 25
+
 # URL to request API access token
 OAUTH_URL = "https://id.twitch.tv/oauth2/token"
 
@@ -56,6 +67,10 @@ GAMES_LIST_BODY = (
     "{sort} {limit} {offset} {genre} {additional}"
 )
 
+# Sorting and filtering of the .games top command
+TOP_GAMES_SORT = "total_rating desc"
+TOP_GAMES_ADDITIONAL = "where total_rating >= 90; sort total_rating_count desc;"
+
 # Request body template for get_companies_list
 COMPANIES_LIST_BODY = (
     "fields name, url, start_date, logo.image_id, developed.name, published.name, description;"
@@ -175,6 +190,40 @@ class AgeRatings(IntEnum):
     ACB_RC = 38
 
 
+class IGDBClient:
+    """A small IGDB API client, able to batch several queries into one multiquery round-trip."""
+
+    def __init__(self, http_session: ClientSession, headers: dict[str, str]):
+        self.http_session = http_session
+        # Shared with the cog, so that renewed access tokens are picked up automatically
+        self.headers = headers
+
+    async def query(self, endpoint: str, body: str) -> list[dict[str, Any]]:
+        """Run a single query against `endpoint`."""
+        async with self.http_session.post(url=f"{BASE_URL}/{endpoint}", data=body, headers=self.headers) as resp:
+            return await resp.json()
+
+    async def multiquery(self, queries: dict[str, tuple[str, str]]) -> dict[str, list[dict[str, Any]]]:
+        """
+        Run several queries at once, returning the results of each one by name.
+
+        `queries` maps a unique name to an (endpoint, body) pair. They are sent in batches of
+        `MAX_MULTIQUERY_SIZE`, which is the most IGDB accepts in a single request.
+        """
+        results = {}
+        items = list(queries.items())
+
+        for start in range(0, len(items), MAX_MULTIQUERY_SIZE):
+            body = "".join(
+                f'query {endpoint} "{name}" {{ {query_body} }};'
+                for name, (endpoint, query_body) in items[start:start + MAX_MULTIQUERY_SIZE]
+            )
+            for result in await self.query("multiquery", body):
+                results[result["name"]] = result["result"]
+
+        return results
+
+
 class Games(Cog):
     """Games Cog contains commands that collect data from IGDB."""
 
@@ -184,12 +233,25 @@ class Games(Cog):
 
         self.genres: dict[str, int] = {}
         self.headers = BASE_HEADERS
+        self.client = IGDBClient(self.http_session, self.headers)
         self.token_refresh_scheduler = scheduling.Scheduler(__name__)
 
+        # Locally cached results to pick random entries from, refreshed along with the genres
+        self.genre_windows: dict[int, list[dict[str, Any]]] = {}
+        self.top_games: list[dict[str, Any]] = []
+        self.companies_window: list[dict[str, Any]] = []
+
+    @defer_cog_load
     async def cog_load(self) -> None:
         """Get an auth token and start the refresh task on cog load."""
         await self.refresh_token()
-        self.refresh_genres_task.start()
+        # The cog has been removed if there's no token to use
+        if "Authorization" in self.headers:
+            self.refresh_genres_task.start()
+
+    async def cog_before_invoke(self, ctx: Context) -> None:
+        """Wait for the first auth token, in case a command is used while the cog is still loading."""
+        await self.cog_load_task
 
     async def refresh_token(self) -> None:
         """
@@ -214,7 +276,7 @@ class Games(Cog):
                         "Invalid OAuth credentials. Unloading Games cog. "
                         f"OAuth response message: {result['message']}"
                     )
-                    self.bot.remove_cog("Games")
+                    await self.bot.remove_cog("Games")
                 return
 
         self.headers["Authorization"] = f"Bearer {result['access_token']}"
@@ -226,7 +288,7 @@ class Games(Cog):
 
     @tasks.loop(hours=24.0)
     async def refresh_genres_task(self) -> None:
-        """Refresh genres in every hour."""
+        """Refresh genres, along with the cached games and companies, every day."""
         try:
             await self._get_genres()
         except Exception as e:
@@ -234,17 +296,37 @@ class Games(Cog):
             return
         logger.info("Successfully refreshed genres.")
 
+        try:
+            await self._refresh_genre_windows()
+        except Exception as e:
+            logger.warning(f"There was error while refreshing genre games: {e}")
+            return
+        logger.info(f"Successfully refreshed games of {len(self.genre_windows)} genres.")
+
     def cog_unload(self) -> None:
         """Cancel genres refreshing start when unloading Cog."""
         self.refresh_genres_task.cancel()
         logger.info("Successfully stopped Genres Refreshing task.")
 
     async def _get_genres(self) -> None:
-        """Create genres variable for games command."""
-        body = "fields name; limit 100;"
-        async with self.http_session.post(f"{BASE_URL}/genres", data=body, headers=self.headers) as resp:
-            result = await resp.json()
-        genres = {genre["name"].capitalize(): genre["id"] for genre in result}
+        """
+        Create genres variable for games command.
+
+        The top games and the window of companies don't depend on the genres,
+        so they are refreshed in the same round-trip.
+        """
+        results = await self.client.multiquery({
+            "genres": ("genres", "fields name; limit 100;"),
+            "top": (
+                "games",
+                self._games_list_body(MAX_AMOUNT, sort=TOP_GAMES_SORT, additional_body=TOP_GAMES_ADDITIONAL),
+            ),
+            "companies": ("companies", COMPANIES_LIST_BODY.format(limit=COMPANIES_WINDOW_SIZE, offset=0)),
+        })
+        self.top_games = results["top"]
+        self.companies_window = results["companies"]
+
+        genres = {genre["name"].capitalize(): genre["id"] for genre in results["genres"]}
 
         # Replace complex names with names from ALIASES
         for genre_name, genre in genres.items():
@@ -254,6 +336,22 @@ class Games(Cog):
             else:
                 self.genres[genre_name] = genre
 
+    async def _refresh_genre_windows(self) -> None:
+        """Fetch the window of games to pick random ones from for every genre."""
+        results = await self.client.multiquery({
+            str(genre): ("games", self._games_list_body(GENRE_WINDOW_SIZE, genre))
+            for genre in set(self.genres.values())
+        })
+        self.genre_windows = {int(genre): games for genre, games in results.items()}
+
+    async def get_random_games(self, amount: int, genre: int) -> list[dict[str, Any]]:
+        """Pick `amount` random games of `genre` from its cached window, fetching the window if it's missing."""
+        if genre not in self.genre_windows:
+            self.genre_windows[genre] = await self.get_games_list(GENRE_WINDOW_SIZE, genre)
+
+        window = self.genre_windows[genre]
+        return random.sample(window, min(amount, len(window)))
+
     @group(name="games", aliases=("game",), invoke_without_command=True)
     async def games(self, ctx: Context, amount: int | None = 5, *, genre: str | None) -> None:
         """
@@ -272,15 +370,14 @@ class Games(Cog):
         genre = "".join(genre).capitalize()
 
         # Check for amounts, max is 25 and min 1
-        if not 1 <= amount <= 25:
-            await ctx.send("Your provided amount is out of range. Our minimum is 1 and maximum 25.")
+        if not 1 <= amount <= MAX_AMOUNT:
+            await ctx.send(f"Your provided amount is out of range. Our minimum is 1 and maximum {MAX_AMOUNT}.")
             return
 
         # Get games listing, if genre don't exist, show error message with possibilities.
-        # Offset must be random, due otherwise we will get always same result (offset show in which position should
-        # API start returning result)
+        # Games are picked at random from a cached window of the genre, so we don't always get the same result.
         try:
-            games = await self.get_games_list(amount, self.genres[genre], offset=random.randint(0, 150))
+            games = await self.get_random_games(amount, self.genres[genre])
         except KeyError:
             possibilities = await self.get_best_results(genre)
             # If there is more than 1 possibilities, show these.
@@ -295,9 +392,7 @@ class Games(Cog):
                 return
 
             if len(possibilities) == 1:
-                games = await self.get_games_list(
-                    amount, self.genres[possibilities[0][1]], offset=random.randint(0, 150)
-                )
+                games = await self.get_random_games(amount, self.genres[possibilities[0][1]])
                 genre = possibilities[0][1]
             else:
                 await ctx.send(f"Invalid genre `{genre}`.")
@@ -315,12 +410,15 @@ class Games(Cog):
 
         Support amount parameter. Max is 25, min is 1.
         """
-        if not 1 <= amount <= 25:
-            await ctx.send("Your provided amount is out of range. Our minimum is 1 and maximum 25.")
+        if not 1 <= amount <= MAX_AMOUNT:
+            await ctx.send(f"Your provided amount is out of range. Our minimum is 1 and maximum {MAX_AMOUNT}.")
             return
 
-        games = await self.get_games_list(amount, sort="total_rating desc",
-                                          additional_body="where total_rating >= 90; sort total_rating_count desc;")
+        if not self.top_games:
+            self.top_games = await self.get_games_list(
+                MAX_AMOUNT, sort=TOP_GAMES_SORT, additional_body=TOP_GAMES_ADDITIONAL
+            )
+        games = self.top_games[:amount]
 
         pages = [await self.create_page(game) for game in games]
         await ImagePaginator.paginate(pages, ctx, Embed(title=f"Top {amount} Games"))
@@ -344,13 +442,14 @@ class Games(Cog):
 
         Support amount parameter. Max is 25, min is 1.
         """
-        if not 1 <= amount <= 25:
-            await ctx.send("Your provided amount is out of range. Our minimum is 1 and maximum 25.")
+        if not 1 <= amount <= MAX_AMOUNT:
+            await ctx.send(f"Your provided amount is out of range. Our minimum is 1 and maximum {MAX_AMOUNT}.")
             return
 
-        # Get companies listing. Provide limit for limiting how much companies will be returned. Get random offset to
-        # get (almost) every time different companies (offset show in which position should API start returning result)
-        companies = await self.get_companies_list(limit=amount, offset=random.randint(0, 150))
+        # Pick random companies from the cached window, so we get (almost) every time different companies.
+        if not self.companies_window:
+            self.companies_window = await self.get_companies_list(limit=COMPANIES_WINDOW_SIZE)
+        companies = random.sample(self.companies_window, min(amount, len(self.companies_window)))
         pages = [await self.create_company_page(co) for co in companies]
 
         await ImagePaginator.paginate(pages, ctx, Embed(title="Random Game Companies"))
@@ -358,9 +457,10 @@ class Games(Cog):
     @with_role(*STAFF_ROLES)
     @games.command(name="refresh", aliases=("r",))
     async def refresh_genres_command(self, ctx: Context) -> None:
-        """Refresh .games command genres."""
+        """Refresh .games command genres and their cached games."""
         try:
             await self._get_genres()
+            await self._refresh_genre_windows()
         except Exception as e:
             await ctx.send(f"There was error while refreshing genres: `{e}`")
             return
@@ -369,7 +469,7 @@ class Games(Cog):
     async def get_games_list(
         self,
         amount: int,
-        genre: str | None = None,
+        genre: int | None = None,
         sort: str | None = None,
         additional_body: str = "",
         offset: int = 0
@@ -382,7 +482,18 @@ class Games(Cog):
         desc/asc is direction). Additional_body is field where you can pass extra search parameters. Offset show start
         position in API.
         """
-        # Create body of IGDB API request, define fields, sorting, offset, limit and genre
+        body = self._games_list_body(amount, genre, sort, additional_body, offset)
+        return await self.client.query("games", body)
+
+    @staticmethod
+    def _games_list_body(
+        amount: int,
+        genre: int | None = None,
+        sort: str | None = None,
+        additional_body: str = "",
+        offset: int = 0
+    ) -> str:
+        """Create body of IGDB API games request, define fields, sorting, offset, limit and genre."""
         params = {
             "sort": f"sort {sort};" if sort else "",
             "limit": f"limit {amount};",
@@ -390,11 +501,7 @@ class Games(Cog):
             "genre": f"where genres = ({genre});" if genre else "",
             "additional": additional_body
         }
-        body = GAMES_LIST_BODY.format(**params)
-
-        # Do request to IGDB API, create headers, URL, define body, return result
-        async with self.http_session.post(url=f"{BASE_URL}/games", data=body, headers=self.headers) as resp:
-            return await resp.json()
+        return GAMES_LIST_BODY.format(**params)
 
     async def create_page(self, data: dict[str, Any]) -> tuple[str, str]:
         """Create content of Game Page."""
@@ -440,8 +547,7 @@ class Games(Cog):
         # Define request body of IGDB API request and do request
         body = SEARCH_BODY.format(term=search_term)
 
-        async with self.http_session.post(url=f"{BASE_URL}/games", data=body, headers=self.headers) as resp:
-            data = await resp.json()
+        data = await self.client.query("games", body)
 
         # Loop over games, format them to good format, make line and append this to total lines
         for game in data:
@@ -469,8 +575,7 @@ class Games(Cog):
             offset=offset,
         )
 
-        async with self.http_session.post(url=f"{BASE_URL}/companies", data=body, headers=self.headers) as resp:
-            return await resp.json()
+        return await self.client.query("companies", body)
 
     async def create_company_page(self, data: dict[str, Any]) -> tuple[str, str]:
         """Create good formatted Game Company page."""
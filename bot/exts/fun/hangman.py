@@ -1,14 +1,14 @@
-from pathlib import Path
-from random import choice
+from bisect import bisect_right
+from itertools import accumulate
+from random import choice, randrange
 
 from discord import Embed, Message
 from discord.ext import commands
 
 from bot.bot import Bot
 from bot.constants import Colours, NEGATIVE_REPLIES
-
-# Defining all words in the list of words as a global variable
-ALL_WORDS = Path("bot/resources/fun/hangman_words.txt").read_text().splitlines()
+from bot.utils.edit_coalescer import MessageEditCoalescer
+from bot.utils.resources import Resource, read_text, warm_up
 
 # Defining a dictionary of images that will be used for the game to represent the hangman person
 IMAGES = {
@@ -22,6 +22,47 @@ IMAGES = {
 }
 
 
+class WordIndex:
+    """
+    The words of a word list, bucketed by their length and number of unique letters.
+
+    A filter on both only needs to go through the buckets, rather than every word, to pick a word at random.
+    """
+
+    def __init__(self, words: list[str]):
+        self.buckets: dict[tuple[int, int], list[str]] = {}
+        for word in words:
+            self.buckets.setdefault((len(word), len(set(word))), []).append(word)
+
+    def __len__(self) -> int:
+        return sum(map(len, self.buckets.values()))
+
+    def choose(
+        self, min_length: int, max_length: int, min_unique_letters: int, max_unique_letters: int
+    ) -> str | None:
+        """
+        Pick a uniformly random word with a length and number of unique letters strictly between the given bounds.
+
+        Return None if no word fits.
+        """
+        buckets = [
+            bucket for (length, unique_letters), bucket in self.buckets.items()
+            if min_length < length < max_length and min_unique_letters < unique_letters < max_unique_letters
+        ]
+        # The cumulative counts map a random position among all the fitting words to its bucket
+        counts = list(accumulate(map(len, buckets)))
+        if not counts:
+            return None
+
+        position = randrange(counts[-1])
+        bucket_index = bisect_right(counts, position)
+        offset = counts[bucket_index - 1] if bucket_index else 0
+        return buckets[bucket_index][position - offset]
+
+
+WORDS = Resource("bot/resources/fun/hangman_words.txt", read_text, parse=lambda text: WordIndex(text.splitlines()))
+
+
 class Hangman(commands.Cog):
     """
     Cog for the Hangman game.
@@ -32,6 +73,10 @@ class Hangman(commands.Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
 
+    async def cog_load(self) -> None:
+        """Index the words ahead of the first game."""
+        await warm_up((WORDS,))
+
     @staticmethod
     def create_embed(tries: int, user_guess: str) -> Embed:
         """
@@ -69,14 +114,10 @@ class Hangman(commands.Cog):
         - min_unique_letters: the minimum unique letters you want the word to have (i.e. 4)
         - max_unique_letters: the maximum unique letters you want the word to have (i.e. 7)
         """
-        # Filtering the list of all words depending on the configuration
-        filtered_words = [
-            word for word in ALL_WORDS
-            if min_length < len(word) < max_length
-            and min_unique_letters < len(set(word)) < max_unique_letters
-        ]
+        # Picking a word which fits the configuration
+        word = WORDS().choose(min_length, max_length, min_unique_letters, max_unique_letters)
 
-        if not filtered_words:
+        if word is None:
             filter_not_found_embed = Embed(
                 title=choice(NEGATIVE_REPLIES),
                 description="No words could be found that fit all filters specified.",
@@ -85,7 +126,6 @@ class Hangman(commands.Cog):
             await ctx.send(embed=filter_not_found_embed)
             return
 
-        word = choice(filtered_words)
         # `pretty_word` is used for comparing the indices where the guess of the user is similar to the word
         # The `user_guess` variable is prettified by adding spaces between every dash, and so is the `pretty_word`
         pretty_word = "".join([f"{letter} " for letter in word])[:-1]
@@ -101,11 +141,13 @@ class Hangman(commands.Cog):
             description="Loading game...",
             color=Colours.soft_green
         ))
+        # Guesses can come in faster than the message can be edited, so only the latest state is shown
+        editor = MessageEditCoalescer(original_message)
 
         # Game loop
         while user_guess.replace(" ", "") != word:
             # Edit the message to the current state of the game
-            await original_message.edit(embed=self.create_embed(tries, user_guess))
+            editor.update(embed=self.create_embed(tries, user_guess))
 
             try:
                 message = await self.bot.wait_for(
@@ -114,6 +156,7 @@ class Hangman(commands.Cog):
                     check=check
                 )
             except TimeoutError:
+                await editor.flush()
                 timeout_embed = Embed(
                     title="You lost",
                     description=f"Time's up! The correct word was `{word}`.",
@@ -159,14 +202,16 @@ class Hangman(commands.Cog):
                         description=f"The word was `{word}`.",
                         color=Colours.soft_red,
                     )
-                    await original_message.edit(embed=self.create_embed(tries, user_guess))
+                    editor.update(embed=self.create_embed(tries, user_guess))
+                    await editor.flush()
                     await ctx.send(embed=losing_embed)
                     return
 
             guessed_letters.add(normalized_content)
 
         # The loop exited meaning that the user has guessed the word
-        await original_message.edit(embed=self.create_embed(tries, user_guess))
+        editor.update(embed=self.create_embed(tries, user_guess))
+        await editor.flush()
         win_embed = Embed(
             title="You won!",
             description=f"The word was `{word}`.",
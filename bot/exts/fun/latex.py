@@ -16,6 +16,7 @@ from pydis_core.utils.paste_service import PasteFile, PasteTooLongError, PasteUp
 from bot.bot import Bot
 from bot.constants import Channels, WHITELISTED_CHANNELS
 from bot.utils.decorators import whitelist_override
+from bot.utils.resources import Resource, read_text
 
 log = get_logger(__name__)
 FORMATTED_CODE_REGEX = re.compile(
@@ -34,7 +35,7 @@ PASTEBIN_URL = "https://paste.pythondiscord.com"
 THIS_DIR = Path(__file__).parent
 CACHE_DIRECTORY = THIS_DIR / "_latex_cache"
 CACHE_DIRECTORY.mkdir(exist_ok=True)
-TEMPLATE = string.Template(Path("bot/resources/fun/latex_template.txt").read_text())
+TEMPLATE = Resource("bot/resources/fun/latex_template.txt", read_text, parse=string.Template)
 
 PAD = 10
 
@@ -141,7 +142,7 @@ class Latex(commands.Cog):
             if not image_path.exists():
                 try:
                     with open(image_path, "wb") as out_file:
-                        await self._generate_image(TEMPLATE.substitute(text=query), out_file)
+                        await self._generate_image(TEMPLATE().substitute(text=query), out_file)
                 except (InvalidLatexError, LatexServerError) as err:
                     embed = await self._prepare_error_embed(err)
                     await ctx.send(embed=embed)
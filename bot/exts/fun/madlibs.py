@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 from random import choice
 from typing import TypedDict
@@ -8,6 +7,7 @@ from discord.ext import commands
 
 from bot.bot import Bot
 from bot.constants import Colours, NEGATIVE_REPLIES
+from bot.utils.resources import read_json
 
 TIMEOUT = 60.0
 
@@ -31,10 +31,7 @@ class Madlibs(commands.Cog):
 
     @staticmethod
     def _load_templates() -> list[MadlibsTemplate]:
-        madlibs_stories = Path("bot/resources/fun/madlibs_templates.json")
-
-        with open(madlibs_stories) as file:
-            return json.load(file)
+        return read_json(Path("bot/resources/fun/madlibs_templates.json"))
 
     @staticmethod
     def madlibs_embed(part_of_speech: str, number_of_inputs: int) -> discord.Embed:
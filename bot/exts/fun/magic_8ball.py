@@ -1,15 +1,14 @@
-import json
 import random
-from pathlib import Path
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-ANSWERS = json.loads(Path("bot/resources/fun/magic8ball.json").read_text("utf8"))
+ANSWERS = Resource("bot/resources/fun/magic8ball.json")
 
 
 class Magic8ball(commands.Cog):
@@ -19,7 +18,7 @@ class Magic8ball(commands.Cog):
     async def output_answer(self, ctx: commands.Context, *, question: str) -> None:
         """Return a Magic 8ball answer from answers list."""
         if len(question.split()) >= 3:
-            answer = random.choice(ANSWERS)
+            answer = random.choice(ANSWERS())
             await ctx.send(answer)
         else:
             await ctx.send("Usage: .8ball <question> (minimum length of 3 eg: `will I win?`)")
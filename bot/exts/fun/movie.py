@@ -1,3 +1,4 @@
+import asyncio
 import random
 from enum import Enum
 from typing import Any
@@ -5,10 +6,12 @@ from typing import Any
 from aiohttp import ClientSession
 from discord import Embed
 from discord.ext.commands import Cog, Context, group
+from pydis_core.utils import scheduling
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Tokens
+from bot.utils.caching import RedisTTLCache
 from bot.utils.exceptions import APIError
 from bot.utils.pagination import ImagePaginator
 
@@ -30,6 +33,13 @@ MOVIE_PARAMS = {
 # anything over 500 returns an error.
 MAX_PAGES = 500
 
+# How many movie details are fetched from TMDB at once for a single command.
+MAX_CONCURRENT_DETAIL_FETCHES = 5
+
+# Movie details rarely change, while discover pages shift as popularity changes.
+MOVIE_DETAILS_TTL = 7 * 24 * 60 * 60
+DISCOVER_PAGE_TTL = 6 * 60 * 60
+
 
 class MovieGenres(Enum):
     """Movies Genre names and IDs."""
@@ -56,6 +66,12 @@ class MovieGenres(Enum):
 class Movie(Cog):
     """Movie Cog contains movies command that grab random movies from TMDB."""
 
+    # RedisTTLCache[movie_id, dict]
+    movie_details = RedisTTLCache()
+
+    # RedisTTLCache[f"{genre_id}:{page}", dict]
+    discover_pages = RedisTTLCache()
+
     def __init__(self, bot: Bot):
         self.bot = bot
         self.http_session: ClientSession = bot.http_session
@@ -92,10 +108,15 @@ class Movie(Cog):
         movies = await self.get_movies_data(self.http_session, MovieGenres[genre].value, page)
 
         # Get all pages and embed
-        pages = await self.get_pages(self.http_session, movies, amount)
+        page_tasks = self.get_pages(self.http_session, movies, amount)
         embed = await self.get_embed(genre)
 
-        await ImagePaginator.paginate(pages, ctx, embed)
+        try:
+            await ImagePaginator.paginate(list(page_tasks), ctx, embed)
+        finally:
+            # Don't keep fetching pages that nobody is going to see anymore.
+            for task in page_tasks:
+                task.cancel()
 
     @movies.command(name="genres", aliases=("genre", "g"))
     async def genres(self, ctx: Context) -> None:
@@ -104,6 +125,10 @@ class Movie(Cog):
 
     async def get_movies_data(self, client: ClientSession, genre_id: str, page: int) -> list[dict[str, Any]]:
         """Return JSON of TMDB discover request."""
+        cache_key = f"{genre_id}:{page}"
+        if cached := await self.discover_pages.get(cache_key):
+            return cached
+
         # Define params of request
         params = {
             "api_key": Tokens.tmdb.get_secret_value(),
@@ -130,29 +155,48 @@ class Movie(Cog):
                 )
                 logger.error(err_msg)
                 raise APIError("TMDB API", status, err_msg)
-            return result
 
-    async def get_pages(self, client: ClientSession, movies: dict[str, Any], amount: int) -> list[tuple[str, str]]:
-        """Fetch all movie pages from movies dictionary. Return list of pages."""
-        pages = []
+        await self.discover_pages.set(cache_key, result, ttl=DISCOVER_PAGE_TTL)
+        return result
 
-        for i in range(amount):
-            movie_id = movies["results"][i]["id"]
-            movie = await self.get_movie(client, movie_id)
+    def get_pages(
+        self, client: ClientSession, movies: dict[str, Any], amount: int
+    ) -> list[asyncio.Task[tuple[str, str]]]:
+        """
+        Start fetching all movie pages from movies dictionary. Return list of page tasks.
+
+        The details of at most `MAX_CONCURRENT_DETAIL_FETCHES` movies are fetched at once,
+        in order, so that earlier pages are ready first.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DETAIL_FETCHES)
 
-            page, img = await self.create_page(movie)
-            pages.append((page, img))
+        async def get_page(movie_id: int) -> tuple[str, str]:
+            async with semaphore:
+                movie = await self.get_movie(client, movie_id)
+            return await self.create_page(movie)
 
-        return pages
+        return [
+            scheduling.create_task(get_page(movie["id"]))
+            for movie in movies["results"][:amount]
+        ]
 
     async def get_movie(self, client: ClientSession, movie: int) -> dict[str, Any]:
         """Get Movie by movie ID from TMDB. Return result dictionary."""
         if not isinstance(movie, int):
             raise ValueError("Error while fetching movie from TMDB, movie argument must be integer. ")
+
+        if cached := await self.movie_details.get(movie):
+            return cached
+
         url = BASE_URL + f"movie/{movie}"
 
         async with client.get(url, params=MOVIE_PARAMS) as resp:
-            return await resp.json()
+            result = await resp.json()
+
+        # Only successful lookups are cached, error responses don't have an ID.
+        if "id" in result:
+            await self.movie_details.set(movie, result, ttl=MOVIE_DETAILS_TTL)
+        return result
 
     async def create_page(self, movie: dict[str, Any]) -> tuple[str, str]:
         """Create page from TMDB movie request result. Return formatted page + image."""
@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 from random import shuffle
 
@@ -7,14 +6,14 @@ from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils.resources import read_json
 
 log = get_logger(__name__)
 game_recs = []
 
 # Populate the list `game_recs` with resource files
 for rec_path in Path("bot/resources/fun/game_recs").glob("*.json"):
-    data = json.loads(rec_path.read_text("utf8"))
-    game_recs.append(data)
+    game_recs.append(read_json(rec_path))
 shuffle(game_recs)
 
 
@@ -1,6 +1,5 @@
 import asyncio
 import colorsys
-import os
 import random
 import re
 import string
@@ -8,12 +7,14 @@ import textwrap
 import urllib
 from functools import partial
 from io import BytesIO
+from pathlib import Path
 from typing import Any
 
 from PIL import Image, ImageDraw, ImageFont
 from aiohttp import ClientTimeout
 from discord import Colour, Embed, File, Member, Message, Reaction
 from discord.errors import HTTPException
+from discord.ext import tasks
 from discord.ext.commands import Cog, CommandError, Context, bot_has_permissions, group
 from pydis_core.utils.logging import get_logger
 
@@ -21,7 +22,9 @@ from bot.bot import Bot
 from bot.constants import ERROR_REPLIES, Tokens
 from bot.exts.fun.snakes import _utils as utils
 from bot.exts.fun.snakes._converter import Snake
+from bot.utils.caching import RedisTTLCache
 from bot.utils.decorators import locked
+from bot.utils.resources import Resource, read_image
 
 log = get_logger(__name__)
 
@@ -92,6 +95,12 @@ MSG_MAX = 100
 # get_snek constants
 URL = "https://en.wikipedia.org/w/api.php?"
 
+# Wikipedia articles about snakes barely change, so their data is kept for a long time
+SNEK_TTL = 30 * 24 * 60 * 60
+
+# Seconds to wait between Wikipedia lookups while warming the cache, to go easy on their API
+PREFETCH_DELAY = 1
+
 # snake guess responses
 INCORRECT_GUESS = (
     "Nope, that's not what it is.",
@@ -119,17 +128,19 @@ CORRECT_GUESS = (
     "Are you cheating?"
 )
 
+
+def _load_card_assets(path: Path) -> dict:
+    return {
+        "top": read_image(path / "card_top.png"),
+        "frame": read_image(path / "card_frame.png"),
+        "bottom": read_image(path / "card_bottom.png"),
+        "backs": [read_image(file) for file in (path / "backs").iterdir()],
+        "font": ImageFont.truetype(str(path / "expressway.ttf"), 20)
+    }
+
+
 # snake card consts
-CARD = {
-    "top": Image.open("bot/resources/fun/snakes/snake_cards/card_top.png"),
-    "frame": Image.open("bot/resources/fun/snakes/snake_cards/card_frame.png"),
-    "bottom": Image.open("bot/resources/fun/snakes/snake_cards/card_bottom.png"),
-    "backs": [
-        Image.open(f"bot/resources/fun/snakes/snake_cards/backs/{file}")
-        for file in os.listdir("bot/resources/fun/snakes/snake_cards/backs")
-    ],
-    "font": ImageFont.truetype("bot/resources/fun/snakes/snake_cards/expressway.ttf", 20)
-}
+CARD = Resource("bot/resources/fun/snakes/snake_cards", _load_card_assets)
 # endregion
 
 
@@ -145,6 +156,9 @@ class Snakes(Cog):
     wiki_brief = re.compile(r"(.*?)(=+ (.*?) =+)", flags=re.DOTALL)
     valid_image_extensions = ("gif", "png", "jpeg", "jpg", "webp")
 
+    # RedisTTLCache[snake_name, dict]
+    snek_cache = RedisTTLCache()
+
     def __init__(self, bot: Bot):
         self.active_sal = {}
         self.bot = bot
@@ -154,6 +168,37 @@ class Snakes(Cog):
         self.snake_facts = utils.get_resource("snake_facts")
         self.num_movie_pages = None
 
+        # Names of the snakes whose data is cached and has an image, to be used by `.snake guess`
+        self.guessable_snakes: set[str] = set()
+        self.prefetch_sneks.start()
+
+    def cog_unload(self) -> None:
+        """Cancel the snake prefetching task when the cog is unloaded."""
+        self.prefetch_sneks.cancel()
+
+    @tasks.loop(hours=24)
+    async def prefetch_sneks(self) -> None:
+        """Warm the cache with the Wikipedia data of every known snake, marking those usable for guessing."""
+        names = [snake["scientific"] for snake in self.snake_names]
+        random.shuffle(names)
+
+        fetched = 0
+        for name in names:
+            if (data := await self.snek_cache.get(name.lower())) is None:
+                try:
+                    data = await self._get_snek(name)
+                except Exception as e:
+                    log.info(f"Failed to prefetch snake {name!r}: {e}")
+                    continue
+                finally:
+                    await asyncio.sleep(PREFETCH_DELAY)
+                fetched += 1
+
+            if data and self._get_image(data):
+                self.guessable_snakes.add(name)
+
+        log.info(f"Prefetched {fetched} snakes, {len(self.guessable_snakes)} are available for guessing.")
+
     # region: Helper methods
     @staticmethod
     def _beautiful_pastel(hue: float) -> int:
@@ -177,33 +222,34 @@ class Snakes(Cog):
 
         Written by juan and Someone during the first code jam.
         """
+        card = CARD()
         snake = Image.open(buffer)
 
         # Get the size of the snake icon, configure the height of the image box (yes, it changes)
         icon_width = 347  # Hardcoded, not much i can do about that
         icon_height = int((icon_width / snake.width) * snake.height)
-        frame_copies = icon_height // CARD["frame"].height + 1
+        frame_copies = icon_height // card["frame"].height + 1
         snake.thumbnail((icon_width, icon_height))
 
         # Get the dimensions of the final image
-        main_height = icon_height + CARD["top"].height + CARD["bottom"].height
-        main_width = CARD["frame"].width
+        main_height = icon_height + card["top"].height + card["bottom"].height
+        main_width = card["frame"].width
 
         # Start creating the foreground
         foreground = Image.new("RGBA", (main_width, main_height), (0, 0, 0, 0))
-        foreground.paste(CARD["top"], (0, 0))
+        foreground.paste(card["top"], (0, 0))
 
         # Generate the frame borders to the correct height
         for offset in range(frame_copies):
-            position = (0, CARD["top"].height + offset * CARD["frame"].height)
-            foreground.paste(CARD["frame"], position)
+            position = (0, card["top"].height + offset * card["frame"].height)
+            foreground.paste(card["frame"], position)
 
         # Add the image and bottom part of the image
-        foreground.paste(snake, (36, CARD["top"].height))  # Also hardcoded :(
-        foreground.paste(CARD["bottom"], (0, CARD["top"].height + icon_height))
+        foreground.paste(snake, (36, card["top"].height))  # Also hardcoded :(
+        foreground.paste(card["bottom"], (0, card["top"].height + icon_height))
 
         # Setup the background
-        back = random.choice(CARD["backs"])
+        back = random.choice(card["backs"])
         back_copies = main_height // back.height + 1
         full_image = Image.new("RGBA", (main_width, main_height), (0, 0, 0, 0))
 
@@ -219,7 +265,7 @@ class Snakes(Cog):
 
         # Setup positioning variables
         margin = 36
-        offset = CARD["top"].height + icon_height + margin
+        offset = card["top"].height + icon_height + margin
 
         # Create blank rectangle image which will be behind the text
         rectangle = Image.new(
@@ -241,9 +287,9 @@ class Snakes(Cog):
         # Draw the text onto the final image
         draw = ImageDraw.Draw(full_image)
         for line in textwrap.wrap(description, 36):
-            draw.text((margin + 4, offset), line, font=CARD["font"])
+            draw.text((margin + 4, offset), line, font=card["font"])
 
-            _left, top, _right, bottom = CARD["font"].getbbox(line)
+            _left, top, _right, bottom = card["font"].getbbox(line)
             # Height of the text + 4px spacing
             offset += bottom - top + 4
 
@@ -300,7 +346,28 @@ class Snakes(Cog):
 
         return long_message
 
+    def _get_image(self, snake_info: dict[str, Any]) -> str | None:
+        """Return the first image of the snake that Discord is able to embed, if any."""
+        _iter = (
+            url
+            for url in snake_info.get("image_list", ())
+            if url.endswith(self.valid_image_extensions)
+        )
+        return next(_iter, None)
+
     async def _get_snek(self, name: str) -> dict[str, Any]:
+        """Gets the data about a snake from the cache, fetching it from Wikipedia when it's missing."""
+        if (snake_info := await self.snek_cache.get(name.lower())) is not None:
+            return snake_info
+
+        snake_info = await self._fetch_snek(name)
+
+        # Failed lookups aren't cached, so they're retried next time.
+        if snake_info and not snake_info.get("error"):
+            await self.snek_cache.set(name.lower(), snake_info, ttl=SNEK_TTL)
+        return snake_info
+
+    async def _fetch_snek(self, name: str) -> dict[str, Any]:
         """
         Fetches all the data from a wikipedia article about a snake.
 
@@ -700,17 +767,18 @@ class Snakes(Cog):
 
             while image is None:
                 snakes = [await Snake.random() for _ in range(4)]
-                snake = random.choice(snakes)
+
+                if self.guessable_snakes:
+                    # Pick a snake known to have an image, so we don't have to wait on Wikipedia.
+                    snake = random.choice(tuple(self.guessable_snakes))
+                    snakes = [name for name in snakes if name != snake][:3]
+                    snakes.insert(random.randrange(4), snake)
+                else:
+                    snake = random.choice(snakes)
                 answer = "abcd"[snakes.index(snake)]
 
                 data = await self._get_snek(snake)
-
-                _iter = (
-                    url
-                    for url in data["image_list"]
-                    if url.endswith(self.valid_image_extensions)
-                )
-                image = next(_iter, None)
+                image = self._get_image(data) if data else None
 
             embed = Embed(
                 title="Which of the following is the snake in the image?",
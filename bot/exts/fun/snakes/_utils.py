@@ -1,5 +1,4 @@
 import io
-import json
 import math
 import random
 from itertools import product
@@ -12,6 +11,8 @@ from discord.ext.commands import Cog, Context
 from pydis_core.utils.logging import get_logger
 
 from bot.constants import Emojis, MODERATION_ROLES
+from bot.utils.edit_coalescer import MessageEditCoalescer
+from bot.utils.resources import read_json
 
 SNAKE_RESOURCES = Path("bot/resources/fun/snakes").absolute()
 
@@ -117,7 +118,7 @@ ANGLE_RANGE = math.pi * 2
 
 def get_resource(file: str) -> list[dict]:
     """Load Snake resources JSON."""
-    return json.loads((SNAKE_RESOURCES / f"{file}.json").read_text("utf-8"))
+    return read_json(SNAKE_RESOURCES / f"{file}.json")
 
 
 def smoothstep(t: float) -> float:
@@ -386,6 +387,9 @@ class SnakeAndLaddersGame:
         self.avatar_images = {}
         self.board = None
         self.positions = None
+        # The positions message lists the rolls of the round, and is edited through `positions_editor`
+        self.positions_text = None
+        self.positions_editor = None
         self.rolls = []
 
     async def open_game(self) -> None:
@@ -584,23 +588,20 @@ class SnakeAndLaddersGame:
             "**Snakes and Ladders**: A new round has started! Current board:",
             file=board_file
         )
-        temp_positions = await self.channel.send(
-            f"**Current positions**:\n{player_list}\n\nUse {DICE_ROLL_EMOJI} to roll the dice!"
-        )
+        positions_text = f"**Current positions**:\n{player_list}\n\nUse {DICE_ROLL_EMOJI} to roll the dice!"
+        temp_positions = await self.channel.send(positions_text)
 
         # Delete the previous messages
         if self.board and self.positions:
             await self.board.delete()
             await self.positions.delete()
-
-        # remove the roll messages
-        for roll in self.rolls:
-            await roll.delete()
         self.rolls = []
 
         # Save new messages
         self.board = temp_board
         self.positions = temp_positions
+        self.positions_text = positions_text
+        self.positions_editor = MessageEditCoalescer(temp_positions)
 
         # Wait for rolls
         for emoji in GAME_SCREEN_EMOJI:
@@ -635,6 +636,7 @@ class SnakeAndLaddersGame:
                 return  # We're done, no reactions for the last 5 minutes
 
         # Round completed
+        await self.positions_editor.flush()
         # Check to see if the game was surrendered before completing the round, without this
         # sentinel, the game object would be deleted but the next round still posted into purgatory
         if not is_surrendered:
@@ -651,27 +653,25 @@ class SnakeAndLaddersGame:
         if self.round_has_rolled[user.id]:
             return
         roll = random.randint(1, 6)
-        self.rolls.append(await self.channel.send(f"{user.mention} rolled a **{roll}**!"))
+        roll_text = f"{user.mention} rolled a **{roll}**!"
         next_tile = self.player_tiles[user.id] + roll
 
         # apply snakes and ladders
         if next_tile in BOARD:
             target = BOARD[next_tile]
             if target < next_tile:
-                await self.channel.send(
-                    f"{user.mention} slips on a snake and falls back to **{target}**",
-                    delete_after=15
-                )
+                roll_text += f" They slip on a snake and fall back to **{target}**"
             else:
-                await self.channel.send(
-                    f"{user.mention} climbs a ladder to **{target}**",
-                    delete_after=15
-                )
+                roll_text += f" They climb a ladder to **{target}**"
             next_tile = target
 
         self.player_tiles[user.id] = min(100, next_tile)
         self.round_has_rolled[user.id] = True
 
+        # The rolls are shown on the positions message, rather than each being sent and deleted at the end of the round
+        self.rolls.append(roll_text)
+        self.positions_editor.update(content="\n".join((self.positions_text, "", *self.rolls)))
+
     async def _complete_round(self) -> None:
         """At the conclusion of a round check to see if there's been a winner."""
         self.state = "post_round"
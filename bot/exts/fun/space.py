@@ -1,5 +1,6 @@
 # XXX: Disabled due to issues with NASA API, see https://github.com/python-discord/sir-lancebot/issues/1709
 
+import asyncio
 import random
 from datetime import UTC, date, datetime
 from typing import Any
@@ -12,6 +13,7 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Tokens
+from bot.utils.caching import RedisTTLCache
 from bot.utils.converters import DateConverter
 
 logger = get_logger(__name__)
@@ -22,10 +24,23 @@ NASA_EPIC_BASE_URL = "https://epic.gsfc.nasa.gov"
 
 APOD_MIN_DATE = date(1995, 6, 16)
 
+# Results for past dates never change so they are kept forever, while today's may still be updated.
+# This is a bit longer than the `get_rovers` interval, so prefetched data doesn't expire before it's refreshed.
+TODAY_TTL = 90 * 60
+
 
 class Space(Cog):
     """Space Cog contains commands, that show images, facts or other information about space."""
 
+    # RedisTTLCache[apod_date, dict]
+    apod_cache = RedisTTLCache()
+
+    # RedisTTLCache[epic_date, list[dict]]
+    epic_cache = RedisTTLCache()
+
+    # RedisTTLCache[f"{rover}:{sol or earth_date}", list[dict]]
+    mars_cache = RedisTTLCache()
+
     def __init__(self, bot: Bot):
         self.http_session = bot.http_session
         self.bot = bot
@@ -37,17 +52,109 @@ class Space(Cog):
         """Cancel `get_rovers` task when Cog will unload."""
         self.get_rovers.cancel()
 
-    @tasks.loop(hours=24)
+    @tasks.loop(hours=1)
     async def get_rovers(self) -> None:
-        """Get listing of rovers from NASA API and info about their start and end dates."""
+        """
+        Get listing of rovers from NASA API and info about their start and end dates.
+
+        Today's APOD, EPIC images and the photos of each active rover's latest sol are prefetched
+        alongside, so those are served from the cache.
+        """
         data = await self.fetch_from_nasa("mars-photos/api/v1/rovers")
 
         for rover in data["rovers"]:
             self.rovers[rover["name"].lower()] = {
                 "min_date": rover["landing_date"],
                 "max_date": rover["max_date"],
-                "max_sol": rover["max_sol"]
+                "max_sol": rover["max_sol"],
+                "active": rover["status"] == "active",
+            }
+
+        results = await asyncio.gather(
+            self.get_apod(None, refresh=True),
+            self.get_epic_images(None, refresh=True),
+            *(
+                self.get_mars_photos(name, rover["max_sol"], refresh=True)
+                for name, rover in self.rovers.items()
+                if rover["active"]
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to prefetch today's NASA data: {result}")
+
+    @staticmethod
+    def _ttl_for(day: date | None) -> int | None:
+        """Return how long results for `day` should be cached for, None meaning forever."""
+        if day is not None and day < datetime.now(tz=UTC).date():
+            return None
+        return TODAY_TTL
+
+    async def get_apod(self, apod_date: date | None, *, refresh: bool = False) -> dict[str, Any]:
+        """Get the Astronomy Picture of the Day for `apod_date`, or today if it is None."""
+        key = apod_date.isoformat() if apod_date else "today"
+        if not refresh and (cached := await self.apod_cache.get(key)):
+            return cached
+
+        params = {"date": apod_date.isoformat()} if apod_date else {}
+        result = await self.fetch_from_nasa("planetary/apod", params)
+
+        apod = {"date": result["date"], "explanation": result["explanation"], "url": result["url"]}
+        await self.apod_cache.set(key, apod, ttl=self._ttl_for(apod_date))
+        return apod
+
+    async def get_epic_images(self, epic_date: date | None, *, refresh: bool = False) -> list[dict[str, Any]]:
+        """Get the EPIC images of the Earth taken on `epic_date`, or the most recent ones if it is None."""
+        key = epic_date.isoformat() if epic_date else "latest"
+        if not refresh and (cached := await self.epic_cache.get(key)) is not None:
+            return cached
+
+        # Don't use API key, no need for this.
+        data = await self.fetch_from_nasa(
+            f"api/natural{f'/date/{epic_date.isoformat()}' if epic_date else ''}",
+            base=NASA_EPIC_BASE_URL,
+            use_api_key=False
+        )
+        images = [
+            {"date": item["date"], "image": item["image"], "caption": item["caption"], "identifier": item["identifier"]}
+            for item in data
+        ]
+
+        # Images of a date may not have been published yet, so don't keep an empty result forever.
+        ttl = self._ttl_for(epic_date) if images else TODAY_TTL
+        await self.epic_cache.set(key, images, ttl=ttl)
+        return images
+
+    async def get_mars_photos(
+        self, rover: str, date: int | datetime, *, refresh: bool = False
+    ) -> list[dict[str, Any]]:
+        """Get the photos taken by `rover` on `date`, which is either a SOL or an earth date."""
+        if isinstance(date, int):
+            params = {"sol": date}
+            is_latest = date >= self.rovers[rover]["max_sol"]
+        else:
+            params = {"earth_date": date.date().isoformat()}
+            is_latest = params["earth_date"] >= self.rovers[rover]["max_date"]
+
+        key = f"{rover}:{next(iter(params.values()))}"
+        if not refresh and (cached := await self.mars_cache.get(key)) is not None:
+            return cached
+
+        result = await self.fetch_from_nasa(f"mars-photos/api/v1/rovers/{rover}/photos", params)
+        photos = [
+            {
+                "rover": {"name": photo["rover"]["name"]},
+                "camera": {"full_name": photo["camera"]["full_name"]},
+                "img_src": photo["img_src"],
             }
+            for photo in result["photos"]
+        ]
+
+        # Rovers may still be sending photos of their latest day, so only older ones are kept forever.
+        ttl = TODAY_TTL if is_latest or not photos else None
+        await self.mars_cache.set(key, photos, ttl=ttl)
+        return photos
 
     @group(name="space", invoke_without_command=True)
     async def space(self, ctx: Context) -> None:
@@ -61,8 +168,8 @@ class Space(Cog):
 
         If date is not specified, this will get today APOD.
         """
-        params = {}
-        # Parse date to params, when provided. Show error message when invalid formatting
+        apod_date = None
+        # Parse date, when provided. Show error message when invalid formatting
         if date:
             try:
                 apod_date = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=UTC).date()
@@ -75,9 +182,7 @@ class Space(Cog):
                 await ctx.send(f"Date must be between {APOD_MIN_DATE.isoformat()} and {now.isoformat()} (today).")
                 return
 
-            params["date"] = apod_date.isoformat()
-
-        result = await self.fetch_from_nasa("planetary/apod", params)
+        result = await self.get_apod(apod_date)
 
         await ctx.send(
             embed=self.create_nasa_embed(
@@ -117,19 +222,14 @@ class Space(Cog):
         """Get a random image of the Earth from the NASA EPIC API. Support date parameter, format is YYYY-MM-DD."""
         if date:
             try:
-                show_date = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=UTC).date().isoformat()
+                show_date = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=UTC).date()
             except ValueError:
                 await ctx.send(f"Invalid date {date}. Please make sure your date is in format YYYY-MM-DD.")
                 return
         else:
             show_date = None
 
-        # Don't use API key, no need for this.
-        data = await self.fetch_from_nasa(
-            f"api/natural{f'/date/{show_date}' if show_date else ''}",
-            base=NASA_EPIC_BASE_URL,
-            use_api_key=False
-        )
+        data = await self.get_epic_images(show_date)
         if len(data) < 1:
             await ctx.send("Can't find any images in this date.")
             return
@@ -169,14 +269,8 @@ class Space(Cog):
         if date is None:
             date = random.randint(0, self.rovers[rover]["max_sol"])
 
-        params = {}
-        if isinstance(date, int):
-            params["sol"] = date
-        else:
-            params["earth_date"] = date.date().isoformat()
-
-        result = await self.fetch_from_nasa(f"mars-photos/api/v1/rovers/{rover}/photos", params)
-        if len(result["photos"]) < 1:
+        photos = await self.get_mars_photos(rover, date)
+        if len(photos) < 1:
             err_msg = (
                 f"We can't find result in date "
                 f"{date.date().isoformat() if isinstance(date, datetime) else f'{date} SOL'}.\n"
@@ -186,7 +280,7 @@ class Space(Cog):
             await ctx.send(err_msg)
             return
 
-        item = random.choice(result["photos"])
+        item = random.choice(photos)
         await ctx.send(
             embed=self.create_nasa_embed(
                 f"{item['rover']['name']}'s {item['camera']['full_name']} Mars Image", "", item["img_src"],
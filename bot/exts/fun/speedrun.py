@@ -1,15 +1,14 @@
-import json
-from pathlib import Path
 from random import choice
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-LINKS = json.loads(Path("bot/resources/fun/speedrun_links.json").read_text("utf8"))
+LINKS = Resource("bot/resources/fun/speedrun_links.json")
 
 
 class Speedrun(commands.Cog):
@@ -18,7 +17,7 @@ class Speedrun(commands.Cog):
     @commands.command(name="speedrun")
     async def get_speedrun(self, ctx: commands.Context) -> None:
         """Sends a link to a video of a random speedrun."""
-        await ctx.send(choice(LINKS))
+        await ctx.send(choice(LINKS()))
 
 
 async def setup(bot: Bot) -> None:
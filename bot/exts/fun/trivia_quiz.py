@@ -1,5 +1,4 @@
 import asyncio
-import json
 import operator
 import random
 import re
@@ -8,7 +7,6 @@ from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 
 import discord
 from discord.ext import commands, tasks
@@ -17,6 +15,7 @@ from rapidfuzz import fuzz
 
 from bot.bot import Bot
 from bot.constants import Client, Colours, MODERATION_ROLES, NEGATIVE_REPLIES
+from bot.utils.resources import Resource
 
 logger = get_logger(__name__)
 
@@ -26,6 +25,8 @@ DYNAMICALLY_GEN_VARIATION_TOLERANCE = 97
 
 MAX_ERROR_FETCH_TRIES = 3
 
+QUESTIONS = Resource("bot/resources/fun/trivia_quiz.json")
+
 WRONG_ANS_RESPONSE = [
     "No one answered correctly!",
     "Better luck next time...",
@@ -297,9 +298,8 @@ class TriviaQuiz(commands.Cog):
     @staticmethod
     def load_questions() -> dict:
         """Load the questions from the JSON file."""
-        p = Path("bot", "resources", "fun", "trivia_quiz.json")
-
-        return json.loads(p.read_text(encoding="utf-8"))
+        # Copied, since the dynamically generated categories are added to it
+        return dict(QUESTIONS())
 
     @commands.group(name="quiz", aliases=("trivia", "triviaquiz"), invoke_without_command=True)
     async def quiz_game(self, ctx: commands.Context, category: str | None, questions: int | None) -> None:
@@ -1,22 +1,16 @@
 import random
-from pathlib import Path
 
-import yaml
 from discord.ext.commands import Cog, Context, command
 
 from bot.bot import Bot
+from bot.utils.resources import Resource, read_yaml
+
+WORDS = Resource("bot/resources/fun/wonder_twins.yaml", read_yaml)
 
 
 class WonderTwins(Cog):
     """Cog for a Wonder Twins inspired command."""
 
-    def __init__(self):
-        with open(Path.cwd() / "bot" / "resources" / "fun" / "wonder_twins.yaml", encoding="utf-8") as f:
-            info = yaml.safe_load(f)
-            self.water_types = info["water_types"]
-            self.objects = info["objects"]
-            self.adjectives = info["adjectives"]
-
     @staticmethod
     def append_onto(phrase: str, insert_word: str) -> str:
         """Appends one word onto the end of another phrase in order to format with the proper determiner."""
@@ -30,9 +24,10 @@ class WonderTwins(Cog):
 
     def format_phrase(self) -> str:
         """Creates a transformation phrase from available words."""
-        adjective = random.choice((None, random.choice(self.adjectives)))
-        object_name = random.choice(self.objects)
-        water_type = random.choice(self.water_types)
+        words = WORDS()
+        adjective = random.choice((None, random.choice(words["adjectives"])))
+        object_name = random.choice(words["objects"])
+        water_type = random.choice(words["water_types"])
 
         if adjective:
             object_name = self.append_onto(adjective, object_name)
@@ -1,43 +1,170 @@
+import asyncio
+import json
+import math
 import re
+from collections import Counter, defaultdict
 from random import randint
 
 import discord
+from async_rediscache import RedisCache
 from discord import Embed, ui
 from discord.ext import tasks
-from discord.ext.commands import Cog, Context, command
+from discord.ext.commands import Cog, Context, group
+from pydis_core.utils import scheduling
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils.pagination import LinePaginator
 
 log = get_logger(__name__)
 
 COMIC_FORMAT = re.compile(r"latest|[0-9]+")
 BASE_URL = "https://xkcd.com"
 
+# Seconds to wait between fetching comics while backfilling the index, to go easy on xkcd.com
+BACKFILL_DELAY = 1
+
+# Comic #404 famously doesn't exist
+MISSING_COMICS = {404}
+
+# Matches in a comic's title count for more than matches in its alt text or transcript
+FIELD_WEIGHTS = {"safe_title": 3, "alt": 1, "transcript": 1}
+WORD_REGEX = re.compile(r"[a-z0-9']+")
+MAX_SEARCH_RESULTS = 25
+
+
+class ComicIndex:
+    """An in-memory inverted index over the titles, alt texts and transcripts of xkcd comics."""
+
+    def __init__(self):
+        self.comics: dict[int, dict] = {}
+        # Maps a word to the weighted number of times it appears in each comic
+        self._postings: defaultdict[str, Counter[int]] = defaultdict(Counter)
+
+    def __contains__(self, num: int) -> bool:
+        return num in self.comics
+
+    def __len__(self) -> int:
+        return len(self.comics)
+
+    @staticmethod
+    def _tokenize(text: str) -> list[str]:
+        return WORD_REGEX.findall(text.lower())
+
+    def add(self, info: dict) -> None:
+        """Add a comic's information to the index."""
+        num = info["num"]
+        for field, weight in FIELD_WEIGHTS.items():
+            for word in self._tokenize(info.get(field, "")):
+                self._postings[word][num] += weight
+
+        # The transcript is only needed for searching, so there's no need to keep it around.
+        self.comics[num] = {key: value for key, value in info.items() if key != "transcript"}
+
+    def search(self, query: str) -> list[dict]:
+        """Return the comics matching `query`, ranked by TF-IDF, with the best matches first."""
+        scores = Counter()
+        for word in set(self._tokenize(query)):
+            postings = self._postings.get(word)
+            if not postings:
+                continue
+
+            idf = math.log(len(self.comics) / len(postings)) + 1
+            for num, frequency in postings.items():
+                scores[num] += frequency * idf
+
+        return [self.comics[num] for num, _ in scores.most_common(MAX_SEARCH_RESULTS)]
+
 
 class XKCD(Cog):
     """Retrieving XKCD comics."""
 
+    # RedisCache[comic_num, json_info]
+    comics = RedisCache()
+
     def __init__(self, bot: Bot):
         self.bot = bot
         self.latest_comic_info: dict[str, str | int] = {}
+        self.index = ComicIndex()
+        self.backfill_task: asyncio.Task | None = None
+
+    async def cog_load(self) -> None:
+        """Load the comics stored from previous runs into the index, and start syncing new ones."""
+        for _, info in await self.comics.items():
+            self.index.add(json.loads(info))
+        log.info(f"Loaded {len(self.index)} xkcd comics into the index.")
+
         self.get_latest_comic_info.start()
 
     def cog_unload(self) -> None:
-        """Cancels refreshing of the task for refreshing the most recent comic info."""
+        """Cancels refreshing of the task for refreshing the most recent comic info, and any running backfill."""
         self.get_latest_comic_info.cancel()
+        if self.backfill_task:
+            self.backfill_task.cancel()
 
     @tasks.loop(minutes=30)
     async def get_latest_comic_info(self) -> None:
-        """Refreshes latest comic's information ever 30 minutes. Also used for finding a random comic."""
+        """
+        Refreshes latest comic's information ever 30 minutes. Also used for finding a random comic.
+
+        Any comics which are missing from the index, including those published since the last refresh,
+        are then fetched in the background.
+        """
         async with self.bot.http_session.get(f"{BASE_URL}/info.0.json") as resp:
             if resp.status == 200:
                 self.latest_comic_info = await resp.json()
             else:
                 log.debug(f"Failed to get latest XKCD comic information. Status code {resp.status}")
+                return
 
-    @command(name="xkcd")
+        await self.store_comic(self.latest_comic_info)
+
+        if self.backfill_task is None or self.backfill_task.done():
+            self.backfill_task = scheduling.create_task(self.backfill_index())
+
+    async def backfill_index(self) -> None:
+        """
+        Fetch every comic missing from the index, one at a time.
+
+        Comics are persisted as soon as they're fetched, so this picks up where it left off after a restart.
+        """
+        missing = [
+            num for num in range(1, self.latest_comic_info["num"] + 1)
+            if num not in self.index and num not in MISSING_COMICS
+        ]
+        if not missing:
+            return
+
+        log.info(f"Backfilling {len(missing)} xkcd comics into the index.")
+        for num in missing:
+            await self.fetch_comic(num)
+            await asyncio.sleep(BACKFILL_DELAY)
+        log.info(f"Finished backfilling the xkcd index, which now holds {len(self.index)} comics.")
+
+    async def store_comic(self, info: dict) -> None:
+        """Persist a comic's information and add it to the index, unless it's already indexed."""
+        if info["num"] in self.index:
+            return
+
+        await self.comics.set(info["num"], json.dumps(info))
+        self.index.add(info)
+
+    async def fetch_comic(self, num: int) -> dict | int:
+        """Get a comic's information, fetching it from xkcd.com if it isn't indexed. Returns the status on failure."""
+        if num in self.index:
+            return self.index.comics[num]
+
+        async with self.bot.http_session.get(f"{BASE_URL}/{num}/info.0.json") as resp:
+            if resp.status != 200:
+                log.debug(f"Retrieving xkcd comic #{num} failed with status code {resp.status}.")
+                return resp.status
+            info = await resp.json()
+
+        await self.store_comic(info)
+        return self.index.comics[num]
+
+    @group(name="xkcd", invoke_without_command=True)
     async def fetch_xkcd_comics(self, ctx: Context, comic: str | None) -> None:
         """
         Getting an xkcd comic's information along with the image.
@@ -58,21 +185,36 @@ class XKCD(Cog):
         if comic == "latest":
             info = self.latest_comic_info
         else:
-            async with self.bot.http_session.get(f"{BASE_URL}/{comic}/info.0.json") as resp:
-                if resp.status == 200:
-                    info = await resp.json()
-                else:
-                    embed.title = f"XKCD comic #{comic}"
-                    embed.description = f"{resp.status}: Could not retrieve xkcd comic #{comic}."
-                    log.debug(f"Retrieving xkcd comic #{comic} failed with status code {resp.status}.")
-                    await ctx.send(embed=embed)
-                    return
+            info = await self.fetch_comic(int(comic))
+            if isinstance(info, int):
+                embed.title = f"XKCD comic #{comic}"
+                embed.description = f"{info}: Could not retrieve xkcd comic #{comic}."
+                await ctx.send(embed=embed)
+                return
 
         date = f"{info['year']}/{info['month']}/{info['day']}"
         view = self._build_comic_view(info["num"], info["safe_title"], info["img"], info["alt"], date)
 
         await ctx.send(view=view)
 
+    @fetch_xkcd_comics.command(name="search", aliases=("s", "find"))
+    async def search_xkcd_comics(self, ctx: Context, *, terms: str) -> None:
+        """Search the titles, alt texts and transcripts of xkcd comics."""
+        results = self.index.search(terms)
+
+        if not results:
+            embed = Embed(
+                title="No comics found",
+                description=f"No indexed xkcd comics match `{terms}`.",
+                colour=Colours.soft_red,
+            )
+            await ctx.send(embed=embed)
+            return
+
+        lines = [f"[#{info['num']} — {info['safe_title']}]({BASE_URL}/{info['num']})" for info in results]
+        embed = Embed(title=f"XKCD comics matching '{terms}'", colour=Colours.soft_green)
+        await LinePaginator.paginate(lines, ctx, embed, max_lines=10, empty=False)
+
     @staticmethod
     def _build_comic_view(num: int, title: str, image_url: str, alt_text: str, date: str) -> ui.LayoutView:
         """Build a layout view to display the comic, if possible."""
@@ -1,13 +1,11 @@
-import json
-from pathlib import Path
-
 from discord import Embed
 from discord.ext import commands
 
 from bot.bot import Bot
 from bot.utils.randomization import RandomCycle
+from bot.utils.resources import Resource
 
-EMBED_DATA = RandomCycle(json.loads(Path("bot/resources/holidays/earth_day/save_the_planet.json").read_text("utf8")))
+EMBED_DATA = Resource("bot/resources/holidays/earth_day/save_the_planet.json", parse=RandomCycle)
 
 
 class SaveThePlanet(commands.Cog):
@@ -16,7 +14,7 @@ class SaveThePlanet(commands.Cog):
     @commands.command(aliases=("savetheearth", "saveplanet", "saveearth"))
     async def savetheplanet(self, ctx: commands.Context) -> None:
         """Responds with a random tip on how to be eco-friendly and help our planet."""
-        return_embed = Embed.from_dict(next(EMBED_DATA))
+        return_embed = Embed.from_dict(next(EMBED_DATA()))
         await ctx.send(embed=return_embed)
 
 
@@ -1,15 +1,14 @@
 import random
-from json import loads
-from pathlib import Path
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-ALL_VIDS = loads(Path("bot/resources/holidays/easter/april_fools_vids.json").read_text("utf-8"))
+ALL_VIDS = Resource("bot/resources/holidays/easter/april_fools_vids.json")
 
 
 class AprilFoolVideos(commands.Cog):
@@ -18,7 +17,7 @@ class AprilFoolVideos(commands.Cog):
     @commands.command(name="fool")
     async def april_fools(self, ctx: commands.Context) -> None:
         """Get a random April Fools' video from Youtube."""
-        video = random.choice(ALL_VIDS)
+        video = random.choice(ALL_VIDS())
 
         channel, url = video["channel"], video["url"]
 
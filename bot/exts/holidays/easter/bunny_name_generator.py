@@ -1,16 +1,15 @@
-import json
 import random
 import re
-from pathlib import Path
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-BUNNY_NAMES = json.loads(Path("bot/resources/holidays/easter/bunny_names.json").read_text("utf8"))
+BUNNY_NAMES = Resource("bot/resources/holidays/easter/bunny_names.json")
 
 
 class BunnyNameGenerator(commands.Cog):
@@ -59,7 +58,7 @@ class BunnyNameGenerator(commands.Cog):
     @commands.command()
     async def bunnyname(self, ctx: commands.Context) -> None:
         """Picks a random bunny name from a JSON file."""
-        await ctx.send(random.choice(BUNNY_NAMES["names"]))
+        await ctx.send(random.choice(BUNNY_NAMES()["names"]))
 
     @commands.command()
     async def bunnifyme(self, ctx: commands.Context) -> None:
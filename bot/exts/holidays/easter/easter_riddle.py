@@ -1,6 +1,4 @@
 import random
-from json import loads
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -8,10 +6,11 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours, NEGATIVE_REPLIES
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-RIDDLE_QUESTIONS = loads(Path("bot/resources/holidays/easter/easter_riddle.json").read_text("utf8"))
+RIDDLE_QUESTIONS = Resource("bot/resources/holidays/easter/easter_riddle.json")
 
 TIMELIMIT = 10
 
@@ -47,7 +46,7 @@ class EasterRiddle(commands.Cog):
 
         self.current_channel = ctx.channel
 
-        random_question = random.choice(RIDDLE_QUESTIONS)
+        random_question = random.choice(RIDDLE_QUESTIONS())
         question = random_question["question"]
         hints = random_question["riddles"]
         correct = random_question["correct_answer"]
@@ -1,4 +1,3 @@
-import json
 import random
 from contextlib import suppress
 from io import BytesIO
@@ -11,12 +10,13 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.utils import helpers
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-HTML_COLOURS = json.loads(Path("bot/resources/fun/html_colours.json").read_text("utf8"))
+HTML_COLOURS = Resource("bot/resources/fun/html_colours.json")
 
-XKCD_COLOURS = json.loads(Path("bot/resources/fun/xkcd_colours.json").read_text("utf8"))
+XKCD_COLOURS = Resource("bot/resources/fun/xkcd_colours.json")
 
 COLOURS = [
     (255, 0, 0, 255), (255, 128, 0, 255), (255, 255, 0, 255), (0, 255, 0, 255),
@@ -35,9 +35,9 @@ class EggDecorating(commands.Cog):
     def replace_invalid(colour: str) -> int | None:
         """Attempts to match with HTML or XKCD colour names, returning the int value."""
         with suppress(KeyError):
-            return int(HTML_COLOURS[colour], 16)
+            return int(HTML_COLOURS()[colour], 16)
         with suppress(KeyError):
-            return int(XKCD_COLOURS[colour], 16)
+            return int(XKCD_COLOURS()[colour], 16)
         return None
 
     @commands.command(aliases=("decorateegg",))
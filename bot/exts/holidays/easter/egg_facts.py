@@ -1,6 +1,4 @@
 import random
-from json import loads
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -9,10 +7,11 @@ from pydis_core.utils.logging import get_logger
 from bot.bot import Bot
 from bot.constants import Channels, Colours, Month
 from bot.utils.decorators import seasonal_task
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-EGG_FACTS = loads(Path("bot/resources/holidays/easter/easter_egg_facts.json").read_text("utf8"))
+EGG_FACTS = Resource("bot/resources/holidays/easter/easter_egg_facts.json")
 
 
 class EasterFacts(commands.Cog):
@@ -44,7 +43,7 @@ class EasterFacts(commands.Cog):
         return discord.Embed(
             colour=Colours.soft_red,
             title="Easter Egg Fact",
-            description=random.choice(EGG_FACTS)
+            description=random.choice(EGG_FACTS())
         )
 
 
@@ -1,7 +1,5 @@
 import asyncio
 import random
-from json import loads
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -9,10 +7,11 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-EGGHEAD_QUESTIONS = loads(Path("bot/resources/holidays/easter/egghead_questions.json").read_text("utf8"))
+EGGHEAD_QUESTIONS = Resource("bot/resources/holidays/easter/egghead_questions.json")
 
 
 EMOJIS = [
@@ -40,7 +39,7 @@ class EggheadQuiz(commands.Cog):
 
         Also informs of the percentages and votes of each option
         """
-        random_question = random.choice(EGGHEAD_QUESTIONS)
+        random_question = random.choice(EGGHEAD_QUESTIONS())
         question, answers = random_question["question"], random_question["answers"]
         answers = [(EMOJIS[i], a) for i, a in enumerate(answers)]
         correct = EMOJIS[random_question["correct_answer"]]
@@ -1,15 +1,14 @@
-import json
 import random
-from pathlib import Path
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-traditions = json.loads(Path("bot/resources/holidays/easter/traditions.json").read_text("utf8"))
+TRADITIONS = Resource("bot/resources/holidays/easter/traditions.json")
 
 
 class Traditions(commands.Cog):
@@ -18,6 +17,7 @@ class Traditions(commands.Cog):
     @commands.command(aliases=("eastercustoms",))
     async def easter_tradition(self, ctx: commands.Context) -> None:
         """Responds with a random tradition or custom."""
+        traditions = TRADITIONS()
         random_country = random.choice(list(traditions))
 
         await ctx.send(f"{random_country}:\n{traditions[random_country]}")
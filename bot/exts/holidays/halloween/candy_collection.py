@@ -8,6 +8,9 @@ from pydis_core.utils.logging import get_logger
 from bot.bot import Bot
 from bot.constants import Channels, Month
 from bot.utils.decorators import in_month
+from bot.utils.leaderboard import RedisLeaderboard
+from bot.utils.message_router import message_handler
+from bot.utils.recent_messages import RecentMessages
 
 log = get_logger(__name__)
 
@@ -17,6 +20,9 @@ ADD_CANDY_EXISTING_REACTION_CHANCE = 10  # 10%
 ADD_SKULL_REACTION_CHANCE = 50  # 2%
 ADD_SKULL_EXISTING_REACTION_CHANCE = 20  # 5%
 
+# Reactions to any of this many of the latest messages have a higher chance of adding candy
+RECENT_MESSAGES = 10
+
 EMOJIS = {
     "CANDY": "\N{CANDY}",
     "SKULL": "\N{SKULL}",
@@ -34,6 +40,9 @@ class CandyCollection(commands.Cog):
     """Candy collection game Cog."""
 
     # User candy amount records
+    candy_scores = RedisLeaderboard()
+
+    # Where candy records were kept before the leaderboard, only read to migrate them
     candy_records = RedisCache()
 
     # Candy and skull messages mapping
@@ -42,20 +51,19 @@ class CandyCollection(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        self.recent_messages = RecentMessages(size=RECENT_MESSAGES)
 
-    @in_month(Month.OCTOBER)
-    @commands.Cog.listener()
+    async def cog_load(self) -> None:
+        """Move any candy records from before the leaderboard into it."""
+        await self.candy_scores.migrate_from(self.candy_records)
+
+    @message_handler(channels={Channels.sir_lancebot_playground}, months={Month.OCTOBER}, allow_bots=True)
     async def on_message(self, message: discord.Message) -> None:
         """Randomly adds candy or skull reaction to non-bot messages in the Event channel."""
-        # Ignore messages in DMs
-        if not message.guild:
-            return
+        self.recent_messages.add(message)
         # make sure its a human message
         if message.author.bot:
             return
-        # ensure it's hacktober channel
-        if message.channel.id != Channels.sir_lancebot_playground:
-            return
 
         # do random check for skull first as it has the lower chance
         if random.randint(1, ADD_SKULL_REACTION_CHANCE) == 1:
@@ -87,24 +95,22 @@ class CandyCollection(commands.Cog):
             if message.author.bot:
                 return
 
-            recent_message_ids = [message.id async for message in self.hacktober_channel.history(limit=10)]
-            if message.id in recent_message_ids:
+            # Only the messages sent before the bot started listening need to be fetched
+            await self.recent_messages.seed(message.channel)
+            if self.recent_messages.is_recent(message.channel.id, message.id):
                 await self.reacted_msg_chance(message)
             return
 
         if await self.candy_messages.get(message.id) == "candy" and str(reaction.emoji) == EMOJIS["CANDY"]:
             await self.candy_messages.delete(message.id)
-            if await self.candy_records.contains(user.id):
-                await self.candy_records.increment(user.id)
-            else:
-                await self.candy_records.set(user.id, 1)
+            await self.candy_scores.increment(user.id)
 
         elif await self.skull_messages.get(message.id) == "skull" and str(reaction.emoji) == EMOJIS["SKULL"]:
             await self.skull_messages.delete(message.id)
 
-            if prev_record := await self.candy_records.get(user.id):
+            if prev_record := int(await self.candy_scores.get(user.id, default=0)):
                 lost = min(random.randint(1, 3), prev_record)
-                await self.candy_records.decrement(user.id, lost)
+                await self.candy_scores.increment(user.id, -lost)
 
                 if lost == prev_record:
                     await CandyCollection.send_spook_msg(user, message.channel, "all of your")
@@ -117,6 +123,19 @@ class CandyCollection(commands.Cog):
 
         await reaction.clear()
 
+    @in_month(Month.OCTOBER)
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """Stop counting deleted messages among the recent messages of their channel."""
+        self.recent_messages.remove(payload.channel_id, payload.message_id)
+
+    @in_month(Month.OCTOBER)
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent) -> None:
+        """Stop counting bulk deleted messages among the recent messages of their channel."""
+        for message_id in payload.message_ids:
+            self.recent_messages.remove(payload.channel_id, message_id)
+
     async def reacted_msg_chance(self, message: discord.Message) -> None:
         """
         Randomly add a skull or candy reaction to a message if there is a reaction there already.
@@ -132,11 +151,6 @@ class CandyCollection(commands.Cog):
             await self.candy_messages.set(message.id, "candy")
             await message.add_reaction(EMOJIS["CANDY"])
 
-    @property
-    def hacktober_channel(self) -> discord.TextChannel:
-        """Get #hacktoberbot channel from its ID."""
-        return self.bot.get_channel(Channels.sir_lancebot_playground)
-
     @staticmethod
     async def send_spook_msg(
         author: discord.Member, channel: discord.TextChannel, candies: str | int
@@ -168,26 +182,19 @@ class CandyCollection(commands.Cog):
     @commands.command()
     async def candy(self, ctx: commands.Context) -> None:
         """Get the candy leaderboard and save to JSON."""
-        records = await self.candy_records.items()
+        top_five = await self.candy_scores.top(5, min_score=0)
+        author_score = int(await self.candy_scores.get(ctx.author.id, default=0))
+        author_rank = await self.candy_scores.rank(ctx.author.id) if author_score > 0 else None
 
         def generate_leaderboard() -> str:
-            top_sorted = sorted(
-                ((user_id, score) for user_id, score in records if score > 0),
-                key=lambda x: x[1],
-                reverse=True
-            )
-            top_five = top_sorted[:5]
-
             return "\n".join(
-                f"{EMOJIS['MEDALS'][index]} <@{record[0]}>: {record[1]}"
-                for index, record in enumerate(top_five)
+                f"{EMOJIS['MEDALS'][index]} <@{user_id}>: {int(score)}"
+                for index, (user_id, score) in enumerate(top_five)
             ) if top_five else "No Candies"
 
         def get_user_candy_score() -> str:
-            for user_id, score in records:
-                if user_id == ctx.author.id:
-                    return f"{ctx.author.mention}: {score}"
-            return f"{ctx.author.mention}: 0"
+            rank = f" (#{author_rank})" if author_rank else ""
+            return f"{ctx.author.mention}: {author_score}{rank}"
 
         e = discord.Embed(colour=discord.Colour.og_blurple())
         e.add_field(
@@ -1,16 +1,15 @@
 import asyncio
-import json
 import random
-from pathlib import Path
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-RESPONSES = json.loads(Path("bot/resources/holidays/halloween/responses.json").read_text("utf8"))
+RESPONSES = Resource("bot/resources/holidays/halloween/responses.json")
 
 
 class SpookyEightBall(commands.Cog):
@@ -19,7 +18,7 @@ class SpookyEightBall(commands.Cog):
     @commands.command(aliases=("spooky8ball",))
     async def spookyeightball(self, ctx: commands.Context, *, question: str) -> None:
         """Responds with a random response to a question."""
-        choice = random.choice(RESPONSES["responses"])
+        choice = random.choice(RESPONSES()["responses"])
         msg = await ctx.send(choice[0])
         if len(choice) > 1:
             await asyncio.sleep(random.randint(2, 5))
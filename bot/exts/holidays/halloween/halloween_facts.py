@@ -1,13 +1,12 @@
-import json
 import random
 from datetime import timedelta
-from pathlib import Path
 
 import discord
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
@@ -24,8 +23,7 @@ SPOOKY_EMOJIS = [
 PUMPKIN_ORANGE = 0xFF7518
 INTERVAL = timedelta(hours=6).total_seconds()
 
-FACTS = json.loads(Path("bot/resources/holidays/halloween/halloween_facts.json").read_text("utf8"))
-FACTS = list(enumerate(FACTS))
+FACTS = Resource("bot/resources/holidays/halloween/halloween_facts.json", parse=lambda facts: list(enumerate(facts)))
 
 
 class HalloweenFacts(commands.Cog):
@@ -33,7 +31,7 @@ class HalloweenFacts(commands.Cog):
 
     def random_fact(self) -> tuple[int, str]:
         """Return a random fact from the loaded facts."""
-        return random.choice(FACTS)
+        return random.choice(FACTS())
 
     @commands.command(name="spookyfact", aliases=("halloweenfact",), brief="Get the most recent Halloween fact")
     async def get_random_fact(self, ctx: commands.Context) -> None:
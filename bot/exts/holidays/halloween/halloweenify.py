@@ -1,5 +1,3 @@
-from json import loads
-from pathlib import Path
 from random import choice
 
 import discord
@@ -9,10 +7,11 @@ from discord.ext.commands import BucketType
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-HALLOWEENIFY_DATA = loads(Path("bot/resources/holidays/halloween/halloweenify.json").read_text("utf8"))
+HALLOWEENIFY_DATA = Resource("bot/resources/holidays/halloween/halloweenify.json")
 
 
 class Halloweenify(commands.Cog):
@@ -24,7 +23,7 @@ class Halloweenify(commands.Cog):
         """Change your nickname into a much spookier one!"""
         async with ctx.typing():
             # Choose a random character from our list we loaded above and set apart the nickname and image url.
-            character = choice(HALLOWEENIFY_DATA["characters"])
+            character = choice(HALLOWEENIFY_DATA()["characters"])
             nickname = "".join(nickname for nickname in character)
             image = "".join(character[nickname] for nickname in character)
 
@@ -1,6 +1,4 @@
-import json
 import random
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -8,12 +6,12 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-TEXT_OPTIONS = json.loads(
-    Path("bot/resources/holidays/halloween/monster.json").read_text("utf8")
-)  # Data for a mad-lib style generation of text
+# Data for a mad-lib style generation of text
+TEXT_OPTIONS = Resource("bot/resources/holidays/halloween/monster.json")
 
 
 class MonsterBio(commands.Cog):
@@ -21,8 +19,8 @@ class MonsterBio(commands.Cog):
 
     def generate_name(self, seeded_random: random.Random) -> str:
         """Generates a name (for either monster species or monster name)."""
-        n_candidate_strings = seeded_random.randint(2, len(TEXT_OPTIONS["monster_type"]))
-        return "".join(seeded_random.choice(TEXT_OPTIONS["monster_type"][i]) for i in range(n_candidate_strings))
+        n_candidate_strings = seeded_random.randint(2, len(TEXT_OPTIONS()["monster_type"]))
+        return "".join(seeded_random.choice(TEXT_OPTIONS()["monster_type"][i]) for i in range(n_candidate_strings))
 
     @commands.command(brief="Sends your monster bio!")
     async def monsterbio(self, ctx: commands.Context) -> None:
@@ -31,13 +29,13 @@ class MonsterBio(commands.Cog):
 
         name = self.generate_name(seeded_random)
         species = self.generate_name(seeded_random)
-        biography_text = seeded_random.choice(TEXT_OPTIONS["biography_text"])
+        biography_text = seeded_random.choice(TEXT_OPTIONS()["biography_text"])
         words = {"monster_name": name, "monster_species": species}
         for key, value in biography_text.items():
             if key == "text":
                 continue
 
-            options = seeded_random.sample(TEXT_OPTIONS[key], value)
+            options = seeded_random.sample(TEXT_OPTIONS()[key], value)
             words[key] = " ".join(options)
 
         embed = discord.Embed(
@@ -1,11 +1,15 @@
-import json
-import pathlib
+import asyncio
+from collections import Counter
 
+from async_rediscache import RedisCache
 from discord import Embed
 from discord.ext import commands
 from discord.ext.commands import Bot, Cog, Context
+from pydis_core.utils import scheduling
 from pydis_core.utils.logging import get_logger
 
+from bot.utils.resources import Resource, warm_up
+
 log = get_logger(__name__)
 
 EMOJIS = {
@@ -13,6 +17,11 @@ EMOJIS = {
     "ERROR": "\u274C"
 }
 
+MONSTERS = Resource("bot/resources/holidays/halloween/monstersurvey.json")
+
+# Seconds to wait after a vote before saving it, so a burst of votes is saved all at once
+VOTE_SAVE_DELAY = 5
+
 
 class MonsterSurvey(Cog):
     """
@@ -23,15 +32,67 @@ class MonsterSurvey(Cog):
     Users may change their vote, but only their current vote will be counted.
     """
 
+    # RedisCache[voter_id, monster]
+    votes = RedisCache()
+
     def __init__(self):
         """Initializes values for the bot to use within the voting commands."""
-        self.registry_path = pathlib.Path("bot", "resources", "holidays", "halloween", "monstersurvey.json")
-        self.voter_registry = json.loads(self.registry_path.read_text("utf8"))
+        self.voters: dict[int, str] = {}
+        self.vote_counts: Counter[str] = Counter()
+        # The monsters sorted by their votes, only re-sorted after votes change
+        self._leaderboard: list[str] | None = None
+
+        # Votes which haven't been saved yet, and the task waiting to save them
+        self.unsaved_votes: dict[int, str] = {}
+        self.save_task: asyncio.Task | None = None
+
+    @property
+    def voter_registry(self) -> dict[str, dict]:
+        """The monsters which can be voted for, with their descriptions."""
+        return MONSTERS()
+
+    async def cog_load(self) -> None:
+        """Load the saved votes."""
+        await warm_up((MONSTERS,))
+        voters = await self.votes.to_dict()
+        if not voters:
+            # Votes used to be saved into the monster registry itself
+            voters = {
+                voter: monster
+                for monster, info in self.voter_registry.items()
+                for voter in info.get("votes", ())
+            }
+            if voters:
+                log.info(f"Migrating {len(voters)} Monster Survey votes from the registry file.")
+                await self.votes.update(voters)
+
+        self.voters = {voter: monster for voter, monster in voters.items() if monster in self.voter_registry}
+        self.vote_counts = Counter(self.voters.values())
+        self._leaderboard = None
 
-    def json_write(self) -> None:
-        """Write voting results to a local JSON file."""
-        log.info("Saved Monster Survey Results")
-        self.registry_path.write_text(json.dumps(self.voter_registry, indent=2))
+    async def cog_unload(self) -> None:
+        """Save any votes which haven't been saved yet."""
+        # A pending save task is left to finish, it won't find anything left to save
+        await self.save_votes()
+
+    async def save_votes(self) -> None:
+        """Save the votes cast since the last save."""
+        unsaved_votes, self.unsaved_votes = self.unsaved_votes, {}
+        if unsaved_votes:
+            try:
+                await self.votes.update(unsaved_votes)
+            except Exception:
+                # Put the votes back to be saved again, unless they were changed in the meantime
+                self.unsaved_votes = unsaved_votes | self.unsaved_votes
+                raise
+            log.info(f"Saved {len(unsaved_votes)} Monster Survey votes.")
+
+    async def save_votes_later(self) -> None:
+        """Save the votes after waiting for any more votes to be cast."""
+        await asyncio.sleep(VOTE_SAVE_DELAY)
+        # Votes cast while these are being saved schedule a save of their own
+        self.save_task = None
+        await self.save_votes()
 
     def cast_vote(self, id: int, monster: str) -> None:
         """
@@ -39,20 +100,31 @@ class MonsterSurvey(Cog):
 
         If the user has already voted, their existing vote is removed.
         """
-        vr = self.voter_registry
-        for m in vr:
-            if id not in vr[m]["votes"] and m == monster:
-                vr[m]["votes"].append(id)
-            else:
-                if id in vr[m]["votes"] and m != monster:
-                    vr[m]["votes"].remove(id)
+        previous = self.voters.get(id)
+        if previous == monster:
+            return
+
+        if previous is not None:
+            self.vote_counts[previous] -= 1
+        self.voters[id] = monster
+        self.vote_counts[monster] += 1
+        self._leaderboard = None
+
+        self.unsaved_votes[id] = monster
+        if self.save_task is None or self.save_task.done():
+            self.save_task = scheduling.create_task(self.save_votes_later())
+
+    def get_leaderboard(self) -> list[str]:
+        """Return the monsters, sorted by their number of votes."""
+        if self._leaderboard is None:
+            self._leaderboard = sorted(self.voter_registry, key=self.vote_counts.__getitem__, reverse=True)
+        return self._leaderboard
 
     def get_name_by_leaderboard_index(self, n: int) -> str:
         """Return the monster at the specified leaderboard index."""
         n = n - 1
-        vr = self.voter_registry
-        top = sorted(vr, key=lambda k: len(vr[k]["votes"]), reverse=True)
-        name = top[n] if n >= 0 else None
+        top = self.get_leaderboard()
+        name = top[n] if 0 <= n < len(top) else None
         return name
 
     @commands.group(
@@ -134,7 +206,6 @@ class MonsterSurvey(Cog):
                 )
                 vote_embed.set_thumbnail(url=m["image"])
                 vote_embed.set_footer(text="Please note that any previous votes have been removed.")
-                self.json_write()
 
         await ctx.send(embed=vote_embed)
 
@@ -176,12 +247,12 @@ class MonsterSurvey(Cog):
         """Shows the current standings."""
         async with ctx.typing():
             vr = self.voter_registry
-            top = sorted(vr, key=lambda k: len(vr[k]["votes"]), reverse=True)
-            total_votes = sum(len(m["votes"]) for m in self.voter_registry.values())
+            top = self.get_leaderboard()
+            total_votes = len(self.voters)
 
             embed = Embed(title="Monster Survey Leader Board", color=0xFF6800)
             for rank, m in enumerate(top):
-                votes = len(vr[m]["votes"])
+                votes = self.vote_counts[m]
                 percentage = ((votes / total_votes) * 100) if total_votes > 0 else 0
                 embed.add_field(
                     name=f"{rank+1}. {vr[m]['full_name']}",
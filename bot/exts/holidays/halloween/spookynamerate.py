@@ -4,10 +4,9 @@ import random
 from collections import defaultdict
 from datetime import UTC, datetime, timedelta
 from os import getenv
-from pathlib import Path
 
 from async_rediscache import RedisCache
-from discord import Embed, Reaction, TextChannel, User
+from discord import Embed, HTTPException, RawReactionActionEvent, Reaction, TextChannel, User
 from discord.colour import Colour
 from discord.ext import tasks
 from discord.ext.commands import Cog, Context, group
@@ -16,6 +15,8 @@ from pydis_core.utils.logging import get_logger
 from bot.bot import Bot
 from bot.constants import Channels, Client, Colours, Month
 from bot.utils.decorators import InMonthCheckFailure
+from bot.utils.leaderboard import RedisLeaderboard
+from bot.utils.resources import Resource
 
 logger = get_logger(__name__)
 
@@ -34,6 +35,10 @@ ADDED_MESSAGES = [
 ]
 PING = "<@{id}>"
 
+# The commands are locked to October by the cog check rather than `in_month_command`, so the extension's
+# season is declared here, unless the game is being debugged outside of October
+ACTIVE_MONTHS = None if getenv("SPOOKYNAMERATE_DEBUG") else (Month.OCTOBER,)
+
 EMOJI_MESSAGE = "\n".join(f"- {emoji} {val}" for emoji, val in EMOJIS_VAL.items())
 HELP_MESSAGE_DICT = {
     "title": "Spooky Name Rate",
@@ -65,9 +70,12 @@ HELP_MESSAGE_DICT = {
 }
 
 # The names are from https://www.mockaroo.com/
-NAMES = json.loads(Path("bot/resources/holidays/halloween/spookynamerate_names.json").read_text("utf8"))
-FIRST_NAMES = NAMES["first_names"]
-LAST_NAMES = NAMES["last_names"]
+NAMES = Resource("bot/resources/holidays/halloween/spookynamerate_names.json")
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a spookified name, so names differing only in case or spacing count as duplicates."""
+    return " ".join(name.casefold().split())
 
 
 class SpookyNameRate(Cog):
@@ -82,6 +90,13 @@ class SpookyNameRate(Cog):
     # added, the author's id, and the author's score (which is 0 by default)
     messages = RedisCache()
 
+    # Indexes over the entries in `messages`, so they can be looked up without reading all of them.
+    # The message id of each author's entry, the message id of the entry of each normalized name,
+    # and the score of each entry's message
+    authors = RedisCache()
+    names = RedisCache()
+    scores = RedisLeaderboard()
+
     # The data cache stores small information such as the current name that is going on and whether it is the first time
     # the bot is running
     data = RedisCache()
@@ -106,6 +121,35 @@ class SpookyNameRate(Cog):
         self.first_time = await self.data.get("first_time", True)
         self.name = await self.data.get("name")
 
+        if await self.authors.length() != await self.messages.length():
+            await self.rebuild_indexes()
+
+    async def rebuild_indexes(self) -> None:
+        """
+        Rebuild the indexes from the stored entries, for entries added before they existed.
+
+        The scores index is kept, since it's the only place the live scores are stored.
+        """
+        logger.info("Rebuilding the Spooky Name Rate indexes.")
+        await self.authors.clear()
+        await self.names.clear()
+        for message_id, data in await self.messages.items():
+            data = json.loads(data)
+            data["score"] = await self.scores.get(message_id, data["score"])
+            await self.index_entry(message_id, data)
+
+    async def index_entry(self, message_id: int, data: dict) -> None:
+        """Add the entry posted in `message_id` to the indexes."""
+        await self.authors.set(data["author"], message_id)
+        await self.names.set(normalize_name(data["name"]), message_id)
+        await self.scores.set(message_id, data["score"])
+
+    async def clear_indexes(self) -> None:
+        """Remove every entry from the indexes."""
+        await self.authors.clear()
+        await self.names.clear()
+        await self.scores.clear()
+
     @group(name="spookynamerate", invoke_without_command=True)
     async def spooky_name_rate(self, ctx: Context) -> None:
         """Get help on the Spooky Name Rate game."""
@@ -136,31 +180,27 @@ class SpookyNameRate(Cog):
             await ctx.send("Sorry, the poll has started! You can try and participate in the next round though!")
             return
 
-        for data in (json.loads(user_data) for _, user_data in await self.messages.items()):
-            if data["author"] == ctx.author.id:
-                await ctx.send(
-                    "But you have already added an entry! Type "
-                    f"`{Client.prefix}spookynamerate "
-                    "delete` to delete it, and then you can add it again"
-                )
-                return
+        if await self.authors.contains(ctx.author.id):
+            await ctx.send(
+                "But you have already added an entry! Type "
+                f"`{Client.prefix}spookynamerate "
+                "delete` to delete it, and then you can add it again"
+            )
+            return
 
-            if data["name"] == name:
-                await ctx.send("TOO LATE. Someone has already added this name.")
-                return
+        if await self.names.contains(normalize_name(name)):
+            await ctx.send("TOO LATE. Someone has already added this name.")
+            return
 
         msg = await (await self.get_channel()).send(f"{ctx.author.mention} added the name {name!r}!")
 
-        await self.messages.set(
-            msg.id,
-            json.dumps(
-                {
-                    "name": name,
-                    "author": ctx.author.id,
-                    "score": 0,
-                }
-            ),
-        )
+        data = {
+            "name": name,
+            "author": ctx.author.id,
+            "score": 0,
+        }
+        await self.messages.set(msg.id, json.dumps(data))
+        await self.index_entry(msg.id, data)
 
         for emoji in EMOJIS_VAL:
             await msg.add_reaction(emoji)
@@ -173,13 +213,15 @@ class SpookyNameRate(Cog):
         if self.poll:
             await ctx.send("You can't delete your name since the poll has already started!")
             return
-        for message_id, data in await self.messages.items():
-            data = json.loads(data)
-
-            if ctx.author.id == data["author"]:
-                await self.messages.delete(message_id)
-                await ctx.send(f"Name deleted successfully ({data['name']!r})!")
-                return
+        if message_id := await self.authors.get(ctx.author.id):
+            data = json.loads(await self.messages.get(message_id))
+
+            await self.messages.delete(message_id)
+            await self.authors.delete(ctx.author.id)
+            await self.names.delete(normalize_name(data["name"]))
+            await self.scores.delete(message_id)
+            await ctx.send(f"Name deleted successfully ({data['name']!r})!")
+            return
 
         await ctx.send(
             f"But you don't have an entry... :eyes: Type `{Client.prefix}spookynamerate add your entry`"
@@ -188,6 +230,8 @@ class SpookyNameRate(Cog):
     @Cog.listener()
     async def on_reaction_add(self, reaction: Reaction, user: User) -> None:
         """Ensures that each user adds maximum one reaction."""
+        if not self.in_allowed_month() or reaction.message.channel.id != Channels.sir_lancebot_playground:
+            return
         if user.bot or not await self.messages.contains(reaction.message.id):
             return
 
@@ -209,6 +253,31 @@ class SpookyNameRate(Cog):
                     await reaction.remove(user)
                     return
 
+    async def update_score(self, payload: RawReactionActionEvent, direction: int) -> None:
+        """Add (or subtract, for a `direction` of -1) the value of the reaction to the score of its entry."""
+        if not self.in_allowed_month() or payload.channel_id != Channels.sir_lancebot_playground:
+            return
+        # Only the bot's own reactions don't count
+        if payload.user_id == self.bot.user.id:
+            return
+
+        reaction_value = EMOJIS_VAL.get(str(payload.emoji), 0)
+        if not reaction_value or not await self.messages.contains(payload.message_id):
+            return
+
+        async with self.checking_messages:  # So the score isn't updated while the entries are being reset
+            await self.scores.increment(payload.message_id, direction * reaction_value)
+
+    @Cog.listener()
+    async def on_raw_reaction_add(self, payload: RawReactionActionEvent) -> None:
+        """Keep the score of an entry up to date when it's rated."""
+        await self.update_score(payload, 1)
+
+    @Cog.listener()
+    async def on_raw_reaction_remove(self, payload: RawReactionActionEvent) -> None:
+        """Keep the score of an entry up to date when a rating is removed."""
+        await self.update_score(payload, -1)
+
     @tasks.loop(hours=24.0)
     async def announce_name(self) -> None:
         """Announces the name needed to spookify every 24 hours and the winner of the previous game."""
@@ -229,39 +298,20 @@ class SpookyNameRate(Cog):
             self.first_time = False
 
         else:
-            if await self.messages.items():
+            if await self.messages.length():
                 await channel.send(embed=await self.get_responses_list(final=True))
                 self.poll = True
                 if not SpookyNameRate.debug:
                     await asyncio.sleep(2 * 60 * 60)  # sleep for two hours
 
-            logger.info("Calculating score")
-            for message_id, data in await self.messages.items():
-                data = json.loads(data)
-
-                msg = await channel.fetch_message(message_id)
-                score = 0
-                for reaction in msg.reactions:
-                    reaction_value = EMOJIS_VAL.get(reaction.emoji, 0)  # get the value of the emoji else 0
-                    score += reaction_value * (reaction.count - 1)  # multiply by the num of reactions
-                    # subtract one, since one reaction was done by the bot
-
-                logger.debug(f"{self.bot.get_user(data['author'])} got a score of {score}")
-                data["score"] = score
-                await self.messages.set(message_id, json.dumps(data))
-
-            # Sort the winner messages
-            winner_messages = sorted(
-                ((msg_id, json.loads(usr_data)) for msg_id, usr_data in await self.messages.items()),
-                key=lambda x: x[1]["score"],
-                reverse=True,
-            )
-
+            # The scores are kept up to date as the entries are rated, so the winners are simply the top scores,
+            # once any ratings which were missed while the bot was offline are counted
+            await self.recount_scores(channel)
             winners = []
-            for i, winner in enumerate(winner_messages):
-                winners.append(winner)
-                if len(winner_messages) > i + 1 and winner_messages[i + 1][1]["score"] != winner[1]["score"]:
-                    break
+            for message_id, score in await self.scores.leaders():
+                data = json.loads(await self.messages.get(message_id))
+                data["score"] = int(score)
+                winners.append((message_id, data))
 
             # one iteration is complete
             await channel.send("Today's Spooky Name Rate Game ends now, and the winner(s) is(are)...")
@@ -290,9 +340,11 @@ class SpookyNameRate(Cog):
 
             async with self.checking_messages:  # Acquire the lock to delete the messages
                 await self.messages.clear()  # reset the messages
+                await self.clear_indexes()
 
         # send the next name
-        self.name = f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}"
+        names = NAMES()
+        self.name = f"{random.choice(names['first_names'])} {random.choice(names['last_names'])}"
         await self.data.set("name", self.name)
 
         await channel.send(
@@ -319,13 +371,30 @@ class SpookyNameRate(Cog):
         tomorrow_12pm = tomorrow_12pm.replace(hour=12, minute=0, second=0, microsecond=0)
         await asyncio.sleep((tomorrow_12pm - now).seconds)
 
+    async def recount_scores(self, channel: TextChannel) -> None:
+        """Recount the score of every entry from the reactions on its message."""
+        async with self.checking_messages:
+            for message_id in await self.messages.to_dict():
+                try:
+                    message = await channel.fetch_message(message_id)
+                except HTTPException:
+                    logger.warning(f"Couldn't fetch the Spooky Name Rate entry {message_id}, keeping its live score.")
+                    continue
+
+                score = sum(
+                    EMOJIS_VAL[str(reaction.emoji)] * (reaction.count - reaction.me)
+                    for reaction in message.reactions
+                    if str(reaction.emoji) in EMOJIS_VAL
+                )
+                await self.scores.set(message_id, score)
+
     async def get_responses_list(self, final: bool = False) -> Embed:
         """Returns an embed containing the responses of the people."""
         channel = await self.get_channel()
 
         embed = Embed(color=Colour.red())
 
-        if await self.messages.items():
+        if await self.messages.length():
             if final:
                 embed.title = "Spooky Name Rate is about to end!"
                 embed.description = (
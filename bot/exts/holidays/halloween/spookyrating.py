@@ -1,7 +1,5 @@
 import bisect
-import json
 import random
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -9,13 +7,14 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-data: dict[str, dict[str, str]] = json.loads(
-    Path("bot/resources/holidays/halloween/spooky_rating.json").read_text("utf8")
+SPOOKY_DATA = Resource(
+    "bot/resources/holidays/halloween/spooky_rating.json",
+    parse=lambda data: sorted((int(key), value) for key, value in data.items()),
 )
-SPOOKY_DATA = sorted((int(key), value) for key, value in data.items())
 
 
 class SpookyRating(commands.Cog):
@@ -42,9 +41,9 @@ class SpookyRating(commands.Cog):
         # We need the -1 due to how bisect returns the point
         # see the documentation for further detail
         # https://docs.python.org/3/library/bisect.html#bisect.bisect
-        index = bisect.bisect(SPOOKY_DATA, (spooky_percent,)) - 1
+        index = bisect.bisect(SPOOKY_DATA(), (spooky_percent,)) - 1
 
-        _, data = SPOOKY_DATA[index]
+        _, data = SPOOKY_DATA()[index]
 
         embed = discord.Embed(
             title=data["title"],
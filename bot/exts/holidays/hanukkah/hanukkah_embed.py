@@ -6,44 +6,43 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours, Month
-from bot.utils.decorators import in_month
+from bot.utils.decorators import in_month, seasonal_task
+from bot.utils.holiday_dates import get_festival_dates
 
 log = get_logger(__name__)
 
-HEBCAL_URL = (
-    "https://www.hebcal.com/hebcal/?v=1&cfg=json&maj=on&min=on&mod=on&nx=on&"
-    "year=now&month=x&ss=on&mf=on&c=on&geo=geoname&geonameid=3448439&m=50&s=on"
-)
-
 
 class HanukkahEmbed(commands.Cog):
     """A cog that returns information about Hanukkah festival."""
 
     def __init__(self, bot: Bot):
         self.bot = bot
-        self.hanukkah_dates: list[date] = []
+        self.prefetch_task = self.bot.loop.create_task(self.prefetch_hanukkah_dates())
+
+    def cog_unload(self) -> None:
+        """Cancel the prefetching task when the cog is unloaded."""
+        self.prefetch_task.cancel()
 
-    def _parse_time_to_datetime(self, date: list[str]) -> datetime:
-        """Format the times provided by the api to datetime forms."""
+    @seasonal_task(Month.OCTOBER, Month.NOVEMBER, Month.DECEMBER)
+    async def prefetch_hanukkah_dates(self) -> None:
+        """Make sure this year's dates are stored before the season starts, so the command never waits on Hebcal."""
         try:
-            return datetime.strptime(date, "%Y-%m-%dT%H:%M:%S%z")
-        except ValueError:
-            # there is a possibility of an event not having a time, just a day
-            # to catch this, we try again without time information
-            return datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=UTC)
+            await self.fetch_hanukkah_dates()
+        except Exception as e:
+            log.warning(f"Failed to prefetch the Hanukkah dates: {e}")
 
     async def fetch_hanukkah_dates(self) -> list[date]:
-        """Gets the dates for hanukkah festival."""
-        # clear the datetime objects to prevent a memory link
-        self.hanukkah_dates = []
-        async with self.bot.http_session.get(HEBCAL_URL) as response:
-            json_data = await response.json()
-        festivals = json_data["items"]
-        for festival in festivals:
-            if festival["title"].startswith("Chanukah"):
-                date = festival["date"]
-                self.hanukkah_dates.append(self._parse_time_to_datetime(date).date())
-        return self.hanukkah_dates
+        """
+        Gets the dates for this year's hanukkah festival.
+
+        Hanukkah may carry on into January, so the dates at the start of next year are included,
+        while those at the start of this year belong to last year's festival.
+        """
+        year = datetime.now(tz=UTC).year
+        this_year = await get_festival_dates(self.bot, "Chanukah", year)
+        next_year = await get_festival_dates(self.bot, "Chanukah", year + 1)
+
+        return [day for day in this_year if day.month != 1] + [day for day in next_year if day.month == 1]
 
     @in_month(Month.NOVEMBER, Month.DECEMBER)
     @commands.command(name="hanukkah", aliases=("chanukah",))
@@ -1,5 +1,8 @@
+import asyncio
 import random
 import re
+import time
+from collections import defaultdict, deque
 from typing import NamedTuple
 
 import discord
@@ -9,7 +12,7 @@ from pydis_core.utils.logging import get_logger
 from bot.bot import Bot
 from bot.constants import Month
 from bot.utils import resolve_current_month
-from bot.utils.decorators import in_month
+from bot.utils.message_router import message_handler
 
 log = get_logger(__name__)
 
@@ -107,63 +110,87 @@ MONTHS_TO_REACT = {
     month for holiday in HOLIDAYS_TO_REACT for month in holiday.months
 }
 
+# At most this many reactions are added per channel in each period, so busy channels don't hit rate limits
+MAX_CHANNEL_REACTIONS = 5
+CHANNEL_REACTION_PERIOD = 10
+
+
+class TriggerMatcher:
+    """Finds all the triggers of the holidays in a given month in a single pass over a message."""
+
+    def __init__(self, month: Month):
+        self.month = month
+        self.triggers: dict[str, tuple[str, Trigger]] = {}
+
+        patterns = []
+        for holiday in HOLIDAYS_TO_REACT:
+            if month not in holiday.months:
+                continue
+            for name, trigger in holiday.triggers.items():
+                group = f"trigger_{len(self.triggers)}"
+                self.triggers[group] = (name, trigger)
+                patterns.append(f"(?P<{group}>{trigger.regex})")
+
+        self.regex = re.compile("|".join(patterns), flags=re.IGNORECASE) if patterns else None
+
+    def find(self, content: str) -> list[tuple[str, Trigger]]:
+        """Return the name and trigger of every trigger found in `content`, in the order they're first found."""
+        if self.regex is None:
+            return []
+
+        groups = dict.fromkeys(match.lastgroup for match in self.regex.finditer(content))
+        return [self.triggers[group] for group in groups]
+
 
 class HolidayReact(Cog):
     """A cog that makes the bot react to message triggers."""
 
     def __init__(self, bot: Bot):
         self.bot = bot
-
-    @in_month(*MONTHS_TO_REACT)
-    @Cog.listener()
+        self.matcher: TriggerMatcher | None = None
+        # The times of the recent reactions in each channel
+        self.channel_reactions: defaultdict[int, deque[float]] = defaultdict(deque)
+
+    def get_matcher(self) -> TriggerMatcher:
+        """Get the matcher for the current month's triggers, only rebuilding it when the month changes."""
+        current_month = resolve_current_month()
+        if self.matcher is None or self.matcher.month != current_month:
+            log.debug(f"Building the reaction trigger matcher for {current_month!s}.")
+            self.matcher = TriggerMatcher(current_month)
+        return self.matcher
+
+    def _reserve_reactions(self, channel_id: int, amount: int) -> int:
+        """Reserve up to `amount` reactions in the channel's rate limit, returning how many may be added."""
+        now = time.monotonic()
+        reactions = self.channel_reactions[channel_id]
+        while reactions and now - reactions[0] > CHANNEL_REACTION_PERIOD:
+            reactions.popleft()
+
+        allowed = min(amount, MAX_CHANNEL_REACTIONS - len(reactions))
+        reactions.extend([now] * allowed)
+        return allowed
+
+    @message_handler(months=MONTHS_TO_REACT, allow_dms=True, allow_commands=False)
     async def on_message(self, message: discord.Message) -> None:
-        """Triggered when the bot sees a message in a holiday month."""
-        # Check message for bot replies and/or command invocations
-        # Short circuit if they're found, logging is handled in _short_circuit_check
-        if await self._short_circuit_check(message):
-            return
-
-        for holiday in HOLIDAYS_TO_REACT:
-            await self._check_message(message, holiday)
-
-    async def _check_message(self, message: discord.Message, holiday: Holiday) -> None:
         """
-        Check if message is reactable.
+        Triggered when the bot sees a message, which isn't a command invocation, in a holiday month.
 
-        React to message if:
-          * month is valid
-          * message contains reaction regex triggers
+        React to the message once for each of the current month's triggers it contains.
         """
-        if resolve_current_month() not in holiday.months:
+        triggers = self.get_matcher().find(message.content)
+        if not triggers:
             return
 
-        for name, trigger in holiday.triggers.items():
-            trigger_test = re.search(trigger.regex, message.content, flags=re.IGNORECASE)
-            if trigger_test:
-                await message.add_reaction(random.choice(trigger.reaction))
-                log.info(f"Added {name!r} reaction to message ID: {message.id}")
-
-    async def _short_circuit_check(self, message: discord.Message) -> bool:
-        """
-        Short-circuit helper check.
+        allowed = self._reserve_reactions(message.channel.id, len(triggers))
+        if allowed < len(triggers):
+            log.debug(f"Skipping {len(triggers) - allowed} reactions on message ID {message.id} due to the rate cap.")
 
-        Return True if:
-          * author is a bot
-          * prefix is not None
-        """
-        # Check if message author is a bot
-        if message.author.bot:
-            log.debug(f"Ignoring reactions on bot message. Message ID: {message.id}")
-            return True
-
-        # Check for command invocation
-        # Because on_message doesn't give a full Context object, generate one first
-        ctx = await self.bot.get_context(message)
-        if ctx.prefix:
-            log.debug(f"Ignoring reactions on command invocation. Message ID: {message.id}")
-            return True
-
-        return False
+        await asyncio.gather(*(
+            message.add_reaction(random.choice(trigger.reaction))
+            for _, trigger in triggers[:allowed]
+        ))
+        for name, _ in triggers[:allowed]:
+            log.info(f"Added {name!r} reaction to message ID: {message.id}")
 
 
 async def setup(bot: Bot) -> None:
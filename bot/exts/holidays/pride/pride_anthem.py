@@ -1,15 +1,14 @@
-import json
 import random
-from pathlib import Path
 
 from discord.ext import commands
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-VIDEOS = json.loads(Path("bot/resources/holidays/pride/anthems.json").read_text("utf8"))
+VIDEOS = Resource("bot/resources/holidays/pride/anthems.json")
 
 
 class PrideAnthem(commands.Cog):
@@ -23,9 +22,9 @@ class PrideAnthem(commands.Cog):
         If none can be found, it will log this as well as provide that information to the user.
         """
         if not genre:
-            return random.choice(VIDEOS)
+            return random.choice(VIDEOS())
 
-        songs = [song for song in VIDEOS if genre.casefold() in song["genre"]]
+        songs = [song for song in VIDEOS() if genre.casefold() in song["genre"]]
         try:
             return random.choice(songs)
         except IndexError:
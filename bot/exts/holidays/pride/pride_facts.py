@@ -1,7 +1,5 @@
-import json
 import random
 from datetime import UTC, datetime
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -10,10 +8,11 @@ from pydis_core.utils.logging import get_logger
 from bot.bot import Bot
 from bot.constants import Channels, Colours, Month
 from bot.utils.decorators import seasonal_task
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-FACTS = json.loads(Path("bot/resources/holidays/pride/facts.json").read_text("utf8"))
+FACTS = Resource("bot/resources/holidays/pride/facts.json")
 
 
 class PrideFacts(commands.Cog):
@@ -62,7 +61,7 @@ class PrideFacts(commands.Cog):
 
         if day_num is not set, a random fact is selected.
         """
-        fact = FACTS[day_num-1] if day_num else random.choice(FACTS)
+        fact = FACTS()[day_num-1] if day_num else random.choice(FACTS())
         return discord.Embed(
             colour=Colours.pink,
             title=f"Day {day_num}'s pride fact!" if day_num else "Random pride fact!",
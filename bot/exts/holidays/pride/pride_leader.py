@@ -1,6 +1,4 @@
-import json
 import random
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -9,10 +7,11 @@ from rapidfuzz import fuzz
 
 from bot import constants
 from bot.bot import Bot
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-PRIDE_RESOURCE = json.loads(Path("bot/resources/holidays/pride/prideleader.json").read_text("utf8"))
+PRIDE_RESOURCE = Resource("bot/resources/holidays/pride/prideleader.json")
 MINIMUM_FUZZ_RATIO = 40
 
 
@@ -39,12 +38,12 @@ class PrideLeader(commands.Cog):
         )
         valid_names = []
         pride_leader = pride_leader.title()
-        for name in PRIDE_RESOURCE:
+        for name in PRIDE_RESOURCE():
             if fuzz.ratio(pride_leader, name) >= MINIMUM_FUZZ_RATIO:
                 valid_names.append(name)
 
         if not valid_names:
-            valid_names = ", ".join(PRIDE_RESOURCE)
+            valid_names = ", ".join(PRIDE_RESOURCE())
             error_msg = "Sorry your input didn't match any stored names, here is a list of available names:"
         else:
             valid_names = "\n".join(valid_names)
@@ -57,7 +56,7 @@ class PrideLeader(commands.Cog):
 
     def embed_builder(self, pride_leader: dict) -> discord.Embed:
         """Generate an Embed with information about a pride leader."""
-        name = next(name for name, info in PRIDE_RESOURCE.items() if info == pride_leader)
+        name = next(name for name, info in PRIDE_RESOURCE().items() if info == pride_leader)
 
         embed = discord.Embed(
             title=name,
@@ -97,9 +96,9 @@ class PrideLeader(commands.Cog):
         and if there is no pride leader given, return a random pride leader.
         """
         if not pride_leader_name:
-            leader = random.choice(list(PRIDE_RESOURCE.values()))
+            leader = random.choice(list(PRIDE_RESOURCE().values()))
         else:
-            leader = PRIDE_RESOURCE.get(pride_leader_name.title())
+            leader = PRIDE_RESOURCE().get(pride_leader_name.title())
             if not leader:
                 log.trace(f"Got a Invalid pride leader: {pride_leader_name}")
 
@@ -1,5 +1,4 @@
 import random
-from json import loads
 from pathlib import Path
 
 import discord
@@ -10,6 +9,7 @@ from bot.bot import Bot
 from bot.constants import Channels, Colours, Month, PYTHON_PREFIX, Roles
 from bot.utils.decorators import in_month
 from bot.utils.exceptions import MovedCommandError
+from bot.utils.resources import read_json
 
 log = get_logger(__name__)
 
@@ -28,8 +28,7 @@ class BeMyValentine(commands.Cog):
     @staticmethod
     def load_json() -> dict:
         """Load Valentines messages from the static resources."""
-        p = Path("bot/resources/holidays/valentines/bemyvalentine_valentines.json")
-        return loads(p.read_text("utf8"))
+        return read_json(Path("bot/resources/holidays/valentines/bemyvalentine_valentines.json"))
 
     @in_month(Month.FEBRUARY)
     @commands.command(name="lovefest", help=f"NOTE: This command has been moved to {MOVED_COMMAND}")
@@ -1,9 +1,7 @@
 import bisect
 import hashlib
-import json
 import random
 from collections.abc import Coroutine
-from pathlib import Path
 
 import discord
 from discord import Member
@@ -14,11 +12,14 @@ from pydis_core.utils.logging import get_logger
 from bot.bot import Bot
 from bot.constants import Channels, Month, PYTHON_PREFIX, Roles
 from bot.utils.decorators import in_month
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-LOVE_DATA = json.loads(Path("bot/resources/holidays/valentines/love_matches.json").read_text("utf8"))
-LOVE_DATA = sorted((int(key), value) for key, value in LOVE_DATA.items())
+LOVE_DATA = Resource(
+    "bot/resources/holidays/valentines/love_matches.json",
+    parse=lambda data: sorted((int(key), value) for key, value in data.items()),
+)
 
 
 class LoveCalculator(Cog):
@@ -74,11 +75,11 @@ class LoveCalculator(Cog):
         # We need the -1 due to how bisect returns the point
         # see the documentation for further detail
         # https://docs.python.org/3/library/bisect.html#bisect.bisect
-        love_threshold = [threshold for threshold, _ in LOVE_DATA]
+        love_threshold = [threshold for threshold, _ in LOVE_DATA()]
         index = bisect.bisect(love_threshold, love_percent) - 1
         # We already have the nearest "fit" love level
         # We only need the dict, so we can ditch the first element
-        _, data = LOVE_DATA[index]
+        _, data = LOVE_DATA()[index]
 
         status = random.choice(data["titles"])
         embed = discord.Embed(
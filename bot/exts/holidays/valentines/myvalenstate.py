@@ -1,6 +1,4 @@
 import collections
-import json
-from pathlib import Path
 from random import choice
 
 import discord
@@ -9,10 +7,11 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-STATES = json.loads(Path("bot/resources/holidays/valentines/valenstates.json").read_text("utf8"))
+STATES = Resource("bot/resources/holidays/valentines/valenstates.json")
 
 
 class MyValenstate(commands.Cog):
@@ -47,7 +46,7 @@ class MyValenstate(commands.Cog):
         else:
             author = name.lower().replace(" ", "")
 
-        for state in STATES:
+        for state in STATES():
             lower_state = state.lower().replace(" ", "")
             eq_chars[state] = self.levenshtein(author, lower_state)
 
@@ -68,11 +67,11 @@ class MyValenstate(commands.Cog):
 
         embed = discord.Embed(
             title=f"Your Valenstate is {valenstate} \u2764",
-            description=STATES[valenstate]["text"],
+            description=STATES()[valenstate]["text"],
             colour=Colours.pink
         )
         embed.add_field(name=embed_title, value=embed_text)
-        embed.set_image(url=STATES[valenstate]["flag"])
+        embed.set_image(url=STATES()[valenstate]["flag"])
         await ctx.send(embed=embed)
 
 
@@ -1,6 +1,4 @@
 import random
-from json import loads
-from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -8,10 +6,11 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-PICKUP_LINES = loads(Path("bot/resources/holidays/valentines/pickup_lines.json").read_text("utf8"))
+PICKUP_LINES = Resource("bot/resources/holidays/valentines/pickup_lines.json")
 
 
 class PickupLine(commands.Cog):
@@ -24,14 +23,14 @@ class PickupLine(commands.Cog):
 
         Note that most of them are very cheesy.
         """
-        random_line = random.choice(PICKUP_LINES["lines"])
+        random_line = random.choice(PICKUP_LINES()["lines"])
         embed = discord.Embed(
             title=":cheese: Your pickup line :cheese:",
             description=random_line["line"],
             color=Colours.pink
         )
         embed.set_thumbnail(
-            url=random_line.get("image", PICKUP_LINES["placeholder"])
+            url=random_line.get("image", PICKUP_LINES()["placeholder"])
         )
         await ctx.send(embed=embed)
 
@@ -1,5 +1,4 @@
 import calendar
-import json
 import random
 from datetime import UTC, datetime
 from pathlib import Path
@@ -10,6 +9,7 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils.resources import read_json
 
 log = get_logger(__name__)
 
@@ -29,13 +29,13 @@ class ValentineZodiac(commands.Cog):
         explanation_file = Path("bot/resources/holidays/valentines/zodiac_explanation.json")
         compatibility_file = Path("bot/resources/holidays/valentines/zodiac_compatibility.json")
 
-        zodiac_fact = json.loads(explanation_file.read_text("utf8"))
+        zodiac_fact = read_json(explanation_file)
 
         for zodiac_data in zodiac_fact.values():
             zodiac_data["start_at"] = datetime.fromisoformat(zodiac_data["start_at"])
             zodiac_data["end_at"] = datetime.fromisoformat(zodiac_data["end_at"])
 
-        zodiacs = json.loads(compatibility_file.read_text("utf8"))
+        zodiacs = read_json(compatibility_file)
 
         return zodiacs, zodiac_fact
 
@@ -1,5 +1,3 @@
-import json
-from pathlib import Path
 from random import choice
 
 import discord
@@ -8,10 +6,11 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils.resources import Resource
 
 log = get_logger(__name__)
 
-FACTS = json.loads(Path("bot/resources/holidays/valentines/valentine_facts.json").read_text("utf8"))
+FACTS = Resource("bot/resources/holidays/valentines/valentine_facts.json")
 
 
 class ValentineFacts(commands.Cog):
@@ -22,7 +21,7 @@ class ValentineFacts(commands.Cog):
         """Displays info about Saint Valentine."""
         embed = discord.Embed(
             title="Who is Saint Valentine?",
-            description=FACTS["whois"],
+            description=FACTS()["whois"],
             color=Colours.pink
         )
         embed.set_thumbnail(
@@ -36,8 +35,8 @@ class ValentineFacts(commands.Cog):
     async def valentine_fact(self, ctx: commands.Context) -> None:
         """Shows a random fact about Valentine's Day."""
         embed = discord.Embed(
-            title=choice(FACTS["titles"]),
-            description=choice(FACTS["text"]),
+            title=choice(FACTS()["titles"]),
+            description=choice(FACTS()["text"]),
             color=Colours.pink
         )
 
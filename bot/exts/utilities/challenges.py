@@ -1,17 +1,27 @@
 from asyncio import to_thread
 from random import choice
 
-from bs4 import BeautifulSoup
 from discord import Embed, Interaction, SelectOption, ui
 from discord.ext import commands
+from lxml import etree, html
 from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours, Emojis, NEGATIVE_REPLIES
+from bot.utils.caching import RedisTTLCache
 
 log = get_logger(__name__)
 API_ROOT = "https://www.codewars.com/api/v1/code-challenges/{kata_id}"
 
+# Search results shift as katas are published, while a kata's details hardly ever change
+KATA_SEARCH_TTL = 6 * 60 * 60
+KATA_INFORMATION_TTL = 24 * 60 * 60
+
+# Selects the link of every kata in the search results
+KATA_LINKS = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' list-item-kata ')]/descendant::a[1]/@href"
+)
+
 # Map difficulty for the kata to color we want to display in the embed.
 # These colors are representative of the colors that each kyu's level represents on codewars.com
 MAPPING_OF_KYU = {
@@ -97,36 +107,54 @@ class Challenges(commands.Cog):
     You can specify the language the kata should be from, difficulty and topic of the kata.
     """
 
+    # RedisTTLCache[search_key, list[kata_id]]
+    kata_searches = RedisTTLCache()
+
+    # RedisTTLCache[kata_id, dict]
+    kata_details = RedisTTLCache()
+
     def __init__(self, bot: Bot):
         self.bot = bot
 
+    @staticmethod
+    def parse_kata_ids(page: str) -> list[str]:
+        """Extract the IDs of all katas listed on a codewars.com search page."""
+        if not page.strip():
+            return []
+
+        # There are numerous divs before arriving at the id of the kata, which can be used for the link.
+        return [link.split("/")[-1] for link in KATA_LINKS(html.fromstring(page))]
+
     async def kata_id(self, search_link: str, params: dict) -> str | Embed:
         """
-        Uses bs4 to get the HTML code for the page of katas, where the page is the link of the formatted `search_link`.
+        Gets the ID of a random kata from the page of katas, where the page is the link of the formatted `search_link`.
 
         This will webscrape the search page with `search_link` and then get the ID of a kata for the
-        codewars.com API to use.
+        codewars.com API to use. The IDs found for a search are cached, so repeated searches only pick from them.
         """
-        async with self.bot.http_session.get(search_link, params=params) as response:
-            if response.status != 200:
-                error_embed = Embed(
-                    title=choice(NEGATIVE_REPLIES),
-                    description="We ran into an error when getting the kata from codewars.com, try again later.",
-                    color=Colours.soft_red
-                )
-                log.error(f"Unexpected response from codewars.com, status code: {response.status}")
-                return error_embed
+        search_key = f"{search_link}?{'&'.join(f'{key}={value}' for key, value in sorted(params.items()))}"
+
+        kata_ids = await self.kata_searches.get(search_key)
+        if kata_ids is None:
+            async with self.bot.http_session.get(search_link, params=params) as response:
+                if response.status != 200:
+                    error_embed = Embed(
+                        title=choice(NEGATIVE_REPLIES),
+                        description="We ran into an error when getting the kata from codewars.com, try again later.",
+                        color=Colours.soft_red
+                    )
+                    log.error(f"Unexpected response from codewars.com, status code: {response.status}")
+                    return error_embed
+
+                page = await response.text()
 
-            soup = BeautifulSoup(await response.text(), features="lxml")
-            first_kata_div = await to_thread(soup.find_all, "div", class_="list-item-kata")
+            kata_ids = await to_thread(self.parse_kata_ids, page)
+            await self.kata_searches.set(search_key, kata_ids, ttl=KATA_SEARCH_TTL)
 
-            if not first_kata_div:
-                raise commands.BadArgument("No katas could be found with the filters provided.")
+        if not kata_ids:
+            raise commands.BadArgument("No katas could be found with the filters provided.")
 
-            # There are numerous divs before arriving at the id of the kata, which can be used for the link.
-            first_kata_div = choice(first_kata_div)
-            first_kata_id = first_kata_div.a["href"].split("/")[-1]
-            return first_kata_id
+        return choice(kata_ids)
 
     async def kata_information(self, kata_id: str) -> dict | Embed:
         """
@@ -134,6 +162,9 @@ class Challenges(commands.Cog):
 
         Uses the codewars.com API to get information about the kata using `kata_id`.
         """
+        if kata_information := await self.kata_details.get(kata_id):
+            return kata_information
+
         async with self.bot.http_session.get(API_ROOT.format(kata_id=kata_id)) as response:
             if response.status != 200:
                 error_embed = Embed(
@@ -144,7 +175,10 @@ class Challenges(commands.Cog):
                 log.error(f"Unexpected response from codewars.com/api/v1, status code: {response.status}")
                 return error_embed
 
-            return await response.json()
+            kata_information = await response.json()
+
+        await self.kata_details.set(kata_id, kata_information, ttl=KATA_INFORMATION_TTL)
+        return kata_information
 
     @staticmethod
     def main_embed(kata_information: dict) -> Embed:
@@ -287,12 +321,12 @@ class Challenges(commands.Cog):
                     )
 
                 query, level = query_splitted
-                params["q"] = query
+                params["q"] = query.strip().lower()
                 params["r[]"] = f"-{level}"
             elif query.isnumeric():
                 params["r[]"] = f"-{query}"
             else:
-                params["q"] = query
+                params["q"] = query.strip().lower()
 
         params["beta"] = str(language in SUPPORTED_LANGUAGES["beta"]).lower()
 
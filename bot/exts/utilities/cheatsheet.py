@@ -1,3 +1,4 @@
+import asyncio
 import random
 import re
 from urllib.parse import quote_plus
@@ -5,12 +6,16 @@ from urllib.parse import quote_plus
 from discord import Embed
 from discord.ext import commands
 from discord.ext.commands import BucketType, Context
+from pydis_core.utils.logging import get_logger
 
 from bot import constants
 from bot.bot import Bot
 from bot.constants import Categories, Channels, Colours, ERROR_REPLIES
+from bot.utils.caching import RedisTTLCache
 from bot.utils.decorators import whitelist_override
 
+log = get_logger(__name__)
+
 ERROR_MESSAGE = f"""
 Unknown cheat sheet. Please try to reformulate your query.
 
@@ -29,12 +34,21 @@ ANSI_RE = re.compile(r"\x1b\[.*?m")
 # We need to pass headers as curl otherwise it would default to aiohttp which would return raw html.
 HEADERS = {"User-Agent": "curl/7.68.0"}
 
+# cheat.sh answers rarely change, while unknown queries are only kept for a while in case they get added
+RESULT_TTL = 7 * 24 * 60 * 60
+NOT_FOUND_TTL = 24 * 60 * 60
+
 
 class CheatSheet(commands.Cog):
     """Commands that sends a result of a cht.sh search in code blocks."""
 
+    # RedisTTLCache[search_string, dict]
+    results = RedisTTLCache()
+
     def __init__(self, bot: Bot):
         self.bot = bot
+        # Lookups currently in flight, so concurrent searches for the same query share one request
+        self.pending_lookups: dict[str, asyncio.Task[str | None]] = {}
 
     @staticmethod
     def fmt_error_embed() -> Embed:
@@ -74,6 +88,45 @@ class CheatSheet(commands.Cog):
             )
         return False, description
 
+    async def get_result(self, search_string: str) -> str | None:
+        """
+        Get the formatted result of a cht.sh search, or None if it couldn't be found.
+
+        Results are cached, and concurrent lookups of the same search are coalesced into a single request.
+        """
+        if (cached := await self.results.get(search_string)) is not None:
+            return cached["description"]
+
+        if search_string not in self.pending_lookups:
+            task = asyncio.create_task(self.fetch_result(search_string))
+            task.add_done_callback(lambda _: self.pending_lookups.pop(search_string, None))
+            self.pending_lookups[search_string] = task
+
+        # Shielded, so one of the waiting commands being cancelled doesn't cancel the lookup for the others.
+        return await asyncio.shield(self.pending_lookups[search_string])
+
+    async def fetch_result(self, search_string: str) -> str | None:
+        """
+        Fetch and format the result of a cht.sh search, caching it for later lookups.
+
+        Error responses aren't cached, so that a failure of cht.sh doesn't outlast it.
+        """
+        url = URL.format(search=search_string)
+
+        async with self.bot.http_session.get(url, headers=HEADERS) as response:
+            if response.status != 200:
+                log.warning(f"cht.sh responded with status {response.status} to the search {search_string!r}.")
+                return None
+            result = ANSI_RE.sub("", await response.text()).translate(ESCAPE_TT)
+
+        is_embed, description = self.result_fmt(url, result)
+        if is_embed:
+            await self.results.set(search_string, {"description": None}, ttl=NOT_FOUND_TTL)
+            return None
+
+        await self.results.set(search_string, {"description": description}, ttl=RESULT_TTL)
+        return description
+
     @commands.command(
         name="cheat",
         aliases=("cht.sh", "cheatsheet", "cheat-sheet", "cht"),
@@ -89,19 +142,12 @@ class CheatSheet(commands.Cog):
         --> .cht read json
         """
         async with ctx.typing():
-            search_string = quote_plus(" ".join(search_terms))
+            # Normalise the search, so differently typed versions of the same query share a cache entry.
+            search_string = quote_plus(" ".join(search_terms).lower())
 
-            async with self.bot.http_session.get(
-                    URL.format(search=search_string), headers=HEADERS
-            ) as response:
-                result = ANSI_RE.sub("", await response.text()).translate(ESCAPE_TT)
-
-            is_embed, description = self.result_fmt(
-                URL.format(search=search_string),
-                result
-            )
-            if is_embed:
-                await ctx.send(embed=description)
+            description = await self.get_result(search_string)
+            if description is None:
+                await ctx.send(embed=self.fmt_error_embed())
             else:
                 await ctx.send(content=description)
 
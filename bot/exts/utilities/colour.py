@@ -1,6 +1,4 @@
 import colorsys
-import json
-import pathlib
 import random
 import string
 from io import BytesIO
@@ -13,8 +11,14 @@ from discord.ext import commands
 from bot import constants
 from bot.bot import Bot
 from bot.utils.decorators import whitelist_override
+from bot.utils.resources import Resource, warm_up
 
 THUMBNAIL_SIZE = (80, 80)
+COLOUR_MAPPING = Resource(
+    "bot/resources/utilities/ryanzec_colours.json",
+    # Skip the source credit entry
+    parse=lambda colours: {name: hex_code for name, hex_code in colours.items() if name != "_"},
+)
 
 
 class Colour(commands.Cog):
@@ -22,9 +26,15 @@ class Colour(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
-        with open(pathlib.Path("bot/resources/utilities/ryanzec_colours.json")) as f:
-            self.colour_mapping = json.load(f)
-            del self.colour_mapping["_"]  # Delete source credit entry
+
+    async def cog_load(self) -> None:
+        """Load the colour names ahead of the first lookup."""
+        await warm_up((COLOUR_MAPPING,))
+
+    @property
+    def colour_mapping(self) -> dict[str, str]:
+        """The names of colours, mapped to their hex codes."""
+        return COLOUR_MAPPING()
 
     async def send_colour_response(self, ctx: commands.Context, rgb: tuple[int, int, int]) -> None:
         """Create and send embed from user given colour information."""
@@ -1,4 +1,3 @@
-import json
 import random
 import re
 from dataclasses import dataclass
@@ -13,6 +12,8 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Colours, ERROR_REPLIES, Emojis, NEGATIVE_REPLIES, Tokens
+from bot.utils.message_router import message_handler
+from bot.utils.resources import read_json
 
 log = get_logger(__name__)
 
@@ -92,9 +93,8 @@ class GithubInfo(commands.Cog):
         """
         self.refresh_repos.start()
 
-        with open(STORED_REPOS_FILE) as f:
-            self.stored_repos = json.load(f)
-            log.info("Loaded stored repos in memory.")
+        self.stored_repos = read_json(STORED_REPOS_FILE)
+        log.info("Loaded stored repos in memory.")
 
     async def cog_unload(self) -> None:
         """
@@ -196,17 +196,13 @@ class GithubInfo(commands.Cog):
         if ctx.invoked_subcommand is None:
             await self.bot.invoke_help_command(ctx)
 
-    @commands.Cog.listener()
+    @message_handler(pattern=AUTOMATIC_REGEX)
     async def on_message(self, message: discord.Message) -> None:
         """
         Automatic issue linking.
 
         Listener to retrieve issue(s) from a GitHub repository using automatic linking if matching <org>/<repo>#<issue>.
         """
-        # Ignore bots
-        if message.author.bot:
-            return
-
         issues = [
             FoundIssue(*match.group("org", "repo", "number"))
             for match in AUTOMATIC_REGEX.finditer(self.remove_codeblocks(message.content))
@@ -214,10 +210,6 @@ class GithubInfo(commands.Cog):
         links = []
 
         if issues:
-            # Block this from working in DMs
-            if not message.guild:
-                return
-
             log.trace(f"Found {issues = }")
             # Remove duplicates
             issues = list(dict.fromkeys(issues))
@@ -3,6 +3,7 @@ from pydis_core.utils.logging import get_logger
 
 from bot import constants
 from bot.bot import Bot
+from bot.utils.extension_loader import defer_cog_load
 
 log = get_logger(__name__)
 
@@ -13,6 +14,7 @@ class Logging(Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
 
+    @defer_cog_load
     async def cog_load(self) -> None:
         """Announce our presence to the configured dev-log channel after checking channel constants."""
         await self.check_channels()
@@ -5,9 +5,13 @@ from discord.ext import commands
 
 from bot.bot import Bot
 from bot.constants import Colours
+from bot.utils.resources import Resource, read_text
 
-with open("bot/resources/utilities/python_facts.txt") as file:
-    FACTS = itertools.cycle(list(file))
+FACTS = Resource(
+    "bot/resources/utilities/python_facts.txt",
+    read_text,
+    parse=lambda text: itertools.cycle(text.splitlines(keepends=True)),
+)
 
 COLORS = itertools.cycle([Colours.python_blue, Colours.python_yellow])
 PYFACTS_DISCUSSION = "https://github.com/python-discord/meta/discussions/93"
@@ -21,7 +25,7 @@ class PythonFacts(commands.Cog):
         """Sends a Random fun fact about Python."""
         embed = discord.Embed(
             title="Python Facts",
-            description=next(FACTS),
+            description=next(FACTS()),
             colour=next(COLORS)
         )
         embed.add_field(
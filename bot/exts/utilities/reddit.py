@@ -13,7 +13,9 @@ from pydis_core.utils.logging import get_logger
 
 from bot.bot import Bot
 from bot.constants import Channels, ERROR_REPLIES, Emojis, Reddit as RedditConfig, STAFF_ROLES
+from bot.utils.caching import RedisTTLCache
 from bot.utils.converters import Subreddit
+from bot.utils.extension_loader import defer_cog_load
 from bot.utils.messages import sub_clyde
 from bot.utils.pagination import ImagePaginator, LinePaginator
 
@@ -25,10 +27,23 @@ URL = "https://www.reddit.com"
 OAUTH_URL = "https://oauth.reddit.com"
 MAX_RETRIES = 3
 
+# How often the digest of each time window is refetched, in seconds.
+# Digests live for twice as long, so a failed refresh still leaves the previous one readable.
+DIGEST_REFRESH_INTERVALS = {
+    "day": 30 * 60,
+    "week": 3 * 60 * 60,
+    "all": 12 * 60 * 60,
+}
+# The fields of a post used to build its page, everything else is dropped before caching.
+DIGEST_POST_FIELDS = ("title", "permalink", "selftext", "ups", "num_comments", "author", "is_video", "url")
+
 
 class Reddit(Cog):
     """Track subreddit posts and show detailed statistics about them."""
 
+    # RedisTTLCache[f"{time}:{subreddit}", dict]
+    digests = RedisTTLCache()
+
     def __init__(self, bot: Bot):
         self.bot = bot
 
@@ -36,15 +51,18 @@ class Reddit(Cog):
         self.access_token = None
         self.client_auth = BasicAuth(RedditConfig.client_id.get_secret_value(), RedditConfig.secret.get_secret_value())
 
+        self.refresh_digests.start()
         if RedditConfig.send_top_daily_posts:
             self.auto_poster_loop.start()
 
     async def cog_unload(self) -> None:
-        """Stop the loop task and revoke the access token when the cog is unloaded."""
+        """Stop the loop tasks and revoke the access token when the cog is unloaded."""
+        self.refresh_digests.cancel()
         self.auto_poster_loop.cancel()
         if self.access_token and self.access_token.expires_at > datetime.now(tz=UTC):
             await self.revoke_access_token()
 
+    @defer_cog_load
     async def cog_load(self) -> None:
         """Sets the reddit webhook when the cog is loaded."""
         self.webhook = await self.bot.fetch_webhook(RedditConfig.webhook)
@@ -224,11 +242,15 @@ class Reddit(Cog):
         """
         embed = Embed()
 
-        posts = await self.fetch_posts(
-            route=f"{subreddit}/top",
-            amount=amount,
-            params={"t": time}
-        )
+        posts = await self.get_digest(subreddit, time)
+        if posts is None:
+            posts = await self.fetch_posts(
+                route=f"{subreddit}/top",
+                amount=amount,
+                params={"t": time}
+            )
+        posts = posts[:amount]
+
         if not posts:
             embed.title = random.choice(ERROR_REPLIES)
             embed.colour = Colour.red()
@@ -247,6 +269,79 @@ class Reddit(Cog):
         embed.colour = Colour.og_blurple()
         return embed
 
+    @staticmethod
+    def _digest_key(subreddit: str, time: str) -> str:
+        return f"{time}:{subreddit.lower()}"
+
+    async def get_digest(self, subreddit: str, time: str) -> list[dict] | None:
+        """
+        Get the cached top posts of a configured subreddit within the `time` window.
+
+        None is returned if the subreddit isn't one we relay, or if its digest hasn't been fetched yet.
+        """
+        if time not in DIGEST_REFRESH_INTERVALS:
+            return None
+        if subreddit.lower() not in {sub.lower() for sub in RedditConfig.subreddits}:
+            return None
+
+        digest = await self.digests.get(self._digest_key(subreddit, time))
+        if digest is None:
+            return None
+        return digest["posts"]
+
+    async def _refresh_digest(self, subreddit: str, time: str) -> None:
+        """Fetch the top posts of `subreddit` within `time` and store them as its digest."""
+        posts = await self.fetch_posts(route=f"{subreddit}/top", params={"t": time})
+        if not posts:
+            # Keep serving the previous digest until it expires instead of caching a failure.
+            log.info(f"Could not refresh the {time} digest of {subreddit}.")
+            return
+
+        digest = {
+            "fetched_at": datetime.now(tz=UTC).timestamp(),
+            "posts": [
+                {"data": {field: post["data"][field] for field in DIGEST_POST_FIELDS}}
+                for post in posts
+            ],
+        }
+        await self.digests.set(
+            self._digest_key(subreddit, time),
+            digest,
+            ttl=DIGEST_REFRESH_INTERVALS[time] * 2,
+        )
+
+    async def _is_digest_stale(self, subreddit: str, time: str) -> bool:
+        digest = await self.digests.get(self._digest_key(subreddit, time))
+        if digest is None:
+            return True
+        age = datetime.now(tz=UTC).timestamp() - digest["fetched_at"]
+        return age >= DIGEST_REFRESH_INTERVALS[time]
+
+    @loop(seconds=min(DIGEST_REFRESH_INTERVALS.values()))
+    async def refresh_digests(self) -> None:
+        """Concurrently refetch the stale digests of every relayed subreddit."""
+        stale = [
+            (subreddit, time)
+            for time in DIGEST_REFRESH_INTERVALS
+            for subreddit in RedditConfig.subreddits
+            if await self._is_digest_stale(subreddit, time)
+        ]
+        if not stale:
+            return
+
+        # Renew the token up front, rather than having every concurrent fetch race to do so.
+        if not self.access_token or self.access_token.expires_at < datetime.now(tz=UTC):
+            await self.get_access_token()
+
+        log.debug(f"Refreshing {len(stale)} stale reddit digests.")
+        results = await asyncio.gather(
+            *(self._refresh_digest(subreddit, time) for subreddit, time in stale),
+            return_exceptions=True,
+        )
+        for (subreddit, time), result in zip(stale, results, strict=True):
+            if isinstance(result, Exception):
+                log.warning(f"Failed to refresh the {time} digest of {subreddit}.", exc_info=result)
+
     @loop()
     async def auto_poster_loop(self) -> None:
         """Post the top 5 posts daily, and the top 5 posts weekly."""
@@ -259,7 +354,7 @@ class Reddit(Cog):
         await sleep_until(midnight_tomorrow)
 
         if not self.webhook:
-            await self.bot.fetch_webhook(RedditConfig.webhook)
+            self.webhook = await self.bot.fetch_webhook(RedditConfig.webhook)
 
         if datetime.now(tz=UTC).weekday() == 0:
             await self.top_weekly_posts()
@@ -1,7 +1,9 @@
+import json
 import random
 import re
 
 import rapidfuzz
+from async_rediscache import RedisCache
 from discord import Embed, File
 from discord.ext import commands, tasks
 from pydis_core.utils.logging import get_logger
@@ -33,28 +35,58 @@ MINIMUM_CERTAINTY = 55
 class WTFPython(commands.Cog):
     """Cog that allows getting WTF Python entries from the WTF Python repository."""
 
+    # RedisCache["etag" | "headers", str]
+    readme_index = RedisCache()
+
     def __init__(self, bot: Bot):
         self.bot = bot
+        self.etag: str | None = None
         self.headers: dict[str, str] = {}
+        # The headings, and their versions preprocessed for fuzzy matching, in the same order
+        self.titles: list[str] = []
+        self.choices: list[str] = []
+
+    async def cog_load(self) -> None:
+        """Load the README index persisted by a previous run, then start keeping it up to date."""
+        if headers := await self.readme_index.get("headers"):
+            self.etag = await self.readme_index.get("etag")
+            self.set_headers(json.loads(headers))
+            log.trace(f"Loaded {len(self.headers)} persisted WTF Python headings.")
+
         self.fetch_readme.start()
 
     @tasks.loop(minutes=60)
     async def fetch_readme(self) -> None:
-        """Gets the content of README.md from the WTF Python Repository."""
-        async with self.bot.http_session.get(f"{WTF_PYTHON_RAW_URL}README.md") as resp:
+        """Gets the content of README.md from the WTF Python Repository, if it changed since the last fetch."""
+        request_headers = {"If-None-Match": self.etag} if self.etag else {}
+        async with self.bot.http_session.get(f"{WTF_PYTHON_RAW_URL}README.md", headers=request_headers) as resp:
             log.trace("Fetching the latest WTF Python README.md")
-            if resp.status == 200:
-                raw = await resp.text()
-                self.parse_readme(raw)
+            if resp.status == 304:
+                log.trace("WTF Python README.md is unchanged.")
+                return
+            if resp.status != 200:
+                return
+
+            raw = await resp.text()
+            etag = resp.headers.get("ETag")
+
+        headers = self.parse_readme(raw)
+        self.set_headers(headers)
+        self.etag = etag
 
-    def parse_readme(self, data: str) -> None:
+        await self.readme_index.set("headers", json.dumps(headers))
+        if etag:
+            await self.readme_index.set("etag", etag)
+
+    @staticmethod
+    def parse_readme(data: str) -> dict[str, str]:
         """
         Parses the README.md into a dict.
 
-        It parses the readme into the `self.headers` dict,
-        where the key is the heading and the value is the
-        link to the heading.
+        The key is the heading, without its `▶` marker, and the value is the link to the heading.
         """
+        headers = {}
+
         # Match the start of examples, until the end of the table of contents (toc)
         table_of_contents = re.search(
             r"\[👀 Examples\]\(#-examples\)\n([\w\W]*)<!-- tocstop -->", data
@@ -63,8 +95,17 @@ class WTFPython(commands.Cog):
         for header in list(map(str.strip, table_of_contents)):
             match = re.search(r"\[▶ (.*)\]\((.*)\)", header)
             if match:
-                hyper_link = match[0].split("(")[1].replace(")", "")
-                self.headers[match[0]] = f"{BASE_URL}/{hyper_link}"
+                title, hyper_link = match.groups()
+                headers[title] = f"{BASE_URL}/{hyper_link}"
+
+        return headers
+
+    def set_headers(self, headers: dict[str, str]) -> None:
+        """Replace the headings, along with their preprocessed versions used for fuzzy matching."""
+        titles = list(headers)
+        choices = [rapidfuzz.utils.default_process(title) for title in titles]
+        # Swap them all at once, so a query never sees the headings and choices out of sync.
+        self.headers, self.titles, self.choices = headers, titles, choices
 
     def fuzzy_match_header(self, query: str) -> str | None:
         """
@@ -74,8 +115,13 @@ class WTFPython(commands.Cog):
         The certainty returned by rapidfuzz.process.extractOne is a score between 0 and 100,
         with 100 being a perfect match.
         """
-        match, certainty, _ = rapidfuzz.process.extractOne(query, self.headers.keys())
-        return match if certainty > MINIMUM_CERTAINTY else None
+        titles, choices = self.titles, self.choices
+        result = rapidfuzz.process.extractOne(rapidfuzz.utils.default_process(query), choices)
+        if result is None:
+            return None
+
+        _, certainty, index = result
+        return titles[index] if certainty > MINIMUM_CERTAINTY else None
 
     @commands.command(aliases=("wtf",))
     async def wtf_python(self, ctx: commands.Context, *, query: str | None = None) -> None:
@@ -120,7 +166,7 @@ class WTFPython(commands.Cog):
         embed = Embed(
             title="WTF Python?!",
             colour=constants.Colours.dark_green,
-            description=f"""Search result for '{query}': {match.split("]")[0].replace("[", "")}
+            description=f"""Search result for '{query}': ▶ {match}
             [Go to Repository Section]({self.headers[match]})""",
         )
         logo = File(LOGO_PATH, filename="wtf_logo.jpg")
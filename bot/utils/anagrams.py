@@ -0,0 +1,92 @@
+import random
+from collections.abc import Iterable
+
+from pydis_core.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+
+def normalize_word(word: str) -> str:
+    """Normalize a word or guess, so that differences in case and surrounding whitespace don't matter."""
+    return word.strip().casefold()
+
+
+def signature(word: str) -> str:
+    """Get the signature of a word, its normalized letters in sorted order, which all of its anagrams share."""
+    return "".join(sorted(normalize_word(word)))
+
+
+class AnagramIndex:
+    """
+    An index of the words in a word list, grouped by their signature.
+
+    Each group of words sharing a signature is a puzzle. The puzzles are also bucketed by their number of letters
+    and number of answers, so a puzzle of a given difficulty can be drawn without going through all of them.
+    """
+
+    def __init__(self, puzzles: dict[str, tuple[str, ...]]):
+        self._puzzles = puzzles
+        # (letter count, answer count) -> signatures
+        self._buckets: dict[tuple[int, int], list[str]] = {}
+        for key, answers in puzzles.items():
+            self._buckets.setdefault((len(key), len(answers)), []).append(key)
+
+    def __len__(self) -> int:
+        return len(self._puzzles)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._puzzles
+
+    @classmethod
+    def from_words(cls, words: Iterable[str], *, min_answers: int = 2) -> "AnagramIndex":
+        """Index a list of words, keeping the puzzles with at least `min_answers` answers."""
+        groups: dict[str, set[str]] = {}
+        for word in words:
+            if word := normalize_word(word):
+                groups.setdefault(signature(word), set()).add(word)
+
+        return cls({
+            key: tuple(sorted(answers))
+            for key, answers in groups.items()
+            if len(answers) >= min_answers
+        })
+
+    @classmethod
+    def from_puzzles(cls, puzzles: dict[str, list[str]]) -> "AnagramIndex":
+        """Index puzzles which are already grouped, mapping each signature to its answers."""
+        index = cls({signature(key): tuple(map(normalize_word, answers)) for key, answers in puzzles.items()})
+        log.trace(f"Indexed {len(index)} anagram puzzles.")
+        return index
+
+    def answers(self, key: str) -> tuple[str, ...]:
+        """Get the answers to the puzzle with the signature `key`."""
+        return self._puzzles.get(key, ())
+
+    def is_answer(self, key: str, guess: str) -> bool:
+        """Check whether `guess` is one of the answers to the puzzle with the signature `key`."""
+        guess = normalize_word(guess)
+        return len(guess) == len(key) and guess in self._puzzles.get(key, ())
+
+    def draw(
+        self,
+        *,
+        min_letters: int = 0,
+        max_letters: int | None = None,
+        min_answers: int = 0,
+        max_answers: int | None = None,
+    ) -> str | None:
+        """
+        Draw the signature of a random puzzle, with its letter and answer counts within the given bounds.
+
+        Every puzzle within the bounds is equally likely to be drawn. None is returned if there aren't any.
+        """
+        buckets = [
+            bucket for (letters, answers), bucket in self._buckets.items()
+            if min_letters <= letters and (max_letters is None or letters <= max_letters)
+            and min_answers <= answers and (max_answers is None or answers <= max_answers)
+        ]
+        if not buckets:
+            return None
+
+        bucket, = random.choices(buckets, weights=[len(bucket) for bucket in buckets])
+        return random.choice(bucket)
@@ -0,0 +1,59 @@
+import json
+from typing import Any
+
+from async_rediscache import RedisObject
+from pydis_core.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+
+class RedisTTLCache(RedisObject):
+    """
+    A namespaced Redis key/value store where every key carries its own expiry.
+
+    `RedisCache` stores everything in a single hash, so expiries can only be set on the
+    whole namespace. This instead stores each entry as its own Redis key, named
+    `<namespace>:<key>`, which lets every entry expire independently.
+
+    Values are serialised as JSON, so anything `json.dumps` understands may be stored.
+
+    Like `RedisCache`, this MUST be created as a class attribute for its namespace to be set:
+
+    class SomeCog(Cog):
+        posts = RedisTTLCache()
+
+        async def my_method(self):
+            await self.posts.set("r/python", [...], ttl=60 * 60)
+            posts = await self.posts.get("r/python")
+    """
+
+    def _key(self, key: str | int) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str | int, default: Any = None) -> Any:
+        """Get the value stored at `key`, or `default` if it is missing or has expired."""
+        value = await self.redis_session.client.get(self._key(key))
+        if value is None:
+            return default
+        return json.loads(value)
+
+    async def set(self, key: str | int, value: Any, *, ttl: float | None = None) -> None:
+        """Store `value` at `key`, expiring after `ttl` seconds. A `ttl` of None means it never expires."""
+        log.trace(f"Setting {self._key(key)} with a TTL of {ttl}.")
+        px = int(ttl * 1000) if ttl is not None else None
+        await self.redis_session.client.set(self._key(key), json.dumps(value), px=px)
+
+    async def delete(self, key: str | int) -> None:
+        """Remove `key` from the cache, if it exists."""
+        await self.redis_session.client.delete(self._key(key))
+
+    async def contains(self, key: str | int) -> bool:
+        """Return whether `key` is currently stored."""
+        return bool(await self.redis_session.client.exists(self._key(key)))
+
+    async def ttl(self, key: str | int) -> float | None:
+        """Return how many seconds `key` has left to live, or None if it is missing or has no expiry."""
+        remaining = await self.redis_session.client.pttl(self._key(key))
+        if remaining < 0:
+            return None
+        return remaining / 1000
@@ -0,0 +1,205 @@
+import time
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+import discord
+from aiohttp import web
+from discord.ext import commands
+from pydis_core.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+# The upper bounds in seconds of the histogram buckets, the last bucket holds everything above them
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+METRICS_PREFIX = "sir_lancebot"
+
+
+class Histogram:
+    """
+    Counts observations into a fixed set of buckets, so it never grows however many observations it gets.
+
+    Quantiles are estimated by interpolating within the bucket they fall into, like Prometheus does.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(sorted(buckets))
+        # One more count than there are bounds, for the observations above the last one
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def cumulative(self) -> Iterator[tuple[float, int]]:
+        """Get the upper bound of each bucket with the number of observations up to it, ending with infinity."""
+        total = 0
+        for bound, count in zip((*self.bounds, float("inf")), self.counts, strict=True):
+            total += count
+            yield bound, total
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value below which the fraction `q` of the observations fall."""
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        lower = 0.0
+        previous = 0
+        for bound, total in self.cumulative():
+            if total >= rank:
+                if bound == float("inf"):
+                    # Nothing's known about the last bucket, other than the largest observation in it
+                    return self.max
+                fraction = (rank - previous) / (total - previous) if total > previous else 1
+                return min(lower + (bound - lower) * fraction, self.max)
+            lower, previous = bound, total
+        return self.max
+
+
+@dataclass
+class CommandStats:
+    """The latencies, errors and concurrency of a single command."""
+
+    # From the command being invoked to it completing or failing
+    latency: Histogram = field(default_factory=Histogram)
+    # From the command being invoked to the first message it sent through its context
+    first_response: Histogram = field(default_factory=Histogram)
+    errors: Counter[str] = field(default_factory=Counter)
+    in_progress: int = 0
+    max_in_progress: int = 0
+
+
+class InstrumentedContext(commands.Context):
+    """A context which records when the command first sent a message through it."""
+
+    started_at: float | None = None
+    first_response_at: float | None = None
+    # The stats the invocation is counted as in progress in, which are those of the command it was started with
+    in_progress_stats: CommandStats | None = None
+
+    async def send(self, *args, **kwargs) -> discord.Message:
+        """Send a message to the context's channel, recording the time if it's the first one."""
+        message = await super().send(*args, **kwargs)
+        if self.first_response_at is None:
+            self.first_response_at = time.perf_counter()
+        return message
+
+
+class CommandMetrics:
+    """
+    Keeps the latency histograms, error counts and concurrency of every command invoked since the bot started.
+
+    The bot calls `start` as it invokes each context, since listeners only run once the invocation first yields,
+    and adds the `on_command_completion` and `on_command_error` methods as listeners.
+    """
+
+    def __init__(self):
+        # Qualified command name -> stats
+        self.commands: dict[str, CommandStats] = {}
+
+    def get(self, command: commands.Command) -> CommandStats:
+        """Get the stats of `command`, creating them if it wasn't invoked before."""
+        name = command.qualified_name
+        if name not in self.commands:
+            self.commands[name] = CommandStats()
+        return self.commands[name]
+
+    def start(self, ctx: commands.Context) -> None:
+        """Start timing the invocation of `ctx`, and count it as in progress."""
+        ctx.started_at = time.perf_counter()
+        if ctx.command is None:
+            return
+
+        # Preparing a group's invocation rebinds the context's command to the subcommand, so the stats are kept
+        ctx.in_progress_stats = stats = self.get(ctx.command)
+        stats.in_progress += 1
+        stats.max_in_progress = max(stats.max_in_progress, stats.in_progress)
+
+    async def on_command_completion(self, ctx: commands.Context) -> None:
+        """Record the latency of the invocation."""
+        self._finish(ctx)
+
+    async def on_command_error(self, ctx: commands.Context, error: commands.CommandError) -> None:
+        """Record the latency of the invocation and the type of error it raised."""
+        if ctx.command is None:
+            return
+
+        error = getattr(error, "original", error)
+        self.get(ctx.command).errors[type(error).__name__] += 1
+        self._finish(ctx)
+
+    def _finish(self, ctx: commands.Context) -> None:
+        # Errors can be raised before the invocation started, such as when the command isn't found
+        if (started_at := getattr(ctx, "started_at", None)) is None:
+            return
+
+        if (in_progress_stats := getattr(ctx, "in_progress_stats", None)) is not None:
+            in_progress_stats.in_progress -= 1
+            ctx.in_progress_stats = None
+
+        stats = self.get(ctx.command)
+        stats.latency.observe(time.perf_counter() - started_at)
+        if (first_response_at := getattr(ctx, "first_response_at", None)) is not None:
+            stats.first_response.observe(first_response_at - started_at)
+
+    def render(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, help_text, attribute in (
+            ("command_duration_seconds", "Time from invoking a command to it finishing.", "latency"),
+            ("command_first_response_seconds", "Time from invoking a command to its first message.", "first_response"),
+        ):
+            metric = f"{METRICS_PREFIX}_{name}"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+            for command, stats in sorted(self.commands.items()):
+                histogram: Histogram = getattr(stats, attribute)
+                label = f'command="{_escape(command)}"'
+                lines.extend(
+                    f'{metric}_bucket{{{label},le="{"+Inf" if bound == float("inf") else bound}"}} {total}'
+                    for bound, total in histogram.cumulative()
+                )
+                lines += [f"{metric}_sum{{{label}}} {histogram.sum}", f"{metric}_count{{{label}}} {histogram.count}"]
+
+        metric = f"{METRICS_PREFIX}_command_errors_total"
+        lines += [f"# HELP {metric} Errors raised by commands, by type.", f"# TYPE {metric} counter"]
+        for command, stats in sorted(self.commands.items()):
+            lines.extend(
+                f'{metric}{{command="{_escape(command)}",error="{error}"}} {count}'
+                for error, count in sorted(stats.errors.items())
+            )
+
+        metric = f"{METRICS_PREFIX}_commands_in_progress"
+        lines += [f"# HELP {metric} Invocations of commands which haven't finished yet.", f"# TYPE {metric} gauge"]
+        lines.extend(
+            f'{metric}{{command="{_escape(command)}"}} {stats.in_progress}'
+            for command, stats in sorted(self.commands.items())
+        )
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+async def start_metrics_server(metrics: CommandMetrics, host: str, port: int) -> web.AppRunner:
+    """Serve the command metrics at `/metrics` on the given address, returning the runner to clean up once done."""
+    async def handle(_request: web.Request) -> web.Response:
+        return web.Response(text=metrics.render(), content_type="text/plain", charset="utf-8")
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle)
+
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    log.info(f"Serving command metrics on http://{host}:{port}/metrics.")
+    return runner
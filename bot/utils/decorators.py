@@ -17,6 +17,9 @@ from bot.utils.checks import in_whitelist_check
 
 ONE_DAY = 24 * 60 * 60
 
+# Set on month-locked listeners, commands' checks and seasonal tasks to the months they're active in
+MONTHS_ATTRIBUTE = "__in_months__"
+
 log = get_logger(__name__)
 
 
@@ -55,6 +58,8 @@ def seasonal_task(*allowed_months: Month, sleep_time: float | int = ONE_DAY) ->
                     log.debug(f"Seasonal task {task_body.__qualname__} sleeps in {current_month!s}")
 
                 await asyncio.sleep(sleep_time)
+
+        setattr(decorated_task, MONTHS_ATTRIBUTE, allowed_months)
         return decorated_task
     return decorator
 
@@ -76,6 +81,8 @@ def in_month_listener(*allowed_months: Month) -> Callable:
                 return await listener(*args, **kwargs)
             log.debug(f"Guarded {listener.__qualname__} from invoking in {current_month!s}")
             return None
+
+        setattr(guarded_listener, MONTHS_ATTRIBUTE, allowed_months)
         return guarded_listener
     return decorator
 
@@ -98,6 +105,7 @@ def in_month_command(*allowed_months: Month) -> Callable:
             return True
         raise InMonthCheckFailure(f"Command can only be used in {human_months(allowed_months)}")
 
+    setattr(predicate, MONTHS_ATTRIBUTE, allowed_months)
     return commands.check(predicate)
 
 
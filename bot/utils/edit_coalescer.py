@@ -0,0 +1,73 @@
+import asyncio
+import contextlib
+import time
+from typing import Any
+
+import discord
+from pydis_core.utils import scheduling
+from pydis_core.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+# The default minimum number of seconds between two edits of the same message
+DEFAULT_EDIT_INTERVAL = 1
+
+
+class MessageEditCoalescer:
+    """
+    Edits a message to its latest state, at most once every `interval` seconds.
+
+    Games which edit a message on every change of their state can fall behind Discord's rate limits
+    when a lot of changes happen at once. Instead, every change is passed to `update`, which returns
+    immediately. Only the latest state is applied once the interval has passed, skipping any states in between.
+
+    Once the game ends, `flush` applies the latest state right away and waits for it to be applied:
+
+    editor = MessageEditCoalescer(message)
+    for answer in answers:
+        editor.update(embed=create_embed(answer))
+    await editor.flush()
+    """
+
+    def __init__(self, message: discord.Message, *, interval: float = DEFAULT_EDIT_INTERVAL):
+        self.message = message
+        self.interval = interval
+
+        # The keyword arguments to edit the message with next, if there are any
+        self._pending: dict[str, Any] | None = None
+        self._last_edit = 0.0
+        self._task: asyncio.Task | None = None
+        self._flushing = asyncio.Event()
+
+    def update(self, **fields: Any) -> None:
+        """Set the fields the message should be edited to, replacing any which haven't been applied yet."""
+        self._pending = fields
+        if self._task is None or self._task.done():
+            self._task = scheduling.create_task(self._apply_pending())
+
+    async def _apply_pending(self) -> None:
+        """Edit the message to the latest state, waiting for the interval since the previous edit first."""
+        while self._pending is not None:
+            delay = self._last_edit + self.interval - time.monotonic()
+            if delay > 0 and not self._flushing.is_set():
+                # Flushing cuts the wait short
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._flushing.wait(), delay)
+
+            fields, self._pending = self._pending, None
+            self._last_edit = time.monotonic()
+            try:
+                self.message = await self.message.edit(**fields)
+            except discord.HTTPException as e:
+                log.warning(f"Failed to edit message {self.message.id}: {e}")
+
+    async def flush(self) -> None:
+        """Apply the latest state right away, and wait until it has been applied."""
+        if self._task is None or self._task.done():
+            return
+
+        self._flushing.set()
+        try:
+            await self._task
+        finally:
+            self._flushing.clear()
@@ -0,0 +1,181 @@
+import asyncio
+import functools
+import importlib
+import importlib.abc
+import importlib.machinery
+import time
+import types
+from collections.abc import Callable, Coroutine, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from discord.ext import commands
+from pydis_core.utils import scheduling
+from pydis_core.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from bot.bot import Bot
+
+log = get_logger(__name__)
+
+# The maximum number of extensions which are set up at the same time
+EXTENSION_LOAD_CONCURRENCY = 10
+
+
+@dataclass
+class ExtensionTiming:
+    """How long importing and setting up an extension took, in seconds."""
+
+    name: str
+    import_time: float = 0
+    setup_time: float = 0
+    failed: bool = False
+    out_of_season: bool = False
+
+    @property
+    def total_time(self) -> float:
+        """The time taken to import and set up the extension."""
+        return self.import_time + self.setup_time
+
+
+class ExtensionLoader:
+    """
+    Loads extensions in two phases, reporting how long each extension took to load.
+
+    Every extension is imported first, one after the other, since imports block the event loop anyway.
+    Seasonal extensions are registered with the bot's `SeasonalExtensions` as they're imported,
+    and the ones which are out of season aren't set up. The other extensions are then loaded from the imported
+    modules, without executing them again, so their `setup` functions and the `cog_load` of the cogs they add
+    run concurrently, with at most `concurrency` of them at once.
+    Network-bound `cog_load` methods can be moved to the background entirely with `defer_cog_load`,
+    so that they don't hold up the others.
+    """
+
+    def __init__(self, bot: "Bot", *, concurrency: int = EXTENSION_LOAD_CONCURRENCY):
+        self.bot = bot
+        self.concurrency = concurrency
+        self.timings: dict[str, ExtensionTiming] = {}
+
+    async def load(self, extensions: Iterable[str]) -> None:
+        """Load the given extensions, then log the startup report."""
+        start = time.perf_counter()
+        self.timings = {name: ExtensionTiming(name) for name in sorted(extensions)}
+
+        for timing in self.timings.values():
+            self._import(timing)
+            # Let anything else waiting on the event loop run between imports
+            await asyncio.sleep(0)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*(
+            self._set_up(timing, semaphore)
+            for timing in self.timings.values()
+            if not timing.failed and not timing.out_of_season
+        ))
+
+        self.log_report(time.perf_counter() - start)
+
+    def _import(self, timing: ExtensionTiming) -> None:
+        """
+        Import the extension, along with everything it imports.
+
+        The module is handed to `load_extension` once it loads the extension, rather than being executed again.
+        """
+        start = time.perf_counter()
+        try:
+            module = importlib.import_module(timing.name)
+        except Exception:
+            log.exception(f"Failed to import extension {timing.name}.")
+            timing.failed = True
+        else:
+            module.__spec__.loader = _ImportedModuleLoader(module)
+            self.bot.seasonal_extensions.register(module)
+            timing.out_of_season = not self.bot.seasonal_extensions.in_season(timing.name)
+        timing.import_time = time.perf_counter() - start
+
+    async def _set_up(self, timing: ExtensionTiming, semaphore: asyncio.Semaphore) -> None:
+        """Load the extension, running its `setup` function."""
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await self.bot.load_extension(timing.name)
+            except Exception:
+                log.exception(f"Failed to load extension {timing.name}.")
+                timing.failed = True
+            timing.setup_time = time.perf_counter() - start
+
+    def log_report(self, elapsed: float) -> None:
+        """Log the time each extension took to import and set up, slowest first."""
+        timings = sorted(self.timings.values(), key=lambda timing: timing.total_time, reverse=True)
+        failed = sum(timing.failed for timing in timings)
+        out_of_season = sum(timing.out_of_season for timing in timings)
+        width = max((len(timing.name) for timing in timings), default=0)
+
+        lines = [f"{'Extension':<{width}} {'Import':>9} {'Setup':>9} {'Total':>9}"]
+        lines.extend(
+            f"{timing.name:<{width}} {timing.import_time * 1000:>7.1f}ms {timing.setup_time * 1000:>7.1f}ms "
+            f"{timing.total_time * 1000:>7.1f}ms{self._status(timing)}"
+            for timing in timings
+        )
+        log.info(
+            f"Loaded {len(timings) - failed - out_of_season} extensions in {elapsed:.2f}s"
+            f"{f', {out_of_season} out of season' if out_of_season else ''}"
+            f"{f', {failed} failed to load' if failed else ''}.\n" + "\n".join(lines)
+        )
+
+    @staticmethod
+    def _status(timing: ExtensionTiming) -> str:
+        if timing.failed:
+            return " (failed)"
+        if timing.out_of_season:
+            return " (out of season)"
+        return ""
+
+
+class _ImportedModuleLoader(importlib.abc.Loader):
+    """
+    Loads a module which was already imported, instead of executing it again.
+
+    `load_extension` finds the spec of a module which is already imported through the module itself,
+    so setting this as its loader makes it load the imported module. The original loader is restored once it has,
+    so reloading the extension executes it from its source again.
+    """
+
+    def __init__(self, module: types.ModuleType):
+        self.module = module
+        self.original_loader = module.__spec__.loader
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> types.ModuleType:
+        """Use the imported module, instead of creating a new one."""
+        return self.module
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        """Restore the module's original loader, since it's been executed already."""
+        module.__spec__.loader = self.original_loader
+
+
+def defer_cog_load(
+    func: Callable[[commands.Cog], Coroutine[None, None, None]]
+) -> Callable[[commands.Cog], Coroutine[None, None, None]]:
+    """
+    Run the decorated `cog_load` in the background, so that loading the cog doesn't wait for it.
+
+    The background task is kept as the cog's `cog_load_task`, for anything which needs to wait for it to finish.
+    It's cancelled if the cog is removed before it finishes, and the cog is removed from its `bot` if it fails,
+    like it would be if it failed to load.
+    """
+    @functools.wraps(func)
+    async def cog_load(self: commands.Cog) -> None:
+        async def run() -> None:
+            start = time.perf_counter()
+            try:
+                await func(self)
+            except Exception:
+                log.exception(f"Deferred cog_load of {self.qualified_name} failed, removing the cog.")
+                await self.bot.remove_cog(self.qualified_name)
+                return
+            log.debug(f"Deferred cog_load of {self.qualified_name} finished in {time.perf_counter() - start:.2f}s.")
+
+        self.cog_load_task = scheduling.create_task(run(), name=f"{self.qualified_name} cog_load")
+
+    return cog_load
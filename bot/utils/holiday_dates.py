@@ -0,0 +1,68 @@
+"""A persistent, year-scoped store of festival dates, fetched from the Hebcal API."""
+
+from datetime import date
+
+from pydis_core.utils.logging import get_logger
+
+from bot.bot import Bot
+from bot.utils.caching import RedisTTLCache
+
+log = get_logger(__name__)
+
+HEBCAL_URL = (
+    "https://www.hebcal.com/hebcal/?v=1&cfg=json&maj=on&min=on&mod=on&nx=on&"
+    "year={year}&month=x&ss=on&mf=on&c=on&geo=geoname&geonameid=3448439&m=50&s=on"
+)
+
+# Calendars of past and future years don't change, so they're kept forever
+# RedisTTLCache[year, dict[festival_title, list[iso_date]]]
+_calendars = RedisTTLCache(namespace="holiday_dates")
+
+# Calendars already read during this run, so repeated lookups don't even need Redis
+_loaded_calendars: dict[int, dict[str, list[date]]] = {}
+
+
+async def _fetch_calendar(bot: Bot, year: int) -> dict[str, list[str]]:
+    """Fetch every festival in `year` from Hebcal, mapping the title of each to its dates."""
+    async with bot.http_session.get(HEBCAL_URL.format(year=year)) as response:
+        response.raise_for_status()
+        json_data = await response.json()
+
+    calendar = {}
+    for festival in json_data["items"]:
+        # Some events have a time attached, only the day is kept
+        calendar.setdefault(festival["title"], []).append(festival["date"][:10])
+    return calendar
+
+
+async def get_calendar(bot: Bot, year: int) -> dict[str, list[date]]:
+    """
+    Get every festival of `year`, mapping the title of each to its dates.
+
+    The calendar is only fetched from Hebcal the first time a year is looked up, afterwards it's read from the store.
+    """
+    if year in _loaded_calendars:
+        return _loaded_calendars[year]
+
+    calendar = await _calendars.get(year)
+    if calendar is None:
+        log.info(f"Fetching the {year} holiday calendar from Hebcal.")
+        calendar = await _fetch_calendar(bot, year)
+        await _calendars.set(year, calendar)
+
+    _loaded_calendars[year] = {
+        title: [date.fromisoformat(day) for day in days]
+        for title, days in calendar.items()
+    }
+    return _loaded_calendars[year]
+
+
+async def get_festival_dates(bot: Bot, title_prefix: str, year: int) -> list[date]:
+    """Get the sorted dates in `year` of every festival whose title starts with `title_prefix`."""
+    calendar = await get_calendar(bot, year)
+    return sorted(
+        day
+        for title, days in calendar.items()
+        if title.startswith(title_prefix)
+        for day in days
+    )
@@ -0,0 +1,95 @@
+from async_rediscache import RedisCache, RedisObject
+from pydis_core.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+
+class RedisLeaderboard(RedisObject):
+    """
+    A scoreboard of Discord IDs, backed by a Redis sorted set.
+
+    Unlike keeping the scores in a `RedisCache`, the scores are kept sorted by Redis, so
+    getting the top scores or someone's rank doesn't require reading and sorting all of them.
+
+    Like `RedisCache`, this MUST be created as a class attribute for its namespace to be set:
+
+    class SomeCog(Cog):
+        scores = RedisLeaderboard()
+
+        async def my_method(self):
+            await self.scores.increment(user.id, 5)
+            top_ten = await self.scores.top(10)
+    """
+
+    async def increment(self, member_id: int, amount: float = 1) -> float:
+        """Add `amount` to the score of `member_id`, which may be negative, and return the new score."""
+        log.trace(f"Incrementing the score of {member_id} in {self.namespace} by {amount}.")
+        return await self.redis_session.client.zincrby(self.namespace, amount, member_id)
+
+    async def set(self, member_id: int, score: float) -> None:
+        """Set the score of `member_id`."""
+        await self.redis_session.client.zadd(self.namespace, {member_id: score})
+
+    async def get(self, member_id: int, default: float | None = None) -> float | None:
+        """Get the score of `member_id`, or `default` if they have no score."""
+        score = await self.redis_session.client.zscore(self.namespace, member_id)
+        return default if score is None else score
+
+    async def delete(self, member_id: int) -> None:
+        """Remove `member_id` from the leaderboard, if they're on it."""
+        await self.redis_session.client.zrem(self.namespace, member_id)
+
+    async def top(self, amount: int, *, min_score: float | None = None) -> list[tuple[int, float]]:
+        """
+        Get the IDs and scores of the `amount` highest scoring members, from highest to lowest.
+
+        If `min_score` is given, only members with a score strictly higher than it are included.
+        """
+        if amount <= 0:
+            return []
+
+        if min_score is None:
+            entries = await self.redis_session.client.zrevrange(self.namespace, 0, amount - 1, withscores=True)
+        else:
+            entries = await self.redis_session.client.zrevrangebyscore(
+                self.namespace, "+inf", f"({min_score}", start=0, num=amount, withscores=True
+            )
+        return [(int(member_id), score) for member_id, score in entries]
+
+    async def leaders(self) -> list[tuple[int, float]]:
+        """Get the IDs and score of every member tied for the highest score."""
+        top = await self.top(1)
+        if not top:
+            return []
+
+        _, score = top[0]
+        member_ids = await self.redis_session.client.zrevrangebyscore(self.namespace, score, score)
+        return [(int(member_id), score) for member_id in member_ids]
+
+    async def rank(self, member_id: int) -> int | None:
+        """Get the rank of `member_id`, starting at 1 for the highest score, or None if they have no score."""
+        rank = await self.redis_session.client.zrevrank(self.namespace, member_id)
+        return None if rank is None else rank + 1
+
+    async def length(self) -> int:
+        """Get the number of members on the leaderboard."""
+        return await self.redis_session.client.zcard(self.namespace)
+
+    async def clear(self) -> None:
+        """Remove every member from the leaderboard."""
+        await self.redis_session.client.delete(self.namespace)
+
+    async def migrate_from(self, cache: RedisCache) -> None:
+        """
+        Move the scores stored in a `RedisCache` of IDs to scores into this leaderboard.
+
+        This only does anything if the leaderboard is still empty, and the cache is cleared afterwards.
+        """
+        if await self.length():
+            return
+
+        records = await cache.to_dict()
+        if records:
+            log.info(f"Migrating {len(records)} scores from {cache.namespace} to the {self.namespace} leaderboard.")
+            await self.redis_session.client.zadd(self.namespace, {int(key): value for key, value in records.items()})
+        await cache.clear()
@@ -0,0 +1,186 @@
+import re
+import time
+from collections.abc import Callable, Collection, Container, Coroutine
+from dataclasses import dataclass, field
+from typing import Any, TYPE_CHECKING
+
+import discord
+from discord.ext import commands
+from pydis_core.utils import scheduling
+from pydis_core.utils.logging import get_logger
+
+from bot.constants import Month
+from bot.utils import resolve_current_month
+
+if TYPE_CHECKING:
+    from bot.bot import Bot
+
+log = get_logger(__name__)
+
+MESSAGE_HANDLER_ATTRIBUTE = "__message_handler__"
+
+HandlerCallback = Callable[[commands.Cog, discord.Message], Coroutine[Any, Any, None]]
+ChannelFilter = Container[int] | Callable[[commands.Cog], Container[int]]
+
+
+@dataclass(frozen=True)
+class MessageFilter:
+    """The messages a handler is interested in, as declared through `message_handler`."""
+
+    channels: ChannelFilter | None = None
+    pattern: re.Pattern | None = None
+    months: Collection[Month] | None = None
+    allow_bots: bool = False
+    allow_dms: bool = False
+    allow_commands: bool = True
+
+
+@dataclass
+class HandlerStats:
+    """Timing counters for a single message handler."""
+
+    calls: int = 0
+    failures: int = 0
+    total_time: float = 0
+    max_time: float = 0
+
+    @property
+    def average_time(self) -> float:
+        """The average time in seconds a call to the handler took."""
+        return self.total_time / self.calls if self.calls else 0
+
+
+@dataclass
+class MessageHandler:
+    """A message handler registered by a cog."""
+
+    cog: commands.Cog
+    callback: Callable[[discord.Message], Coroutine[Any, Any, None]]
+    filter: MessageFilter
+    stats: HandlerStats = field(default_factory=HandlerStats)
+
+    @property
+    def name(self) -> str:
+        """The qualified name of the handler, used to identify it in logs and statistics."""
+        return f"{self.cog.qualified_name}.{self.callback.__name__}"
+
+    def channels(self) -> Container[int] | None:
+        """The channels this handler currently listens in, if it's restricted to some."""
+        if callable(self.filter.channels):
+            return self.filter.channels(self.cog)
+        return self.filter.channels
+
+
+def message_handler(
+    *,
+    channels: ChannelFilter | None = None,
+    pattern: re.Pattern | None = None,
+    months: Collection[Month] | None = None,
+    allow_bots: bool = False,
+    allow_dms: bool = False,
+    allow_commands: bool = True,
+) -> Callable[[HandlerCallback], HandlerCallback]:
+    """
+    Register the decorated cog method as a handler for the messages the bot receives.
+
+    Unlike an `on_message` listener, the handler is only called for messages which pass all of its filters:
+      * `channels`: the IDs of the channels to listen in. This can also be a callable taking the cog and
+        returning the IDs, such as `lambda cog: cog.games` to only listen in channels with an active game.
+      * `pattern`: a compiled regex which must be found in the content of the message.
+      * `months`: the months in which to listen, checked against the current UTC month.
+      * `allow_bots`, `allow_dms` and `allow_commands`: whether to handle messages sent by bots,
+        in DMs, and command invocations, respectively. Only command invocations are handled by default.
+
+    The checks shared between handlers are only performed once per message by the bot's `MessageRouter`.
+    """
+    message_filter = MessageFilter(channels, pattern, months, allow_bots, allow_dms, allow_commands)
+
+    def decorator(callback: HandlerCallback) -> HandlerCallback:
+        setattr(callback, MESSAGE_HANDLER_ATTRIBUTE, message_filter)
+        return callback
+    return decorator
+
+
+class MessageRouter:
+    """
+    Dispatches each message the bot receives to the message handlers interested in it.
+
+    Handlers are declared with the `message_handler` decorator, and are picked up when their cog is added to the bot.
+    """
+
+    def __init__(self, bot: "Bot"):
+        self.bot = bot
+        self.handlers: list[MessageHandler] = []
+
+    def register_cog(self, cog: commands.Cog) -> None:
+        """Register all the message handlers of `cog`."""
+        seen = set()
+        for cls in type(cog).__mro__:
+            for name, value in vars(cls).items():
+                if name in seen:
+                    continue
+                seen.add(name)
+
+                message_filter = getattr(value, MESSAGE_HANDLER_ATTRIBUTE, None)
+                if isinstance(message_filter, MessageFilter):
+                    handler = MessageHandler(cog, getattr(cog, name), message_filter)
+                    self.handlers.append(handler)
+                    log.trace(f"Registered message handler {handler.name}.")
+
+    def unregister_cog(self, cog: commands.Cog) -> None:
+        """Unregister all the message handlers of `cog`."""
+        self.handlers = [handler for handler in self.handlers if handler.cog is not cog]
+
+    async def _is_command(self, message: discord.Message) -> bool:
+        """Check whether the message starts with one of the bot's prefixes."""
+        prefix = await self.bot.get_prefix(message)
+        if isinstance(prefix, str):
+            prefix = (prefix,)
+        return message.content.startswith(tuple(prefix))
+
+    async def on_message(self, message: discord.Message) -> None:
+        """Dispatch `message` to every handler whose filters it passes."""
+        if not self.handlers:
+            return
+
+        is_bot = message.author.bot
+        is_dm = message.guild is None
+        channel_id = message.channel.id
+        current_month = resolve_current_month()
+        # Checking for a prefix is the most expensive check, so it's done lazily and at most once.
+        is_command = None
+
+        for handler in self.handlers:
+            message_filter = handler.filter
+            if is_bot and not message_filter.allow_bots:
+                continue
+            if is_dm and not message_filter.allow_dms:
+                continue
+            if message_filter.months is not None and current_month not in message_filter.months:
+                continue
+            if (channels := handler.channels()) is not None and channel_id not in channels:
+                continue
+            if message_filter.pattern is not None and not message_filter.pattern.search(message.content):
+                continue
+            if not message_filter.allow_commands:
+                if is_command is None:
+                    is_command = await self._is_command(message)
+                if is_command:
+                    continue
+
+            scheduling.create_task(self._run_handler(handler, message))
+
+    @staticmethod
+    async def _run_handler(handler: MessageHandler, message: discord.Message) -> None:
+        """Call the handler with `message`, keeping track of how long it takes."""
+        start = time.perf_counter()
+        try:
+            await handler.callback(message)
+        except Exception:
+            handler.stats.failures += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            handler.stats.calls += 1
+            handler.stats.total_time += elapsed
+            handler.stats.max_time = max(handler.stats.max_time, elapsed)
@@ -1,4 +1,5 @@
-from collections.abc import Sequence
+import inspect
+from collections.abc import Awaitable, Sequence
 
 from discord import Embed, Interaction, Member, Message, Reaction
 from discord.abc import User
@@ -96,13 +97,16 @@ class ImagePaginator(Paginator):
         self.images.append(image)
 
     @classmethod
-    async def paginate(cls, pages: list[tuple[str, str]], ctx: Context, embed: Embed,
+    async def paginate(cls, pages: list[tuple[str, str] | Awaitable[tuple[str, str]]], ctx: Context, embed: Embed,
                        prefix: str = "", suffix: str = "", timeout: float = 300,
                        exception_on_empty_embed: bool = False) -> None:
         """
         Use a paginator and set of reactions to provide pagination over a set of title/image pairs.
 
         `pages` is a list of tuples of page title/image url pairs.
+        Pages may also be awaitables resolving to such a tuple, e.g. tasks which are still fetching their
+        content. These are only awaited once the page is about to be shown, so the first page can be sent
+        while the rest are still being prepared.
         `prefix` and `suffix` will be prepended and appended respectively to the message.
 
         When used, this will send a message using `ctx.send()` and apply a set of reactions to it.
@@ -127,6 +131,17 @@ class ImagePaginator(Paginator):
                 not member.bot
             ))
 
+        async def resolve_pages(up_to: int) -> None:
+            """Add the pages up to and including index `up_to` to the paginator, awaiting any lazy ones."""
+            while len(paginator.images) <= up_to:
+                page = pages[len(paginator.images)]
+                if inspect.isawaitable(page):
+                    page = await page
+
+                text, image_url = page
+                paginator.add_line(text)
+                paginator.add_image(image_url)
+
         paginator = cls(prefix=prefix, suffix=suffix)
         current_page = 0
 
@@ -138,9 +153,8 @@ class ImagePaginator(Paginator):
             log.debug("No images to add to paginator, adding '(no images to display)' message")
             pages.append(("(no images to display)", ""))
 
-        for text, image_url in pages:
-            paginator.add_line(text)
-            paginator.add_image(image_url)
+        page_count = len(pages)
+        await resolve_pages(current_page)
 
         embed.description = paginator.pages[current_page]
         image = paginator.images[current_page]
@@ -148,11 +162,11 @@ class ImagePaginator(Paginator):
         if image:
             embed.set_image(url=image)
 
-        if len(paginator.pages) <= 1:
+        if page_count <= 1:
             await ctx.send(embed=embed)
             return None
 
-        embed.set_footer(text=f"Page {current_page + 1}/{len(paginator.pages)}")
+        embed.set_footer(text=f"Page {current_page + 1}/{page_count}")
         message = await ctx.send(embed=embed)
 
         for emoji in PAGINATION_EMOJI.model_dump().values():
@@ -185,11 +199,11 @@ class ImagePaginator(Paginator):
 
             # Last reaction press - [:track_next:]
             if reaction.emoji == PAGINATION_EMOJI.last:
-                if current_page >= len(paginator.pages) - 1:
+                if current_page >= page_count - 1:
                     log.debug("Got last page reaction, but we're on the last page - ignoring")
                     continue
 
-                current_page = len(paginator.pages) - 1
+                current_page = page_count - 1
                 reaction_type = "last"
 
             # Previous reaction press - [:arrow_left: ]
@@ -203,7 +217,7 @@ class ImagePaginator(Paginator):
 
             # Next reaction press - [:arrow_right:]
             if reaction.emoji == PAGINATION_EMOJI.right:
-                if current_page >= len(paginator.pages) - 1:
+                if current_page >= page_count - 1:
                     log.debug("Got next page reaction, but we're on the last page - ignoring")
                     continue
 
@@ -211,13 +225,14 @@ class ImagePaginator(Paginator):
                 reaction_type = "next"
 
             # Magic happens here, after page and reaction_type is set
+            await resolve_pages(current_page)
             embed.description = paginator.pages[current_page]
 
             image = paginator.images[current_page] or None
             embed.set_image(url=image)
 
-            embed.set_footer(text=f"Page {current_page + 1}/{len(paginator.pages)}")
-            log.debug(f"Got {reaction_type} page reaction - changing to page {current_page + 1}/{len(paginator.pages)}")
+            embed.set_footer(text=f"Page {current_page + 1}/{page_count}")
+            log.debug(f"Got {reaction_type} page reaction - changing to page {current_page + 1}/{page_count}")
 
             await message.edit(embed=embed)
 
@@ -0,0 +1,92 @@
+from collections import deque
+
+import discord
+from pydis_core.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+
+class RecentMessages:
+    """
+    Keeps the IDs of the last `size` messages sent in each channel it is fed.
+
+    This lets cogs check whether a message is among the most recent ones of its channel
+    without requesting the channel's history from Discord every time.
+    The cog using it is responsible for feeding it new messages and pruning deleted ones:
+
+    class SomeCog(Cog):
+        def __init__(self):
+            self.recent_messages = RecentMessages(size=10)
+
+        @message_handler(channels={Channels.some_channel}, allow_bots=True)
+        async def on_message(self, message):
+            self.recent_messages.add(message)
+
+        @Cog.listener()
+        async def on_raw_message_delete(self, payload):
+            self.recent_messages.remove(payload.channel_id, payload.message_id)
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._buffers: dict[int, deque[int]] = {}
+        # Mirrors the buffers, so membership checks don't need to scan them
+        self._members: dict[int, set[int]] = {}
+        self._seeded: set[int] = set()
+
+    def _buffer(self, channel_id: int) -> tuple[deque[int], set[int]]:
+        if channel_id not in self._buffers:
+            self._buffers[channel_id] = deque()
+            self._members[channel_id] = set()
+        return self._buffers[channel_id], self._members[channel_id]
+
+    def _push(self, channel_id: int, message_id: int) -> None:
+        buffer, members = self._buffer(channel_id)
+        if message_id in members:
+            return
+
+        if len(buffer) == self.size:
+            members.discard(buffer.popleft())
+        buffer.append(message_id)
+        members.add(message_id)
+
+    def add(self, message: discord.Message) -> None:
+        """Record `message` as the most recent message of its channel, evicting the oldest one if full."""
+        self._push(message.channel.id, message.id)
+
+    def remove(self, channel_id: int, message_id: int) -> None:
+        """Forget the message, if it's one of the most recent messages of the channel."""
+        members = self._members.get(channel_id)
+        if members is None or message_id not in members:
+            return
+
+        members.discard(message_id)
+        self._buffers[channel_id].remove(message_id)
+
+    def is_recent(self, channel_id: int, message_id: int) -> bool:
+        """Check whether the message is one of the most recent messages of the channel."""
+        return message_id in self._members.get(channel_id, ())
+
+    def get(self, channel_id: int) -> list[int]:
+        """Get the IDs of the most recent messages of the channel, from oldest to newest."""
+        return list(self._buffers.get(channel_id, ()))
+
+    async def seed(self, channel: discord.abc.Messageable) -> None:
+        """
+        Fill the channel's buffer with its latest messages, if it hasn't been seeded yet.
+
+        This only needs to be done once, for the messages sent before the buffer started being fed.
+        """
+        if channel.id in self._seeded:
+            return
+        self._seeded.add(channel.id)
+
+        log.trace(f"Seeding the recent messages of channel {channel.id} from its history.")
+        history = [message.id async for message in channel.history(limit=self.size)]
+
+        # Any messages fed while the history was being fetched are newer, so they go on top
+        newer = self.get(channel.id)
+        self._buffers.pop(channel.id, None)
+        self._members.pop(channel.id, None)
+        for message_id in [*reversed(history), *newer]:
+            self._push(channel.id, message_id)
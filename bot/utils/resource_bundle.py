@@ -0,0 +1,146 @@
+"""
+A single pre-parsed bundle of the static JSON and YAML files under `bot/resources`.
+
+Build it with `python bot/utils/resource_bundle.py`, which the Docker image does after copying the source.
+Without a bundle, or when a file changed since the bundle was built, the raw files are read instead,
+so there's no need to rebuild it during development.
+
+The entries are serialised with `marshal`, which is only readable by the Python version which wrote it,
+so the bundle records that version and is ignored by any other one.
+"""
+
+import functools
+import json
+import logging
+import marshal
+import mmap
+import struct
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import yaml
+from pydis_core.utils.logging import get_logger
+
+log = get_logger(__name__)
+
+RESOURCES_ROOT = Path(__file__).parents[1] / "resources"
+BUNDLE_PATH = RESOURCES_ROOT / "resources.bundle"
+
+MAGIC = b"SLRB"
+FORMAT_VERSION = 1
+# Magic, format version, major and minor version of Python, and the length of the table of contents
+HEADER = struct.Struct("<4sHBBQ")
+
+# The kinds of entries, by the suffix of the files they're built from
+# Plain text files aren't bundled, since there's nothing to save by not parsing them
+KINDS = {
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+}
+PARSERS: dict[str, Callable[[str], Any]] = {
+    "json": json.loads,
+    "yaml": yaml.safe_load,
+}
+
+
+class Entry(NamedTuple):
+    """The location of an entry in the bundle, and the size and modification time of the file it was built from."""
+
+    kind: str
+    offset: int
+    length: int
+    size: int
+    mtime_ns: int
+
+
+class ResourceBundle:
+    """A built bundle, memory-mapped so that only the entries which are used are ever read and decoded."""
+
+    def __init__(self, path: Path):
+        with path.open("rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, major, minor, toc_length = HEADER.unpack_from(self._data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} isn't a version {FORMAT_VERSION} resource bundle.")
+        if (major, minor) != sys.version_info[:2]:
+            raise ValueError(f"{path} was built by Python {major}.{minor}.")
+
+        # The bundle is built by us alongside the source, so it is as trusted as the code itself
+        toc = marshal.loads(self._data[HEADER.size:HEADER.size + toc_length])  # noqa: S302
+        self.entries = {key: Entry(*entry) for key, entry in toc.items()}
+        self._start = HEADER.size + toc_length
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, path: Path, kind: str) -> tuple[bool, Any]:
+        """
+        Get the parsed contents of the file at `path` as the given kind of entry.
+
+        The first item of the returned tuple is False if the bundle can't be used for the file,
+        either because it doesn't have an entry of that kind for it or because the file changed since.
+        """
+        try:
+            key = path.resolve().relative_to(RESOURCES_ROOT.resolve()).as_posix()
+        except ValueError:
+            return False, None
+
+        entry = self.entries.get(key)
+        if entry is None or entry.kind != kind:
+            return False, None
+
+        stat = path.stat()
+        if (stat.st_size, stat.st_mtime_ns) != (entry.size, entry.mtime_ns):
+            log.debug(f"Reading {key} from disk, since it changed after the resource bundle was built.")
+            return False, None
+
+        offset = self._start + entry.offset
+        return True, marshal.loads(self._data[offset:offset + entry.length])  # noqa: S302
+
+
+@functools.cache
+def get_bundle() -> ResourceBundle | None:
+    """Open the resource bundle the first time it's needed, or return None if there's no usable one."""
+    if not BUNDLE_PATH.exists():
+        return None
+
+    try:
+        bundle = ResourceBundle(BUNDLE_PATH)
+    except (ValueError, struct.error) as e:
+        log.warning(f"Ignoring the resource bundle, reading the raw files instead: {e}")
+        return None
+
+    log.debug(f"Opened the resource bundle with {len(bundle)} entries.")
+    return bundle
+
+
+def build(root: Path = RESOURCES_ROOT, output: Path = BUNDLE_PATH) -> None:
+    """Parse every static data file under `root`, and write them all to a bundle at `output`."""
+    toc = {}
+    chunks = []
+    offset = 0
+    for path in sorted(root.rglob("*")):
+        if (kind := KINDS.get(path.suffix)) is None or not path.is_file():
+            continue
+
+        data = marshal.dumps(PARSERS[kind](path.read_text("utf8")))
+        stat = path.stat()
+        toc[path.relative_to(root).as_posix()] = tuple(Entry(kind, offset, len(data), stat.st_size, stat.st_mtime_ns))
+        chunks.append(data)
+        offset += len(data)
+
+    toc_data = marshal.dumps(toc)
+    with output.open("wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, *sys.version_info[:2], len(toc_data)))
+        f.write(toc_data)
+        f.writelines(chunks)
+    log.info(f"Bundled {len(toc)} resources into {output} ({output.stat().st_size} bytes).")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    build()
@@ -0,0 +1,172 @@
+import asyncio
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+from weakref import WeakSet
+
+from PIL import Image
+from pydis_core.utils.logging import get_logger
+
+from bot.utils.resource_bundle import PARSERS, get_bundle
+
+log = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def _read(path: Path, kind: str) -> Any:
+    """Get the parsed contents of the file at `path` from the resource bundle if possible, or parse the file."""
+    if (bundle := get_bundle()) is not None:
+        found, value = bundle.get(path, kind)
+        if found:
+            return value
+    return PARSERS[kind](path.read_text("utf8"))
+
+
+def read_json(path: Path) -> Any:
+    """Parse the JSON file at `path`."""
+    return _read(path, "json")
+
+
+def read_yaml(path: Path) -> Any:
+    """Parse the YAML file at `path`."""
+    return _read(path, "yaml")
+
+
+def read_text(path: Path) -> str:
+    """Read the text file at `path`."""
+    return path.read_text("utf8")
+
+
+def read_image(path: Path) -> Image.Image:
+    """Open and decode the image at `path`, so it doesn't get decoded on first use instead."""
+    image = Image.open(path)
+    image.load()
+    return image
+
+
+def _size(path: Path) -> int:
+    """Get the size in bytes of the file at `path`, or of all the files in it if it's a directory."""
+    if path.is_dir():
+        return sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
+    return path.stat().st_size
+
+
+# Resources of unloaded extensions are dropped along with their modules
+_registry: WeakSet["Resource"] = WeakSet()
+
+
+@dataclass
+class ResourceStats:
+    """How long a resource took to load, and how large its file is."""
+
+    path: Path
+    load_time: float
+    size: int
+
+
+class Resource(Generic[T]):
+    """
+    A file in the resources directory, which is only loaded the first time it is needed.
+
+    Calling the resource returns its contents, loading and memoizing them on the first call.
+    `loader` reads the file, and defaults to parsing it as JSON. `parse` can further process the loaded data,
+    so the processed version is what gets memoized:
+
+    FACTS = Resource("bot/resources/holidays/halloween/halloween_facts.json")
+
+    @commands.command()
+    async def spookyfact(self, ctx):
+        await ctx.send(random.choice(FACTS()))
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        loader: Callable[[Path], Any] = read_json,
+        *,
+        parse: Callable[[Any], T] | None = None,
+    ):
+        self.path = Path(path)
+        self.loader = loader
+        self.parse = parse
+
+        self._value: T | None = None
+        self._loaded = False
+        self.stats: ResourceStats | None = None
+
+        _registry.add(self)
+
+    def __repr__(self) -> str:
+        return f"<Resource path={self.path} loaded={self._loaded}>"
+
+    def __call__(self) -> T:
+        """Get the contents of the resource, loading them if they haven't been loaded yet."""
+        if not self._loaded:
+            self.load()
+        return self._value
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the resource has been loaded yet."""
+        return self._loaded
+
+    def load(self) -> T:
+        """Load the resource, even if it was already loaded, and return its contents."""
+        start = time.perf_counter()
+        value = self.loader(self.path)
+        if self.parse is not None:
+            value = self.parse(value)
+
+        self._value, self._loaded = value, True
+        self.stats = ResourceStats(self.path, time.perf_counter() - start, _size(self.path))
+        log.trace(f"Loaded {self.path} ({self.stats.size} bytes) in {self.stats.load_time * 1000:.2f}ms.")
+        return value
+
+    def unload(self) -> None:
+        """Forget the contents of the resource, so they're loaded again on the next call."""
+        self._value, self._loaded = None, False
+
+
+def get_resources() -> list[Resource]:
+    """Get every resource which has been declared."""
+    return list(_registry)
+
+
+async def warm_up(resources: Iterable[Resource] | None = None) -> None:
+    """
+    Load the given resources, or every declared resource, in a thread if they aren't loaded yet.
+
+    Cogs can use this in `cog_load` for resources they'll always need, so the first command doesn't pay for them.
+    """
+    if resources is None:
+        resources = list(_registry)
+    resources = [resource for resource in resources if not resource.loaded]
+    if not resources:
+        return
+
+    start = time.perf_counter()
+    for resource in resources:
+        await asyncio.to_thread(resource)
+    log.debug(f"Warmed up {len(resources)} resources in {(time.perf_counter() - start) * 1000:.2f}ms.")
+
+
+def log_report() -> None:
+    """Log the load time and size of every resource which has been loaded so far, slowest first."""
+    loaded = sorted(
+        (resource.stats for resource in get_resources() if resource.stats is not None),
+        key=lambda stats: stats.load_time,
+        reverse=True,
+    )
+    if not loaded:
+        return
+
+    width = max(len(str(stats.path)) for stats in loaded)
+    lines = [f"{'Resource':<{width}} {'Load time':>10} {'Size':>10}"]
+    lines.extend(f"{stats.path!s:<{width}} {stats.load_time * 1000:>8.2f}ms {stats.size:>10}" for stats in loaded)
+    log.debug(
+        f"Loaded {len(loaded)} of {len(_registry)} resources, {sum(stats.size for stats in loaded)} bytes "
+        f"in {sum(stats.load_time for stats in loaded) * 1000:.2f}ms.\n" + "\n".join(lines)
+    )
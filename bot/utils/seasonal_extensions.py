@@ -0,0 +1,177 @@
+import inspect
+import types
+from collections.abc import Collection
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import discord
+from discord.ext import commands
+from pydis_core.utils.logging import get_logger
+
+from bot.constants import Month
+from bot.utils import human_months, resolve_current_month
+from bot.utils.decorators import MONTHS_ATTRIBUTE
+from bot.utils.message_router import MESSAGE_HANDLER_ATTRIBUTE
+
+if TYPE_CHECKING:
+    from bot.bot import Bot
+
+log = get_logger(__name__)
+
+# Extensions can set this module attribute to the months they should be loaded in, instead of having them derived
+ACTIVE_MONTHS_ATTRIBUTE = "ACTIVE_MONTHS"
+
+
+def _command_months(command: commands.Command) -> frozenset[Month] | None:
+    """Get the months `command` is locked to by `in_month`, including through its parents."""
+    while command is not None:
+        for check in command.checks:
+            if months := getattr(check, MONTHS_ATTRIBUTE, None):
+                return frozenset(months)
+        command = command.parent
+    return None
+
+
+def _cog_months(cog: type[commands.Cog]) -> frozenset[Month] | None:
+    """
+    Get the months in which anything in `cog` is active, or None if some of it is active all year.
+
+    Everything that can be triggered by users has to be locked to some months, which are those of the commands
+    and listeners locked with `in_month`, and of the message handlers registered with months.
+    """
+    if cog.__cog_app_commands__:
+        return None
+
+    months = set()
+    task_months = set()
+    for command in cog.__cog_commands__:
+        if (command_months := _command_months(command)) is None:
+            return None
+        months |= command_months
+
+    for _, method_name in cog.__cog_listeners__:
+        if not (listener_months := getattr(getattr(cog, method_name), MONTHS_ATTRIBUTE, None)):
+            return None
+        months |= set(listener_months)
+
+    for member in vars(cog).values():
+        if message_filter := getattr(member, MESSAGE_HANDLER_ATTRIBUTE, None):
+            if not message_filter.months:
+                return None
+            months |= set(message_filter.months)
+        elif seasonal_task_months := getattr(member, MONTHS_ATTRIBUTE, None):
+            task_months |= set(seasonal_task_months)
+
+    # Seasonal tasks only extend the season of what users can trigger, they don't make a cog seasonal on their own
+    if not months:
+        return None
+    return frozenset(months | task_months)
+
+
+def _module_cogs(module: types.ModuleType) -> list[type[commands.Cog]]:
+    """Get the cogs defined in `module`, ignoring those it imports."""
+    return [
+        member for member in vars(module).values()
+        if inspect.isclass(member) and issubclass(member, commands.Cog) and member.__module__ == module.__name__
+    ]
+
+
+def get_active_months(module: types.ModuleType) -> frozenset[Month] | None:
+    """
+    Get the months in which the extension `module` should be loaded, or None if it should always be loaded.
+
+    These are the module's `ACTIVE_MONTHS` if it declares them, otherwise they're derived from its cogs.
+    The extension is only seasonal if every cog it defines is.
+    """
+    if (declared := getattr(module, ACTIVE_MONTHS_ATTRIBUTE, None)) is not None:
+        return frozenset(declared)
+
+    cogs = _module_cogs(module)
+    if not cogs:
+        return None
+
+    months = set()
+    for cog in cogs:
+        if (cog_months := _cog_months(cog)) is None:
+            return None
+        months |= cog_months
+    return frozenset(months)
+
+
+def _next_month_start(now: datetime) -> datetime:
+    """Get the start of the month after the one `now` is in."""
+    if now.month == 12:
+        return datetime(now.year + 1, 1, 1, tzinfo=UTC)
+    return datetime(now.year, now.month + 1, 1, tzinfo=UTC)
+
+
+class SeasonalExtensions:
+    """
+    Keeps seasonal extensions loaded only during the months they're active in.
+
+    Out of season, a seasonal extension's commands, listeners and message handlers would all return early anyway,
+    so unloading it means fewer listeners to dispatch to and less memory used. The extensions are checked
+    against `resolve_current_month`, so `Client.month_override` is respected.
+    """
+
+    def __init__(self, bot: "Bot"):
+        self.bot = bot
+        # Extension name -> months it's active in, only for the seasonal extensions
+        self.seasons: dict[str, frozenset[Month]] = {}
+        # Lower-cased names and aliases of top-level commands -> name of the seasonal extension defining them,
+        # since the bot's commands are case-insensitive
+        self.commands: dict[str, str] = {}
+
+    def register(self, module: types.ModuleType) -> None:
+        """Record the months the extension `module` is active in, if it's a seasonal extension."""
+        if not (months := get_active_months(module)):
+            return
+
+        self.seasons[module.__name__] = months
+        for cog in _module_cogs(module):
+            for command in cog.__cog_commands__:
+                if command.parent is None:
+                    for name in (command.name, *command.aliases, *getattr(command, "root_aliases", ())):
+                        self.commands[name.casefold()] = module.__name__
+        log.debug(f"{module.__name__} is a seasonal extension, active in {human_months(sorted(months))}.")
+
+    def in_season(self, extension: str, month: Month | None = None) -> bool:
+        """Whether `extension` should be loaded in `month`, which defaults to the current month."""
+        if extension not in self.seasons:
+            return True
+        return (month or resolve_current_month()) in self.seasons[extension]
+
+    def dormant_command_months(self, name: str) -> Collection[Month] | None:
+        """
+        Get the months of the seasonal extension defining the command `name`, if it's unloaded out of season.
+
+        This lets an error be given when the command is used out of season, instead of it being treated as unknown.
+        """
+        extension = self.commands.get(name.casefold())
+        if extension is None or extension in self.bot.extensions:
+            return None
+        return sorted(self.seasons[extension])
+
+    async def sync(self) -> None:
+        """Load the seasonal extensions which came into season, and unload those which went out of it."""
+        month = resolve_current_month()
+        for extension in self.seasons:
+            loaded = extension in self.bot.extensions
+            if self.in_season(extension, month) == loaded:
+                continue
+
+            try:
+                if loaded:
+                    log.info(f"Unloading {extension}, since it isn't active in {month!s}.")
+                    await self.bot.unload_extension(extension)
+                else:
+                    log.info(f"Loading {extension}, since it's active in {month!s}.")
+                    await self.bot.load_extension(extension)
+            except commands.ExtensionError:
+                log.exception(f"Failed to {'unload' if loaded else 'load'} seasonal extension {extension}.")
+
+    async def run(self) -> None:
+        """Sync the seasonal extensions at the start of every month."""
+        while True:
+            await discord.utils.sleep_until(_next_month_start(datetime.now(tz=UTC)))
+            await self.sync()